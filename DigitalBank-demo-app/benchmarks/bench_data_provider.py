@@ -0,0 +1,110 @@
+"""Collection benchmark for DataProvider on a large generated dataset.
+
+Compares streaming case references against eagerly loading every record,
+reporting wall time and peak Python memory. With ``--pytest`` it also
+times ``pytest --collect-only`` on a generated test module.
+
+Run from the project root:
+    python -m benchmarks.bench_data_provider [--rows 100000] [--pytest]
+"""
+
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from utilities.data_provider import DataProvider
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEST_MODULE = '''
+import pytest
+
+@pytest.mark.data_source({path!r}, where="expected == 'error'", id_fields=["amount"])
+def test_case(data_case):
+    pass
+'''
+
+
+def _write_dataset(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["account", "amount", "description", "expected"])
+        for index in range(rows):
+            writer.writerow([
+                "Individual Savings - 1000393.0",
+                str(index),
+                f"Transfer number {index} " + "x" * 64,
+                "error" if index % 2 else "success",
+            ])
+
+
+def _measure(label, func):
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+
+    # Memory is measured in a separate pass; tracemalloc slows execution
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {count:>8} cases {elapsed * 1000:9.1f} ms  peak {peak / 1_048_576:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--pytest", action="store_true",
+                        help="Also time pytest --collect-only on the dataset")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        dataset = os.path.join(workdir, "transfers.csv")
+        _write_dataset(dataset, args.rows)
+
+        def eager():
+            with open(dataset, newline="", encoding="utf-8") as handle:
+                records = [row for row in csv.DictReader(handle) if row["expected"] == "error"]
+            return len(records)
+
+        def streamed_count():
+            return sum(1 for _ in DataProvider(dataset, where="expected == 'error'").records())
+
+        def streamed_cases():
+            cases = list(DataProvider(dataset, where="expected == 'error'",
+                                      id_fields=["amount"]).cases())
+            return len(cases)
+
+        def sampled_cases():
+            return len(list(DataProvider(dataset, where="expected == 'error'",
+                                         sample=0.1).cases()))
+
+        _measure("eager load (list of dicts)", eager)
+        _measure("streamed records (count only)", streamed_count)
+        _measure("streamed case references", streamed_cases)
+        _measure("streamed, 10% sample", sampled_cases)
+
+        if args.pytest:
+            module = os.path.join(workdir, "test_generated.py")
+            with open(module, "w", encoding="utf-8") as handle:
+                handle.write(TEST_MODULE.format(path=dataset))
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "pytest", "--collect-only", "-q",
+                 "-p", "no:cacheprovider", "--rootdir", PROJECT_ROOT,
+                 "-c", os.path.join(PROJECT_ROOT, "pytest.ini"),
+                 "--confcutdir", PROJECT_ROOT,
+                 "-p", "tests.conftest", module],
+                cwd=PROJECT_ROOT, capture_output=True, check=False,
+            )
+            print(f"{'pytest --collect-only':<34} {'':>8}       "
+                  f"{(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""App launch-time benchmark: cold and warm launches on one device session.
+
+Each launch is timed until the login screen's signature element is
+visible. Results are printed with 95% confidence intervals, appended to
+the launch history and compared with the previous run on the same device.
+
+Run from the project root with an Appium server and device available:
+    python -m benchmarks.bench_launch [--runs 10] [--warmup 2]
+        [--outliers iqr|mad|none] [--modes cold warm] [--no-save]
+"""
+
+import argparse
+import sys
+
+from config.config import Config
+from pages.login_page import LoginPage
+from utilities.driver_factory import DriverFactory
+from utilities.launch_benchmark import LaunchBenchmark, LaunchHistory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=Config.LAUNCH_BENCH_RUNS)
+    parser.add_argument("--warmup", type=int, default=Config.LAUNCH_BENCH_WARMUP)
+    parser.add_argument("--outliers", choices=("iqr", "mad", "none"), default=Config.LAUNCH_BENCH_OUTLIERS)
+    parser.add_argument("--modes", nargs="+", choices=LaunchBenchmark.MODES, default=list(LaunchBenchmark.MODES))
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the launch history")
+    args = parser.parse_args()
+
+    driver = DriverFactory.create_driver()
+    try:
+        locator = LoginPage(driver).locators["login_button"]
+        benchmark = LaunchBenchmark(driver, locator, runs=args.runs, warmup=args.warmup,
+                                    outliers=args.outliers)
+        results = benchmark.run(tuple(args.modes))
+    finally:
+        DriverFactory.quit_driver(driver)
+
+    for mode, stats in results.items():
+        print(f"{mode:<5} launch  mean {stats.mean * 1000:7.0f} ms  "
+              f"95% CI [{stats.ci_low * 1000:.0f}, {stats.ci_high * 1000:.0f}]  "
+              f"median {stats.median * 1000:.0f}  stdev {stats.stdev * 1000:.0f}  "
+              f"n={len(stats.samples)} rejected={len(stats.rejected)}")
+
+    history = LaunchHistory()
+    device = Config.ANDROID_DEVICE_NAME if Config.is_android() else Config.IOS_DEVICE_NAME
+    previous = history.previous(Config.PLATFORM, device)
+    regressed = False
+    if previous is not None:
+        for mode, change, regression in history.compare(results, previous):
+            regressed = regressed or regression
+            print(f"{'REGRESSION ' if regression else ''}{mode} launch {change:+.1%} "
+                  f"vs {previous['timestamp']} (build {previous.get('build') or 'unknown'})")
+    if not args.no_save:
+        history.append(results, Config.PLATFORM, device, build=Config.APP_BUILD)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
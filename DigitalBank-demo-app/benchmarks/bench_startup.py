@@ -0,0 +1,102 @@
+"""Startup benchmark: framework import time and pytest collection time.
+
+Each measurement runs in a fresh interpreter so module caches do not hide
+regressions. Results are printed and can be saved as JSON and compared
+against a previous run.
+
+Run from the project root:
+    python -m benchmarks.bench_startup [--runs 5] [--save out.json]
+        [--baseline previous.json --max-regression 0.25]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+FRAMEWORK_MODULES = [
+    "tests.conftest",
+    "pages.base_page",
+    "pages.login_page",
+    "pages.registration_page",
+    "pages.transfer_page",
+    "pages.welcome_page",
+    "utilities.driver_factory",
+    "utilities.mobile_actions",
+    "utilities.mobile_gestures",
+]
+
+HEAVY_PACKAGES = ("appium", "selenium", "numpy", "PIL")
+
+
+def _timed_run(command):
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode not in (0, 5):  # 5 = no tests collected
+        raise RuntimeError(f"{' '.join(command)} failed:\n{result.stderr}")
+    return elapsed, result.stdout
+
+
+def measure_imports(runs):
+    """Median wall time of importing all framework modules, plus heavy modules loaded."""
+    script = (
+        "import sys\n"
+        f"for name in {FRAMEWORK_MODULES!r}: __import__(name)\n"
+        f"print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_PACKAGES!r}))))"
+    )
+    baseline_script = "import pytest"
+    samples, loaded = [], ""
+    for _ in range(runs):
+        base, _ = _timed_run([sys.executable, "-c", baseline_script])
+        elapsed, loaded = _timed_run([sys.executable, "-c", f"import pytest\n{script}"])
+        samples.append(elapsed - base)
+    return statistics.median(samples), loaded.strip()
+
+
+def measure_collection(runs):
+    """Median wall time of ``pytest --collect-only``."""
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"]
+    return statistics.median(_timed_run(command)[0] for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a saved JSON result")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed relative slowdown versus the baseline")
+    args = parser.parse_args()
+
+    import_time, loaded = measure_imports(args.runs)
+    results = {
+        "import_seconds": import_time,
+        "collect_seconds": measure_collection(args.runs),
+        "heavy_modules_at_import": loaded.split(",") if loaded else [],
+    }
+    print(f"framework import time   {results['import_seconds'] * 1000:8.1f} ms")
+    print(f"pytest --collect-only   {results['collect_seconds'] * 1000:8.1f} ms")
+    print(f"heavy modules imported  {results['heavy_modules_at_import'] or 'none'}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressed = [
+            key for key in ("import_seconds", "collect_seconds")
+            if results[key] > baseline[key] * (1 + args.max_regression)
+        ]
+        for key in regressed:
+            print(f"REGRESSION {key}: {baseline[key]:.3f}s -> {results[key]:.3f}s")
+        if regressed or results["heavy_modules_at_import"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
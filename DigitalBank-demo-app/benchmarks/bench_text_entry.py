@@ -0,0 +1,58 @@
+"""Text entry benchmark: keyboard-free replace vs typing on a device session.
+
+Enters the same text into the login screen's email field with each method
+in turn (see ``TextEntry.benchmark``) and prints the latency percentiles
+of both, plus the speed-up of the current fast path over typing. Android
+only: iOS has just the typed path.
+
+Run from the project root with an Appium server and device available:
+    python -m benchmarks.bench_text_entry [--runs 20] [--text john@example.com]
+        [--save out.json]
+"""
+
+import argparse
+import json
+
+from config.config import Config
+from pages.login_page import LoginPage
+from utilities.driver_factory import DriverFactory
+from utilities.text_entry import TextEntry
+
+
+def _ms(microseconds):
+    return f"{microseconds / 1000:9.1f}" if microseconds is not None else "      n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Entries per method")
+    parser.add_argument("--text", default="john@example.com")
+    parser.add_argument("--save", help="Write the histograms to this JSON file")
+    args = parser.parse_args()
+    if not Config.is_android():
+        parser.error("XCUITest has no keyboard-free setter; iOS always types, so there is nothing to compare")
+
+    driver = DriverFactory.create_driver()
+    try:
+        page = LoginPage(driver)
+        field = page.healer.find_element(page.locators["email"], "email")
+        results = TextEntry(driver, page="bench").benchmark(field, args.text, runs=args.runs)
+    finally:
+        DriverFactory.quit_driver(driver)
+
+    print(f"{args.runs} entries of {len(args.text)} characters per method on {Config.PLATFORM}")
+    print("\n  method     p50 ms     p95 ms     max ms")
+    for method, histogram in results.items():
+        print(f"  {method:<8} {_ms(histogram.percentile(50))}  {_ms(histogram.percentile(95))}  "
+              f"{_ms(histogram.max)}")
+    typed, replaced = results["typed"].percentile(50), results["replace"].percentile(50)
+    if typed and replaced:
+        print(f"\nreplace is {typed / replaced:.1f}x faster than typing at p50")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump({method: histogram.to_dict() for method, histogram in results.items()}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Transfer load benchmark: sustained TransferPage transactions on device sessions.
+
+Drives select_account -> enter_amount -> enter_description -> select_credit
+-> submit_transaction in a loop, going back to the transfer form after each
+transaction, then prints the latency percentile distribution, throughput,
+error rate and per-interval results. Warm-up transactions are excluded.
+
+Run from the project root with an Appium server and device(s) available:
+    python -m benchmarks.bench_transfer_load [--sessions 1]
+        [--mode closed|fixed] [--rate 0.5] [--duration 300] [--warmup 30]
+        [--interval 10] [--save out.json]
+"""
+
+import argparse
+import json
+
+from config.config import Config
+from pages.transfer_page import TransferPage
+from utilities.data_provider import DataProvider
+from utilities.driver_factory import DriverFactory
+from utilities.transfer_load import TransferLoad
+
+
+def _ms(microseconds):
+    return f"{microseconds / 1000:9.1f}" if microseconds is not None else "      n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1,
+                        help="Parallel device sessions (each needs its own device)")
+    parser.add_argument("--mode", choices=TransferLoad.MODES, default="closed")
+    parser.add_argument("--rate", type=float, help="Transactions per second in fixed mode")
+    parser.add_argument("--duration", type=float, default=Config.LOAD_DURATION)
+    parser.add_argument("--warmup", type=float, default=Config.LOAD_WARMUP)
+    parser.add_argument("--interval", type=float, default=Config.LOAD_INTERVAL)
+    parser.add_argument("--save", help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    cases = list(DataProvider("transfer_cases.csv", where="expected == 'success'").records())
+    drivers = [DriverFactory.create_driver() for _ in range(args.sessions)]
+    try:
+        load = TransferLoad([TransferPage(driver) for driver in drivers], cases, mode=args.mode,
+                            rate=args.rate, duration=args.duration, warmup=args.warmup,
+                            interval=args.interval, reset=TransferPage.return_to_form)
+        report = load.run()
+    finally:
+        for driver in drivers:
+            DriverFactory.quit_driver(driver)
+
+    print(f"{report.mode} load, {report.sessions} session(s), {report.seconds:.0f}s measured")
+    print(f"transactions {report.transactions}  errors {report.errors} "
+          f"({report.error_rate:.1%})  throughput {report.throughput:.2f}/s")
+    print("\n  percentile   latency ms")
+    for percentile, value in report.histogram.percentiles().items():
+        print(f"  {percentile:10.2f} {_ms(value)}")
+    print("\n   start    tx  err   tx/s     p50 ms     p99 ms     max ms")
+    for interval in report.intervals:
+        print(f"  {interval.start:6.0f} {interval.transactions:5d} {interval.errors:4d} "
+              f"{interval.throughput:6.2f} {_ms(interval.p50)}  {_ms(interval.p99)}  {_ms(interval.max)}")
+
+    if args.save:
+        result = report._asdict()
+        result["histogram"] = report.histogram.to_dict()
+        result["intervals"] = [interval._asdict() for interval in report.intervals]
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Throughput benchmark for VisualComparator on full-resolution frames.
+
+Run from the project root:
+    python -m benchmarks.bench_visual_compare [--frames 200] [--width 1080] [--height 2400]
+"""
+
+import argparse
+import io
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from utilities.visual_compare import VisualComparator
+
+
+def _make_frame(rng, width, height):
+    frame = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(frame).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _report(label, frames, elapsed):
+    per_frame_ms = elapsed / frames * 1000
+    print(f"{label:<32} {per_frame_ms:8.2f} ms/frame {frames / elapsed:10.1f} frames/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--width", type=int, default=1080)
+    parser.add_argument("--height", type=int, default=2400)
+    parser.add_argument("--downscale", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as golden_dir:
+        comparator = VisualComparator(golden_dir=golden_dir, downscale=args.downscale)
+        golden_png = _make_frame(rng, args.width, args.height)
+        comparator.compare(golden_png, "bench")
+
+        # Warm the golden cache so the timed loops measure steady state
+        comparator.compare(golden_png, "bench")
+
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            comparator.compare(golden_png, "bench")
+        _report("decode + compare (PNG bytes)", args.frames, time.perf_counter() - start)
+
+        decoded = comparator._to_luminance(golden_png)
+        start = time.perf_counter()
+        comparator.compare_many((decoded, "bench") for _ in range(args.frames))
+        _report("compare only (decoded frames)", args.frames, time.perf_counter() - start)
+
+        full_size = VisualComparator(golden_dir=golden_dir, downscale=1)
+        full_decoded = full_size._to_luminance(golden_png)
+        start = time.perf_counter()
+        full_size.compare_many((full_decoded, "bench") for _ in range(args.frames))
+        _report("compare only (no downscale)", args.frames, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
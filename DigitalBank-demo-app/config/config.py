@@ -79,6 +79,14 @@ class Config:
     TEST_USERNAME = os.getenv("TEST_USERNAME", "john.doe@digitalbank.com")
     TEST_PASSWORD = os.getenv("TEST_PASSWORD", "Test@1234")
 
+    # Data-driven cases (utilities/data_provider.py)
+    DATA_DIR = os.getenv("DATA_DIR", "data")
+    DATA_SAMPLE_RATE = float(os.getenv("DATA_SAMPLE_RATE", "1.0"))
+
+    # Combinatorial cases (utilities/combinatorial.py); per-case device time
+    # used to estimate the minutes saved against the exhaustive product
+    DEVICE_MINUTES_PER_CASE = float(os.getenv("DEVICE_MINUTES_PER_CASE", "1.5"))
+
     # Device Configuration for perfecto
     PERFECTO_ANDROID_DEVICE_NAME = os.getenv("ANDROID_DEVICE_NAME", "AndroidDevice1")
     PERFECTO_ANDROID_PLATFORM_VERSION = os.getenv("ANDROID_PLATFORM_VERSION", "13.0")
@@ -96,6 +104,188 @@ class Config:
     REPORTS_DIR = "reports"
     LOGS_DIR = "logs"
     SCREENSHOTS_DIR = os.path.join(REPORTS_DIR, "screenshots")
+    ARTIFACTS_DIR = os.path.join(REPORTS_DIR, "artifacts")
+    EVENTS_DIR = os.path.join(REPORTS_DIR, "events")
+    TRACES_DIR = os.path.join(REPORTS_DIR, "traces")
+
+    # Retention enforced at session start for artifacts and compressed logs
+    ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_MB", "500")) * 1024 * 1024
+    ARTIFACT_MAX_AGE_DAYS = float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "7"))
+
+    # Structured JSONL event stream (utilities/events.py)
+    EVENTS_ENABLED = os.getenv("EVENTS_ENABLED", "true").lower() == "true"
+    EVENTS_BUFFER_SIZE = int(os.getenv("EVENTS_BUFFER_SIZE", "256"))
+
+    # Span tracing exported as a Chrome trace (utilities/tracing.py)
+    TRACE_ENABLED = os.getenv("TRACE_ENABLED", "false").lower() == "true"
+    TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+
+    # Failure evidence bundles (utilities/failure_evidence.py); all captures
+    # of one failure share EVIDENCE_TIMEOUT seconds
+    EVIDENCE_TIMEOUT = float(os.getenv("EVIDENCE_TIMEOUT", "5"))
+    EVIDENCE_LOG_LINES = int(os.getenv("EVIDENCE_LOG_LINES", "500"))
+    EVIDENCE_WORKERS = int(os.getenv("EVIDENCE_WORKERS", "8"))
+
+    # Background device-log ring buffer per session (utilities/device_log.py)
+    DEVICE_LOG_ENABLED = os.getenv("DEVICE_LOG_ENABLED", "true").lower() == "true"
+    DEVICE_LOG_BUFFER_BYTES = int(float(os.getenv("DEVICE_LOG_BUFFER_MB", "4")) * 1024 * 1024)
+    DEVICE_LOG_POLL_INTERVAL = float(os.getenv("DEVICE_LOG_POLL_INTERVAL", "2"))
+
+    # =========================================================
+    # 🔹 Incremental Result Cache (utilities/result_cache.py)
+    # =========================================================
+    # App build under test (package/bundle version); the cache is disabled
+    # when it is not set because an app change could not be detected
+    APP_BUILD = os.getenv("APP_BUILD", "")
+    RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", os.path.join(REPORTS_DIR, "result_cache.json"))
+    RESULT_CACHE_MAX_AGE_HOURS = float(os.getenv("RESULT_CACHE_MAX_AGE_HOURS", "72"))
+    # Run every test regardless of cached passes (results are still recorded)
+    RESULT_CACHE_FORCE = os.getenv("RESULT_CACHE_FORCE", "false").lower() == "true"
+
+    # =========================================================
+    # 🔹 Flakiness Tracking (utilities/flakiness.py)
+    # =========================================================
+    FLAKE_HISTORY_PATH = os.getenv("FLAKE_HISTORY_PATH", os.path.join(REPORTS_DIR, "flake_history.json"))
+    FLAKE_HISTORY_WINDOW = int(os.getenv("FLAKE_HISTORY_WINDOW", "50"))
+    FLAKE_MIN_RUNS = int(os.getenv("FLAKE_MIN_RUNS", "5"))
+    # Failure-transition rate at which a failed test is rerun in-session
+    FLAKE_RERUN_THRESHOLD = float(os.getenv("FLAKE_RERUN_THRESHOLD", "0.05"))
+    FLAKE_MAX_RERUNS = int(os.getenv("FLAKE_MAX_RERUNS", "2"))
+    FLAKE_RERUN_BUDGET = int(os.getenv("FLAKE_RERUN_BUDGET", "5"))
+
+    # =========================================================
+    # 🔹 App Performance Telemetry (utilities/performance.py)
+    # =========================================================
+    PERF_ENABLED = os.getenv("PERF_ENABLED", "true").lower() == "true"
+    PERF_SAMPLE_INTERVAL = float(os.getenv("PERF_SAMPLE_INTERVAL", "1"))
+    # Per-flow peak baselines, kept under version control like the goldens
+    PERF_BASELINE_PATH = os.getenv("PERF_BASELINE_PATH", os.path.join("baselines", "performance.json"))
+    # Allowed increase of a flow's memory/CPU peak over its baseline
+    PERF_REGRESSION_THRESHOLD = float(os.getenv("PERF_REGRESSION_THRESHOLD", "0.2"))
+    PERF_UPDATE_BASELINES = os.getenv("PERF_UPDATE_BASELINES", "false").lower() == "true"
+    PERF_FAIL_ON_REGRESSION = os.getenv("PERF_FAIL_ON_REGRESSION", "false").lower() == "true"
+
+    # =========================================================
+    # 🔹 Launch-Time Benchmark (utilities/launch_benchmark.py)
+    # =========================================================
+    LAUNCH_BENCH_RUNS = int(os.getenv("LAUNCH_BENCH_RUNS", "10"))
+    LAUNCH_BENCH_WARMUP = int(os.getenv("LAUNCH_BENCH_WARMUP", "2"))
+    # Outlier rejection: "iqr", "mad" or "none"
+    LAUNCH_BENCH_OUTLIERS = os.getenv("LAUNCH_BENCH_OUTLIERS", "iqr")
+    LAUNCH_BENCH_TIMEOUT = float(os.getenv("LAUNCH_BENCH_TIMEOUT", "30"))
+    LAUNCH_HISTORY_PATH = os.getenv("LAUNCH_HISTORY_PATH", os.path.join("baselines", "launch_history.jsonl"))
+    # Relative mean increase (with non-overlapping CIs) reported as a regression
+    LAUNCH_BENCH_REGRESSION = float(os.getenv("LAUNCH_BENCH_REGRESSION", "0.1"))
+
+    # =========================================================
+    # 🔹 Transfer Load Mode (utilities/transfer_load.py)
+    # =========================================================
+    LOAD_DURATION = float(os.getenv("LOAD_DURATION", "300"))
+    LOAD_WARMUP = float(os.getenv("LOAD_WARMUP", "30"))
+    LOAD_INTERVAL = float(os.getenv("LOAD_INTERVAL", "10"))
+    # Seconds to wait for the transfer form when returning to it between transactions
+    LOAD_RESET_TIMEOUT = float(os.getenv("LOAD_RESET_TIMEOUT", "3"))
+
+    # =========================================================
+    # 🔹 Self-Healing Locators (utilities/self_healing.py)
+    # =========================================================
+    SELF_HEALING_ENABLED = os.getenv("SELF_HEALING_ENABLED", "true").lower() == "true"
+    HEALING_CACHE_PATH = os.getenv("HEALING_CACHE_PATH", os.path.join(REPORTS_DIR, "healing_cache.json"))
+    # Healed locators not used for this long are forgotten
+    HEALING_CACHE_TTL_HOURS = float(os.getenv("HEALING_CACHE_TTL_HOURS", "168"))
+
+    # =========================================================
+    # 🔹 Visual Comparison Configuration
+    # =========================================================
+    GOLDEN_IMAGES_DIR = os.getenv("GOLDEN_IMAGES_DIR", "goldens")
+    UPDATE_GOLDENS = os.getenv("UPDATE_GOLDENS", "false").lower() == "true"
+    VISUAL_DOWNSCALE = int(os.getenv("VISUAL_DOWNSCALE", "4"))
+    VISUAL_PIXEL_THRESHOLD = int(os.getenv("VISUAL_PIXEL_THRESHOLD", "24"))
+    VISUAL_TOLERANCE = float(os.getenv("VISUAL_TOLERANCE", "0.002"))
+    VISUAL_GOLDEN_CACHE_SIZE = int(os.getenv("VISUAL_GOLDEN_CACHE_SIZE", "32"))
+
+    # =========================================================
+    # 🔹 Offline Locator Validation (utilities/locator_validation.py)
+    # =========================================================
+    # Captured page sources, one directory per platform
+    PAGE_SOURCE_FIXTURES_DIR = os.getenv(
+        "PAGE_SOURCE_FIXTURES_DIR", os.path.join("tests", "fixtures", "page_sources")
+    )
+
+    # =========================================================
+    # 🔹 Change-Based Test Selection (utilities/test_selection.py)
+    # =========================================================
+    # Page methods each test called in a recorded run (from the event log)
+    TEST_MAP_PATH = os.getenv("TEST_MAP_PATH", os.path.join("baselines", "test_map.json"))
+
+    # =========================================================
+    # 🔹 Local Appium Server Pool (utilities/appium_servers.py)
+    # =========================================================
+    # Servers in the pool; under xdist the controller starts them and pins
+    # each worker to one, so match the worker count. 0 keeps using
+    # LOCAL_APPIUM_SERVER_URL
+    APPIUM_POOL_SIZE = int(os.getenv("APPIUM_POOL_SIZE", "0"))
+    APPIUM_EXECUTABLE = os.getenv("APPIUM_EXECUTABLE", "appium")
+    APPIUM_HOST = os.getenv("APPIUM_HOST", "127.0.0.1")
+    APPIUM_BASE_PATH = os.getenv("APPIUM_BASE_PATH", "/wd/hub")
+    APPIUM_STARTUP_TIMEOUT = float(os.getenv("APPIUM_STARTUP_TIMEOUT", "60"))
+    APPIUM_HEALTH_INTERVAL = float(os.getenv("APPIUM_HEALTH_INTERVAL", "10"))
+    APPIUM_MAX_RESTARTS = int(os.getenv("APPIUM_MAX_RESTARTS", "3"))
+
+    # =========================================================
+    # 🔹 Cloud Session Governor (utilities/cloud_governor.py)
+    # =========================================================
+    CLOUD_GOVERNOR_ENABLED = os.getenv("CLOUD_GOVERNOR_ENABLED", "true").lower() == "true"
+    # Concurrent sessions per pytest process (split the plan's limit across xdist workers)
+    CLOUD_MAX_SESSIONS = int(os.getenv("CLOUD_MAX_SESSIONS", "2"))
+    # Session creations per second, and how many may go back to back
+    CLOUD_SESSION_RATE = float(os.getenv("CLOUD_SESSION_RATE", "0.2"))
+    CLOUD_SESSION_BURST = int(os.getenv("CLOUD_SESSION_BURST", "2"))
+    # Retries of "no device available" / rate-limit errors, with jittered backoff
+    CLOUD_CREATE_ATTEMPTS = int(os.getenv("CLOUD_CREATE_ATTEMPTS", "6"))
+    CLOUD_BACKOFF_BASE = float(os.getenv("CLOUD_BACKOFF_BASE", "5"))
+    CLOUD_BACKOFF_MAX = float(os.getenv("CLOUD_BACKOFF_MAX", "120"))
+    CLOUD_QUEUE_TIMEOUT = float(os.getenv("CLOUD_QUEUE_TIMEOUT", "1800"))
+
+    # =========================================================
+    # 🔹 Test Watchdog (utilities/watchdog.py)
+    # =========================================================
+    # Seconds per test including fixture setup/teardown (0 disables);
+    # override with @pytest.mark.time_budget(seconds)
+    TEST_TIME_BUDGET = float(os.getenv("TEST_TIME_BUDGET", "300"))
+    WATCHDOG_DELETE_TIMEOUT = float(os.getenv("WATCHDOG_DELETE_TIMEOUT", "10"))
+
+    # =========================================================
+    # 🔹 Performance History (utilities/perf_history.py)
+    # =========================================================
+    PERF_HISTORY_ENABLED = os.getenv("PERF_HISTORY_ENABLED", "true").lower() == "true"
+    PERF_HISTORY_PATH = os.getenv("PERF_HISTORY_PATH", os.path.join(REPORTS_DIR, "perf_history.sqlite"))
+    PERF_HISTORY_BATCH = int(os.getenv("PERF_HISTORY_BATCH", "1000"))
+    PERF_HISTORY_MAX_RUNS = int(os.getenv("PERF_HISTORY_MAX_RUNS", "200"))
+    # Latest runs compared against the runs before them; flagged when the
+    # one-sided Mann-Whitney p-value is below ALPHA and the median grew by MIN_CHANGE
+    PERF_HISTORY_RECENT_RUNS = int(os.getenv("PERF_HISTORY_RECENT_RUNS", "3"))
+    PERF_HISTORY_BASELINE_RUNS = int(os.getenv("PERF_HISTORY_BASELINE_RUNS", "10"))
+    PERF_HISTORY_ALPHA = float(os.getenv("PERF_HISTORY_ALPHA", "0.01"))
+    PERF_HISTORY_MIN_CHANGE = float(os.getenv("PERF_HISTORY_MIN_CHANGE", "0.1"))
+
+    # =========================================================
+    # 🔹 Scroll Search (utilities/scroll_search.py)
+    # =========================================================
+    SCROLL_MAX_SWIPES = int(os.getenv("SCROLL_MAX_SWIPES", "10"))
+    # Steps are fractions of the scroll area (middle 60% of the window)
+    SCROLL_STEP = float(os.getenv("SCROLL_STEP", "0.5"))
+    SCROLL_MIN_STEP = float(os.getenv("SCROLL_MIN_STEP", "0.2"))
+    SCROLL_MAX_STEP = float(os.getenv("SCROLL_MAX_STEP", "0.8"))
+    SCROLL_NATIVE = os.getenv("SCROLL_NATIVE", "true").lower() == "true"
+
+    # =========================================================
+    # 🔹 Text Entry (utilities/text_entry.py)
+    # =========================================================
+    # "fast" sets values without the soft keyboard where the platform allows;
+    # "typed" always types (tests can opt in with @pytest.mark.keystrokes)
+    TEXT_ENTRY_MODE = os.getenv("TEXT_ENTRY_MODE", "fast").lower()
+    TEXT_ENTRY_VERIFY = os.getenv("TEXT_ENTRY_VERIFY", "true").lower() == "true"
 
     # =========================================================
     # 🔹 Platform helpers
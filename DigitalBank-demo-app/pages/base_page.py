@@ -1,6 +1,5 @@
 """Base page class with common functionality."""
 
-from selenium.webdriver.common.by import By
 from config.config import Config
 from utilities.mobile_actions import MobileActions
 from utilities.mobile_gestures import MobileGestures
@@ -1,7 +1,10 @@
 """Page Object for Login Page."""
 
-from appium.webdriver.common.appiumby import AppiumBy
+from utilities.locator_strategies import AppiumBy
+from utilities.events import page_action
 from utilities.logger import Logger
+from utilities.self_healing import LocatorHealer
+from utilities.text_entry import TextEntry
 from config.config import Config
 
 
@@ -11,6 +14,8 @@ class LoginPage:
     def __init__(self, driver):
         self.driver = driver
         self.logger = Logger.get_logger(__name__)
+        self.healer = LocatorHealer(driver, page=type(self).__name__)
+        self.text_entry = TextEntry(driver, page=type(self).__name__)
 
         if Config.is_android():
             # Android locators
@@ -36,34 +41,37 @@ class LoginPage:
 
     # ---------------- ACTION METHODS ---------------- #
 
+    @page_action()
     def enter_username_or_email(self, value):
         """Enter username (iOS) or email (Android)."""
-        locator = self.locators["username"] if not Config.is_android() else self.locators["email"]
-        field = self.driver.find_element(*locator)
-        field.clear()
-        field.send_keys(value)
-        self.logger.info(f"Entered username/email: {value}")
+        key = "email" if Config.is_android() else "username"
+        field = self.healer.find_element(self.locators[key], key)
+        self.text_entry.enter(field, value)
+        self.logger.info("Entered username/email: %s", value)
 
+    @page_action("password")
     def enter_password(self, value):
         """Enter password."""
-        field = self.driver.find_element(*self.locators["password"])
-        field.clear()
-        field.send_keys(value)
+        field = self.healer.find_element(self.locators["password"], "password")
+        self.text_entry.enter(field, value, secret=True)
         self.logger.info("Entered password")
 
+    @page_action("login_button")
     def click_login(self):
         """Click login button."""
-        self.driver.find_element(*self.locators["login_button"]).click()
+        self.healer.find_element(self.locators["login_button"], "login_button").click()
         self.logger.info("Clicked login button")
 
+    @page_action("register_link")
     def click_register_link(self):
         """Click link to navigate to registration."""
-        self.driver.find_element(*self.locators["register_link"]).click()
+        self.healer.find_element(self.locators["register_link"], "register_link").click()
         self.logger.info("Clicked Register link")
 
+    @page_action("settings_icon")
     def click_settings_icon(self):
         """Click the settings icon."""
-        self.driver.find_element(*self.locators["settings_icon"]).click()
+        self.healer.find_element(self.locators["settings_icon"], "settings_icon").click()
         self.logger.info("Clicked Settings icon")
 
     # ---------------- VALIDATION METHODS ---------------- #
@@ -71,14 +79,14 @@ class LoginPage:
     def is_field_present(self, field_name):
         """Check if the given field is visible."""
         try:
-            return self.driver.find_element(*self.locators[field_name]).is_displayed()
+            return self.healer.find_element(self.locators[field_name], field_name, heal=False).is_displayed()
         except Exception:
             return False
 
     def get_error_message(self):
         """Fetch visible error message text (if available)."""
         try:
-            el = self.driver.find_element(*self.locators["error_message"])
+            el = self.healer.find_element(self.locators["error_message"], "error_message", heal=False)
             return el.text.strip()
         except Exception:
             return None
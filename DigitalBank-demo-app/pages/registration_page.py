@@ -1,16 +1,28 @@
 """Page Object for Registration Page."""
 
-from appium.webdriver.common.appiumby import AppiumBy
+from utilities.locator_strategies import AppiumBy
+from utilities.events import page_action
 from utilities.logger import Logger
+from utilities.self_healing import LocatorHealer
+from utilities.mobile_actions import MobileActions
+from utilities.scroll_search import ScrollSearch
+from utilities.text_entry import TextEntry
 from config.config import Config
 
 
 class RegistrationPage:
     """Page object representing the registration page for Android and iOS."""
 
+    # Title options by locator key, as labelled in the Android spinner
+    TITLES = {"mr": "Mr.", "mrs": "Mrs.", "ms": "Ms."}
+
     def __init__(self, driver):
         self.driver = driver
         self.logger = Logger.get_logger(__name__)
+        self.actions = MobileActions(driver, page=type(self).__name__)
+        self.healer = LocatorHealer(driver, page=type(self).__name__)
+        self.scroller = ScrollSearch(driver, screen=type(self).__name__)
+        self.text_entry = TextEntry(driver, page=type(self).__name__)
 
         # Common locators
         if Config.is_android():
@@ -30,6 +42,7 @@ class RegistrationPage:
                 "locality": (AppiumBy.ID, "xyz.digitalbank.demo:id/localityInput"),
                 "register_button": (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Register")'),
                 "error_message": (AppiumBy.ID, "xyz.digitalbank.demo:id/errorTextView"),
+                "success_message": (AppiumBy.ID, "xyz.digitalbank.demo:id/successTextView"),
             }
         else:  # iOS locators
             self.locators = {
@@ -53,57 +66,111 @@ class RegistrationPage:
                 "agree_terms": (AppiumBy.ACCESSIBILITY_ID, "Agree to Term and Conditions"),
                 "register_button": (AppiumBy.ACCESSIBILITY_ID, "Register"),
                 "error_message": (AppiumBy.ACCESSIBILITY_ID, "Error Message"),
+                "success_message": (AppiumBy.ACCESSIBILITY_ID, "Success Message"),
             }
 
     # ---------------- ACTION METHODS ---------------- #
 
-    def enter_first_name(self, first_name):
-        field = self.driver.find_element(*self.locators["first_name"])
-        field.clear()
-        field.send_keys(first_name)
-        self.logger.info(f"Entered First Name: {first_name}")
-
-    def enter_last_name(self, last_name):
-        field = self.driver.find_element(*self.locators["last_name"])
-        field.clear()
-        field.send_keys(last_name)
-        self.logger.info(f"Entered Last Name: {last_name}")
-
-    def enter_email(self, email):
-        field = self.driver.find_element(*self.locators["email"])
-        field.clear()
-        field.send_keys(email)
-        self.logger.info(f"Entered Email: {email}")
-
-    def enter_password(self, password):
-        field = self.driver.find_element(*self.locators["password"])
-        field.clear()
-        field.send_keys(password)
+    @page_action("first_name")
+    def enter_first_name(self, first_name, expect_rejection=False):
+        field = self.healer.find_element(self.locators["first_name"], "first_name")
+        self.text_entry.enter(field, first_name, strict=not expect_rejection)
+        self.logger.info("Entered First Name: %s", first_name)
+
+    @page_action("last_name")
+    def enter_last_name(self, last_name, expect_rejection=False):
+        field = self.healer.find_element(self.locators["last_name"], "last_name")
+        self.text_entry.enter(field, last_name, strict=not expect_rejection)
+        self.logger.info("Entered Last Name: %s", last_name)
+
+    @page_action("email")
+    def enter_email(self, email, expect_rejection=False):
+        field = self.healer.find_element(self.locators["email"], "email")
+        self.text_entry.enter(field, email, strict=not expect_rejection)
+        self.logger.info("Entered Email: %s", email)
+
+    @page_action("password")
+    def enter_password(self, password, expect_rejection=False):
+        field = self.healer.find_element(self.locators["password"], "password")
+        self.text_entry.enter(field, password, secret=True, strict=not expect_rejection)
         self.logger.info("Entered Password")
 
-    def enter_ssn(self, ssn):
-        field = self.driver.find_element(*self.locators["ssn"])
-        field.clear()
-        field.send_keys(ssn)
+    @page_action("ssn")
+    def enter_ssn(self, ssn, expect_rejection=False):
+        field = self.healer.find_element(self.locators["ssn"], "ssn")
+        self.text_entry.enter(field, ssn, strict=not expect_rejection)
         self.logger.info("Entered SSN")
 
+    @page_action()
+    def fill_personal_details(self, title="mr", gender="male", dob="01/15/1990", address="12 Main Street",
+                              locality="Springfield", region="Illinois", zipcode="62701", phone="2175550123"):
+        """
+        Fill the mandatory fields other than the text fields checked on their own.
+
+        Fields below the fold are scrolled to first. The iOS date picker is
+        left on its default date, and only iOS asks for a zip code, a phone
+        number and agreement to the terms.
+        """
+        if Config.is_android():
+            self.healer.find_element(self.locators["title_spinner"], "title_spinner").click()
+            self.driver.find_element(
+                AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{self.TITLES[title]}")'
+            ).click()
+            self.healer.find_element(self.locators[f"gender_{gender}"], f"gender_{gender}").click()
+            self.text_entry.enter(self._scrolled_to("dob"), dob)
+        else:
+            self.healer.find_element(self.locators[title], title).click()
+            self.healer.find_element(self.locators[gender], gender).click()
+        for name, value in (("address", address), ("locality", locality), ("region", region)):
+            self.text_entry.enter(self._scrolled_to(name), value)
+        if not Config.is_android():
+            self.text_entry.enter(self._scrolled_to("zipcode"), zipcode)
+            self.text_entry.enter(self._scrolled_to("phone"), phone)
+            self._scrolled_to("agree_terms").click()
+        self.logger.info("Filled personal details")
+
+    @page_action("register_button")
     def click_register(self):
-        self.driver.find_element(*self.locators["register_button"]).click()
+        self.healer.find_element(self.locators["register_button"], "register_button").click()
         self.logger.info("Clicked Register Button")
 
     # ---------------- VALIDATION METHODS ---------------- #
 
     def is_field_present(self, field_name):
-        """Check whether a field is visible and accessible."""
+        """Check whether a field is visible and accessible, without scrolling."""
         try:
-            return self.driver.find_element(*self.locators[field_name]).is_displayed()
+            return self.healer.find_element(self.locators[field_name], field_name, heal=False).is_displayed()
         except Exception:
             return False
 
+    @page_action()
+    def scroll_to_field(self, field_name):
+        """Scroll the form until a field below the fold shows; True if it was found."""
+        return self.scroller.find(self.locators[field_name], field_name) is not None
+
+    def wait_for_register_outcome(self, timeout=None):
+        """Wait for the success or error message after register, whichever shows first."""
+        outcome, _ = self.actions.wait_for_any_element(
+            {
+                "success": self.locators["success_message"],
+                "error": self.locators["error_message"],
+            },
+            timeout,
+        )
+        self.logger.info("Register outcome: %s", outcome)
+        return outcome
+
     def get_error_message(self):
         """Fetch the visible error message text (if any)."""
         try:
-            element = self.driver.find_element(*self.locators["error_message"])
+            element = self.healer.find_element(self.locators["error_message"], "error_message", heal=False)
             return element.text.strip()
         except Exception:
             return None
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _scrolled_to(self, field_name):
+        """Field element, scrolling the form to it if it is below the fold."""
+        locator = self.locators[field_name]
+        return self.scroller.find(locator, field_name) or self.driver.find_element(*locator)
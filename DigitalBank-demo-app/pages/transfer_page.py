@@ -1,10 +1,17 @@
-from appium.webdriver.common.mobileby import MobileBy
-from utilities.driverfactory import DriverFactory
+from config.config import Config
+from utilities.locator_strategies import AppiumBy as MobileBy
+from utilities.events import page_action
+from utilities.mobile_actions import MobileActions
+from utilities.scroll_search import ScrollSearch
+from utilities.text_entry import TextEntry
 
 class TransferPage:
     def __init__(self, driver):
         self.driver = driver
         self.platform = driver.capabilities['platformName'].lower()
+        self.actions = MobileActions(driver, page=type(self).__name__)
+        self.scroller = ScrollSearch(driver, screen=type(self).__name__)
+        self.text_entry = TextEntry(driver, page=type(self).__name__)
 
     # ---------------------- Locators ----------------------
     @property
@@ -43,24 +50,84 @@ class TransferPage:
         else:
             return self.driver.find_element(MobileBy.IOS_PREDICATE, 'type=="XCUIElementTypeButton" AND name=="Submit "')
 
+    @property
+    def form_locator(self):
+        if self.platform == 'android':
+            return (MobileBy.ID, "xyz.digitalbank.demo:id/amountEditText")
+        return (MobileBy.IOS_PREDICATE, 'type=="XCUIElementTypeTextField" AND value=="Enter Amount"')
+
+    @property
+    def outcome_locators(self):
+        if self.platform == 'android':
+            return {
+                "success": (MobileBy.ID, "xyz.digitalbank.demo:id/successTextView"),
+                "error": (MobileBy.ID, "xyz.digitalbank.demo:id/errorTextView"),
+            }
+        return {
+            "success": (MobileBy.ACCESSIBILITY_ID, "Success Message"),
+            "error": (MobileBy.ACCESSIBILITY_ID, "Error Message"),
+        }
+
     # ---------------------- Actions ----------------------
+    @page_action()
     def select_account(self, account_name=None):
         self.account_dropdown.click()
         if self.platform == 'android' and account_name:
-            self.driver.find_element(MobileBy.XPATH, f"//android.widget.TextView[@text='{account_name}']").click()
+            # Long account lists scroll; the offset of each account is remembered
+            text = account_name.replace("\\", "\\\\").replace('"', '\\"')
+            option = self.scroller.find(
+                (MobileBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{text}")'), "account_option"
+            )
+            if option is None:
+                option = self.driver.find_element(MobileBy.XPATH, f"//android.widget.TextView[@text='{account_name}']")
+            option.click()
         # iOS picker wheel auto selects, handled by setting value if needed
 
-    def enter_amount(self, amount):
-        self.amount_field.clear()
-        self.amount_field.send_keys(amount)
+    @page_action()
+    def enter_amount(self, amount, expect_rejection=False):
+        """Enter the amount; with ``expect_rejection`` a field that filters the text is not an error."""
+        self.text_entry.enter(self.amount_field, amount, strict=not expect_rejection)
 
-    def enter_description(self, description):
-        self.description_field.clear()
-        self.description_field.send_keys(description)
+    @page_action()
+    def enter_description(self, description, expect_rejection=False):
+        self.text_entry.enter(self.description_field, description, strict=not expect_rejection)
 
+    @page_action()
     def select_credit(self):
         if not self.credit_radio.is_selected():
             self.credit_radio.click()
 
+    @page_action()
+    def set_credit(self, enabled=True):
+        """Switch the credit option on or off; off leaves the transfer as a debit."""
+        if self.credit_radio.is_selected() != enabled:
+            self.credit_radio.click()
+
+    @page_action()
     def submit_transaction(self):
         self.submit_button.click()
+
+    @page_action()
+    def return_to_form(self, attempts=3):
+        """
+        Bring the transfer form back after a submit, e.g. between load transactions.
+
+        Android goes back from the confirmation screen; iOS taps the Transfer tab.
+
+        Returns:
+            bool: True if the form is showing
+        """
+        for _ in range(attempts):
+            if self.actions.is_displayed(self.form_locator, timeout=Config.LOAD_RESET_TIMEOUT):
+                return True
+            if self.platform == 'android':
+                self.driver.back()
+            else:
+                self.driver.find_element(MobileBy.ACCESSIBILITY_ID, "Transfer").click()
+        return self.actions.is_displayed(self.form_locator, timeout=Config.LOAD_RESET_TIMEOUT)
+
+    @page_action()
+    def wait_for_submit_outcome(self, timeout=None):
+        """Return "success" or "error", whichever appears first after submit, or None."""
+        outcome, _ = self.actions.wait_for_any_element(self.outcome_locators, timeout)
+        return outcome
@@ -1,10 +1,12 @@
-from appium.webdriver.common.appiumby import AppiumBy
+from utilities.locator_strategies import AppiumBy
 from utilities.logger import Logger
+from utilities.self_healing import LocatorHealer
 
 class WelcomePage:
     def __init__(self, driver):
         self.driver = driver
-        self.log = Logger().get_logger()
+        self.log = Logger.get_logger(__name__)
+        self.healer = LocatorHealer(driver, page=type(self).__name__)
 
         # Common locators (Android & iOS separated)
         self.locators = {
@@ -32,7 +34,7 @@ class WelcomePage:
     def click_element(self, platform, element_name):
         try:
             locator = self.locators[platform][element_name]
-            self.driver.find_element(*locator).click()
+            self.healer.find_element(locator, element_name).click()
             self.log.info(f"Clicked on {element_name}")
         except Exception as e:
             self.log.error(f"Unable to click {element_name}: {str(e)}")
@@ -41,7 +43,7 @@ class WelcomePage:
     def is_element_displayed(self, platform, element_name):
         try:
             locator = self.locators[platform][element_name]
-            element = self.driver.find_element(*locator)
+            element = self.healer.find_element(locator, element_name, heal=False)
             visible = element.is_displayed()
             self.log.info(f"{element_name} visible: {visible}")
             return visible
@@ -1,11 +1,58 @@
 """Pytest configuration and fixtures."""
 
+import os
+import threading
+import time
+
 import pytest
+from config.config import Config
+from utilities.appium_servers import AppiumServerPool, worker_server_url
+from utilities.artifact_store import ArtifactStore
+from utilities.cloud_governor import CloudGovernor
+from utilities.combinatorial import CombinationGenerator
+from utilities.data_provider import DataProvider
+from utilities.device_log import DeviceLogCollector
 from utilities.driver_factory import DriverFactory
+from utilities.events import EventBus, JsonlSink
+from utilities.failure_evidence import FailureEvidence
+from utilities.flakiness import FlakeTracker, is_verdict
 from utilities.logger import Logger
+from utilities.perf_history import PerfHistory
+from utilities.performance import AppiumPerformanceSource, PerformanceBaselines, PerformanceSampler
+from utilities.result_cache import ResultCache
+from utilities.screen_checks import ScreenCheckGroups
+from utilities.self_healing import HealingCache
+from utilities.test_selection import ImpactSelector
+from utilities.text_entry import TextEntry
+from utilities.tracing import Tracer
+from utilities.watchdog import Watchdog, WatchdogTimeout
 
 logger = Logger.get_logger(__name__)
 
+# Coverage summaries of combination-parametrized tests, shown after the run
+_combination_summaries = []
+
+# One device session and page-source snapshot per screen_check group
+screen_groups = ScreenCheckGroups()
+
+# Passing results reused while the app build and test fingerprint are unchanged
+result_cache = ResultCache()
+
+# Pass/fail history and in-session reruns of flaky failures
+flake_tracker = FlakeTracker()
+
+# Per-flow CPU/memory peaks checked against stored baselines
+perf_baselines = PerformanceBaselines()
+
+# Per-test time budgets that reclaim hung sessions
+watchdog = Watchdog()
+
+# Fixtures that give a test a device session
+_DEVICE_FIXTURES = ("driver", "screen")
+
+# Device sessions opened this run; only such runs feed the performance history
+_device_sessions = []
+
 
 @pytest.fixture(scope="function")
 def driver():
@@ -22,7 +69,12 @@ def driver():
     """
     logger.info("=" * 80)
     logger.info("Setting up driver for test")
-    driver_instance = DriverFactory.create_driver()
+    try:
+        driver_instance = DriverFactory.create_driver()
+    except WatchdogTimeout as e:
+        # pytest only tidies up fixtures that fail with an Exception or one of its outcomes
+        pytest.fail(str(e), pytrace=False)
+    _device_sessions.append(driver_instance.session_id)
 
     yield driver_instance
 
@@ -32,25 +84,55 @@ def driver():
 
 
 @pytest.fixture(scope="function")
-def take_screenshot_on_failure(driver, request):
+def screen(request):
     """
-    Automatically take screenshot on test failure.
+    Provide the shared snapshot of the test's ``screen_check`` group.
 
     Args:
-        driver: Driver fixture
         request: Pytest request object
 
     Yields:
-        None: This fixture doesn't provide any value
+        ScreenSnapshot: Page-source snapshot of the screen under check
     """
-    yield
+    marker = request.node.get_closest_marker(ScreenCheckGroups.MARKER)
+    if marker is None:
+        pytest.fail("The screen fixture requires a screen_check marker")
+    name = marker.args[0]
+    snapshot = screen_groups.acquire(name, **marker.kwargs)
+    _device_sessions.append(name)
+    yield snapshot
+    screen_groups.release(name)
+
+
+@pytest.fixture(autouse=True)
+def offline_events(request, monkeypatch):
+    """
+    Keep events of tests without a device session out of the run's event log.
+
+    Offline unit tests drive fakes through the real page objects and
+    utilities, so their events carry production names and would skew
+    the performance history. Sinks a test adds itself still work.
+
+    Args:
+        request: Pytest request object
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    if not _uses_device(request):
+        monkeypatch.setattr(EventBus, "sinks", [])
+
+
+def _uses_device(item):
+    """Whether a test (item or fixture request) runs with a device session."""
+    return any(name in item.fixturenames for name in _DEVICE_FIXTURES)
 
-    if request.node.rep_call.failed:
-        from utilities.mobile_actions import MobileActions
-        actions = MobileActions(driver)
-        test_name = request.node.name
-        actions.take_screenshot(f"failure_{test_name}")
-        logger.info(f"Screenshot taken for failed test: {test_name}")
+
+def _session_driver(item):
+    """Return the live driver a test ran with, if any."""
+    for name in ("driver", "setup_and_teardown"):
+        driver = item.funcargs.get(name)
+        if driver is not None:
+            return driver
+    return None
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -58,8 +140,10 @@ def pytest_runtest_makereport(item, call):
     """
     Hook to make test result available to fixtures.
 
-    This hook makes the test result accessible in fixtures
-    for conditional actions like taking screenshots on failure.
+    This hook makes the test result accessible in fixtures and, when a
+    test with a device session fails, captures a failure-evidence bundle
+    (screenshot, page source, device log, capabilities) before fixture
+    teardown quits the session.
 
     Args:
         item: Test item
@@ -71,6 +155,406 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+    result_cache.record(item, rep)
+    reruns = flake_tracker.flaky.get(item.nodeid) if rep.when == "call" else None
+    if reruns:
+        rep.user_properties.append(("flaky_reruns", reruns))
+    performance = getattr(item, "performance", None) if rep.when == "call" else None
+    if performance is not None:
+        summary, regressions = performance
+        rep.user_properties.append(("performance", summary))
+        if regressions and Config.PERF_FAIL_ON_REGRESSION and rep.passed:
+            rep.outcome = "failed"
+            rep.longrepr = "Performance regression:\n" + "\n".join(regressions)
+    driver = _session_driver(item) if rep.when == "call" and rep.failed else None
+    if driver is not None:
+        # Runs before fixture teardown, while the session is still alive
+        bundle = FailureEvidence(driver).capture(f"failure_{item.name}", test_id=item.nodeid)
+        if bundle:
+            rep.user_properties.append(("evidence", bundle))
+    if not _uses_device(item):
+        return
+    EventBus.emit(
+        f"test_{rep.when}",
+        page="pytest",
+        duration=rep.duration,
+        outcome="flaky" if reruns else "ok" if rep.passed else rep.outcome,
+    )
+
+
+def _restart_app(item):
+    """Relaunch the app in the test's own session before a rerun, if it has one."""
+    driver = _session_driver(item)
+    return DriverFactory.restart_app(driver) if driver is not None else True
+
+
+def _start_perf_sampler(item):
+    """Start sampling app performance for a ``perf_flow`` test on Android."""
+    if not Config.PERF_ENABLED or not Config.is_android() or item.get_closest_marker("perf_flow") is None:
+        return None
+    driver = _session_driver(item)
+    if driver is None:
+        return None
+    sampler = PerformanceSampler(AppiumPerformanceSource(driver))
+    sampler.start()
+    return sampler
+
+
+def _finish_perf_sampler(item, sampler):
+    """Stop sampling and check the flow's peaks against its baseline."""
+    flow = item.get_closest_marker("perf_flow").args[0]
+    summary = sampler.stop()
+    regressions = perf_baselines.check(flow, summary, test_id=item.nodeid)
+    for message in regressions:
+        logger.warning("Performance regression: %s", message)
+    item.performance = (summary, regressions)
+
+
+def _time_budget(item):
+    """Seconds a test may take, from its ``time_budget`` marker or Config."""
+    marker = item.get_closest_marker("time_budget")
+    return float(marker.args[0]) if marker is not None else Config.TEST_TIME_BUDGET
+
+
+def _arm_watchdog(item):
+    """
+    Start the watchdog for one phase (setup, call or teardown) of a test.
+
+    The budget covers the three phases together: each phase gets what the
+    earlier ones left. Time spent between phases, e.g. capturing failure
+    evidence while the report is made, is not counted, and no timeout can
+    be raised there, outside pytest's handling of the phase.
+    """
+    budget = _time_budget(item)
+    left = getattr(item, "_budget_left", budget)
+    if budget <= 0 or left <= 0:
+        return
+    item._phase_start = time.monotonic()
+    thread_id = threading.get_ident()
+    watchdog.arm(left, lambda: _watchdog_expired(item, budget, thread_id))
+
+
+def _disarm_watchdog(item):
+    """Stop the phase's watchdog and charge the phase's time to the budget."""
+    watchdog.disarm()
+    start = getattr(item, "_phase_start", None)
+    if start is not None:
+        item._budget_left = getattr(item, "_budget_left", _time_budget(item)) - (time.monotonic() - start)
+        item._phase_start = None
+
+
+def _watchdog_expired(item, budget, thread_id):
+    """Reclaim a hung test's session, or its place in the session queue, and return the failure reason."""
+    item._budget_left = 0  # later phases of this test run unguarded; the session is gone
+    reason = f"{item.nodeid} exceeded its {budget:g}s time budget"
+    driver = _session_driver(item)
+    if driver is None:
+        # Still in the driver fixture: a queued request is cancelled; one being
+        # created frees its slot and quits the session once the timeout lands
+        if CloudGovernor.shared().cancel(thread_id):
+            return f"{reason} (waiting for a cloud session slot)"
+        return reason
+    notes = Watchdog.reclaim(driver, f"watchdog_{item.name}", test_id=item.nodeid)
+    return f"{reason} ({'; '.join(notes)})"
+
+
+def _rerun_if_flaky(item, outcome):
+    """Record the call outcome and rerun the test in place if it scores as flaky."""
+    exception = outcome.exception
+    if not is_verdict(exception):
+        return
+    failed = exception is not None
+    flake_tracker.record(item.nodeid, not failed)
+    if not failed or item.get_closest_marker("xfail") or item.get_closest_marker(ScreenCheckGroups.MARKER):
+        return
+    if isinstance(exception, WatchdogTimeout):
+        return  # its session was deleted; a rerun would only fail again
+    if flake_tracker.retry(item.nodeid, item.runtest, reset=lambda: _restart_app(item)):
+        outcome.force_result(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """
+    Hold fixture setup to the test's time budget.
+
+    Args:
+        item: Test item
+
+    Yields:
+        None: Hook implementation
+    """
+    _arm_watchdog(item)
+    yield
+    _disarm_watchdog(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Tag the device log with the test's window, sample app performance of
+    ``perf_flow`` tests, record the test's outcome and rerun flaky failures
+    in the same session, all within the test's time budget.
+
+    A failed test whose history scores as flaky is rerun right away, after
+    relaunching the app, while its fixtures and device session are still
+    set up. A passing rerun replaces the failure; reruns are capped per
+    test and per run. xfail and screen-check tests are never rerun.
+
+    Args:
+        item: Test item
+
+    Yields:
+        None: Hook implementation
+    """
+    _arm_watchdog(item)
+    device_log = DeviceLogCollector.for_driver(_session_driver(item))
+    if device_log is not None:
+        device_log.mark(f"START {item.nodeid}")
+    sampler = _start_perf_sampler(item)
+    outcome = yield
+    if sampler is not None:
+        _finish_perf_sampler(item, sampler)
+    _rerun_if_flaky(item, outcome)
+    if device_log is not None:
+        device_log.mark(f"END {item.nodeid}")
+    _disarm_watchdog(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    """
+    Hold fixture teardown to what is left of the test's time budget.
+
+    Args:
+        item: Test item
+        nextitem: Next test item (unused)
+
+    Yields:
+        None: Hook implementation
+    """
+    _arm_watchdog(item)
+    yield
+    _disarm_watchdog(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Attach the running test's node id to every structured event, open the
+    test's root trace span when it is sampled and type text for
+    ``keystrokes`` tests. The time budget is enforced per phase by the
+    setup, call and teardown hooks.
+
+    Args:
+        item: Test item
+        nextitem: Next test item (unused)
+
+    Yields:
+        None: Hook implementation
+    """
+    EventBus.set_test(item.nodeid)
+    Tracer.start_test(item.nodeid)
+    TextEntry.typed = item.get_closest_marker("keystrokes") is not None
+    yield
+    call_report = getattr(item, "rep_call", None)
+    Tracer.finish_test(call_report.outcome if call_report else None)
+    TextEntry.typed = False
+    EventBus.set_test(None)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep only tests affected by ``--changed-since``, run each screen_check
+    group back to back in one shared session and skip tests whose passing
+    result is cached for identical inputs.
+
+    Runs last so tests deselected by ``-k``/``-m`` are not counted.
+
+    Args:
+        config: Pytest config object
+        items: Collected test items
+    """
+    base = config.getoption("changed_since")
+    if base:
+        selection = ImpactSelector().select_since(base)
+        if selection.full:
+            logger.info("Change-based selection: running the full suite (%s)", selection.reason)
+        else:
+            selected = set(selection.tests)
+            deselected = [item for item in items if item.nodeid.split("[")[0] not in selected]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+                items[:] = [item for item in items if item.nodeid.split("[")[0] in selected]
+            logger.info("Change-based selection: %d of %d tests affected by %d changed files since %s",
+                        len(items), len(items) + len(deselected), len(selection.changed), base)
+    cached = 0
+    for item in items:
+        entry = result_cache.lookup(item)
+        if entry is not None:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["timestamp"]))
+            item.add_marker(pytest.mark.skip(
+                reason=f"cached {entry['outcome']} from {when} ({entry['duration']:.1f}s), "
+                       f"build {result_cache.build}"
+            ))
+            cached += 1
+    if cached:
+        logger.info("Result cache: skipping %d of %d tests with unchanged inputs", cached, len(items))
+    items[:] = screen_groups.schedule(items)
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize ``data_case`` and ``combo`` from the test's markers.
+
+    ``@pytest.mark.data_source("transfer_cases.csv", where=..., sample=...,
+    id_fields=[...])`` streams the dataset and parametrizes the test with
+    one lightweight case reference per matching record; the test calls
+    ``data_case.load()`` to read its record.
+
+    ``@pytest.mark.combinations({"field": [values], ...}, strength=2,
+    constraints=[...], include=[...], id_fields=[...])`` parametrizes ``combo`` with a
+    pairwise (or t-way) covering set of field-value dicts.
+
+    Args:
+        metafunc: Pytest metafunc object
+    """
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is not None and "data_case" in metafunc.fixturenames:
+        provider = DataProvider(*marker.args, **marker.kwargs)
+        metafunc.parametrize("data_case", list(provider.params()))
+
+    marker = metafunc.definition.get_closest_marker("combinations")
+    if marker is not None and "combo" in metafunc.fixturenames:
+        kwargs = dict(marker.kwargs)
+        id_fields = kwargs.pop("id_fields", None)
+        generator = CombinationGenerator(*marker.args, **kwargs)
+        metafunc.parametrize("combo", generator.params(id_fields))
+        summary = f"{metafunc.definition.nodeid}: {generator.summary()}"
+        _combination_summaries.append(summary)
+        logger.info("Combinations %s", summary)
+
+
+def pytest_sessionstart(session):
+    """
+    Prune old artifacts and compress previous runs' logs, and start the
+    local Appium server pool when one is configured (in the xdist
+    controller only; workers use the server pinned to them).
+
+    Args:
+        session: Pytest session object
+    """
+    ArtifactStore.shared().start_session()
+    pinned = worker_server_url(session.config)
+    if pinned:
+        # xdist worker: use the controller's server pinned to it
+        Config.LOCAL_APPIUM_SERVER_URL = pinned
+    elif (Config.APPIUM_POOL_SIZE and Config.CLOUD_PROVIDER.lower() == "local"
+          and not hasattr(session.config, "workerinput")):
+        AppiumServerPool.shared().start()
+    if Config.EVENTS_ENABLED:
+        EventBus.add_sink(JsonlSink())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Pin a new xdist worker to a server of the controller's Appium pool.
+
+    Args:
+        node: xdist worker controller
+    """
+    if AppiumServerPool.running():
+        AppiumServerPool.shared().pin(node.workerinput)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Close shared screen sessions and stop the local Appium server pool,
+    save cached results, flake history, updated performance baselines and
+    healed locators, flush events and traces, add the timings of a run
+    that opened device sessions to the performance history, and let background log compression finish before
+    the process exits.
+
+    Args:
+        session: Pytest session object
+        exitstatus: Exit status of the test run
+    """
+    screen_groups.close()
+    if AppiumServerPool.running():
+        AppiumServerPool.shared().shutdown()
+    result_cache.save()
+    flake_tracker.save()
+    perf_baselines.save()
+    HealingCache.shared().save()
+    event_files = [sink.path for sink in EventBus.sinks if isinstance(sink, JsonlSink)]
+    EventBus.close()
+    if Config.PERF_HISTORY_ENABLED and _device_sessions:
+        history = PerfHistory()
+        for path in event_files:
+            if os.path.exists(path):
+                history.ingest(path, exit_status=int(exitstatus))
+        history.close()
+    trace_path = Tracer.export()
+    if trace_path:
+        logger.info("Trace written: %s", trace_path)
+    ArtifactStore.shared().finish_session()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Report combinatorial coverage, flow performance peaks, healed locators,
+    hung tests, cloud session queueing and text entry latency, and separate
+    flaky passes from true failures.
+
+    Args:
+        terminalreporter: Pytest terminal reporter
+    """
+    if _combination_summaries:
+        terminalreporter.section("combinatorial coverage")
+        for summary in _combination_summaries:
+            terminalreporter.write_line(summary)
+    if flake_tracker.flaky or flake_tracker.failed:
+        terminalreporter.section("flakiness")
+        for line in flake_tracker.summary_lines():
+            terminalreporter.write_line(line)
+    if perf_baselines.results:
+        terminalreporter.section("app performance")
+        for line in perf_baselines.summary_lines():
+            terminalreporter.write_line(line)
+    healed = HealingCache.shared().report_lines()
+    if healed:
+        terminalreporter.section("healed locators (fix in pages/)")
+        for line in healed:
+            terminalreporter.write_line(line)
+    if watchdog.expired:
+        terminalreporter.section("watchdog (hung tests reclaimed)")
+        for reason in watchdog.expired:
+            terminalreporter.write_line(reason)
+    governed = CloudGovernor.shared().summary_lines()
+    if governed:
+        terminalreporter.section("cloud sessions")
+        for line in governed:
+            terminalreporter.write_line(line)
+    entered = TextEntry.summary_lines()
+    if entered:
+        terminalreporter.section("text entry latency")
+        for line in entered:
+            terminalreporter.write_line(line)
+
+
+def pytest_addoption(parser):
+    """
+    Register command-line options.
+
+    Args:
+        parser: Pytest argument parser
+    """
+    parser.addoption(
+        "--changed-since", action="store", default=None, metavar="REF",
+        help="run only tests affected by changes since this git ref",
+    )
 
 
 def pytest_configure(config):
@@ -95,4 +579,33 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers",
         "product: Mark test as product feature test"
-    )
\ No newline at end of file
+    )
+    config.addinivalue_line(
+        "markers",
+        "data_source(path, where=None, sample=None, limit=None, seed=0, id_fields=None): "
+        "parametrize data_case from a CSV/JSONL dataset"
+    )
+    config.addinivalue_line(
+        "markers",
+        "combinations(domains, strength=2, constraints=None, include=None, id_fields=None): "
+        "parametrize combo with a pairwise/t-way covering set of field values"
+    )
+    config.addinivalue_line(
+        "markers",
+        "screen_check(name, ready=None, navigate=None): read-only check evaluated against "
+        "one shared session and page-source snapshot per screen, reached by navigate(driver)"
+    )
+    config.addinivalue_line(
+        "markers",
+        "perf_flow(name): sample app CPU/memory/frames during the test and check the "
+        "flow's peaks against its stored baseline"
+    )
+    config.addinivalue_line(
+        "markers",
+        "time_budget(seconds): fail the test and reclaim its session when setup, call and "
+        "teardown take longer than this"
+    )
+    config.addinivalue_line(
+        "markers",
+        "keystrokes: type text key by key instead of setting field values directly"
+    )
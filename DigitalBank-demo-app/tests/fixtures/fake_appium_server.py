@@ -0,0 +1,41 @@
+"""Stand-in for the ``appium`` executable: serves only ``GET <base-path>/status``.
+
+Accepts the same ``--address``/``--port``/``--base-path`` arguments, so a
+pool can be pointed at it with
+``APPIUM_EXECUTABLE="python tests/fixtures/fake_appium_server.py"``.
+"""
+
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4723)
+    parser.add_argument("--base-path", default="/")
+    args = parser.parse_args()
+    status_path = args.base_path.rstrip("/") + "/status"
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != status_path:
+                self.send_error(404)
+                return
+            body = json.dumps({"value": {"ready": True, "message": "fake server ready",
+                                         "build": {"version": "fake"}}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            print(format % args, flush=True)
+
+    ThreadingHTTPServer((args.address, args.port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
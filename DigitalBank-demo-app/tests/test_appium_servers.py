@@ -0,0 +1,103 @@
+"""Tests for the local Appium server pool, run against a stub server."""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from config.config import Config
+from utilities.appium_servers import AppiumServerPool, worker_server_url
+from utilities.driver_factory import DriverFactory
+
+STUB = os.path.join(os.path.dirname(__file__), "fixtures", "fake_appium_server.py")
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = AppiumServerPool(
+        size=2, executable=f"{sys.executable} {STUB}", startup_timeout=15,
+        health_interval=0, max_restarts=1, log_dir=str(tmp_path),
+    )
+    yield pool.start()
+    pool.shutdown()
+
+
+class TestAppiumServerPool:
+
+    def test_servers_start_on_distinct_free_ports(self, pool):
+        assert len({server.port for server in pool.servers}) == 2
+        assert all(server.healthy() for server in pool.servers)
+        assert all(server.url.endswith("/wd/hub") for server in pool.servers)
+
+    def test_workers_are_pinned_and_balanced(self, pool):
+        first, second = pool.url_for("gw0"), pool.url_for("gw1")
+        assert first != second
+        assert pool.url_for("gw0") == first
+        assert pool.url_for("gw2") in (first, second)
+
+    def test_crashed_server_is_restarted_on_its_port(self, pool):
+        url = pool.url_for("gw0")
+        server = pool.assign("gw0")
+        server.process.kill()
+        server.process.wait()
+
+        assert pool.check() == [server]
+        assert server.healthy() and server.restarts == 1
+        assert pool.url_for("gw0") == url
+
+    def test_workers_move_off_a_server_given_up_on(self, pool):
+        server = pool.assign("gw0")
+        for _ in range(2):
+            server.process.kill()
+            server.process.wait()
+            pool.check()
+        assert not server.alive()
+        assert pool.assign("gw0") is not server
+
+    def test_xdist_workers_are_each_pinned_to_one_server(self, pool):
+        inputs = [{"workerid": "gw0"}, {"workerid": "gw1"}]
+        for workerinput in inputs:
+            pool.pin(workerinput)
+        urls = [worker_server_url(SimpleNamespace(workerinput=w)) for w in inputs]
+        assert sorted(urls) == sorted(server.url for server in pool.servers)
+        assert worker_server_url(SimpleNamespace()) is None
+
+    def test_restart_does_not_block_other_workers(self, pool):
+        server = pool.assign("gw0")
+        other = pool.assign("gw1")
+        wait_ready = server.wait_ready
+
+        def slow_ready(timeout):
+            time.sleep(1)
+            wait_ready(timeout)
+
+        server.wait_ready = slow_ready
+        server.process.kill()
+        server.process.wait()
+        checker = threading.Thread(target=pool.check)
+        checker.start()
+        while not server.restart_lock.locked():
+            time.sleep(0.01)
+
+        start = time.monotonic()
+        assert pool.url_for("gw1") == other.url
+        assert time.monotonic() - start < 0.5
+        assert pool.url_for("gw0") == server.url
+        assert server.healthy()
+        checker.join()
+
+    def test_shutdown_stops_every_process(self, pool):
+        processes = [server.process for server in pool.servers]
+        pool.shutdown()
+        assert all(process.poll() is not None for process in processes)
+        assert not pool.servers
+
+    def test_driver_factory_uses_the_pooled_url(self, pool, monkeypatch):
+        monkeypatch.setattr(AppiumServerPool, "_instance", pool)
+        monkeypatch.setattr(Config, "CLOUD_PROVIDER", "local")
+        assert DriverFactory.server_url("gw1") == pool.url_for("gw1")
+        monkeypatch.setattr(AppiumServerPool, "_instance", None)
+        assert DriverFactory.server_url("gw1") == Config.LOCAL_APPIUM_SERVER_URL
@@ -0,0 +1,53 @@
+"""Offline tests for the content-addressed artifact store."""
+
+import gzip
+import os
+import time
+
+import pytest
+
+from utilities.artifact_store import ArtifactStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.config.Config.LOGS_DIR", str(tmp_path / "logs"))
+    return ArtifactStore(root=str(tmp_path / "artifacts"),
+                         max_bytes=1024, max_age_days=1)
+
+
+class TestArtifactStore:
+
+    def test_identical_content_is_stored_once(self, store):
+        first = store.put_bytes(b"png-bytes", "login_1", "screenshot", ".png")
+        second = store.put_bytes(b"png-bytes", "login_2", "screenshot", ".png")
+
+        assert first == second
+        assert len(store._scan_objects()) == 1
+        assert [entry["name"] for entry in store.find(kind="screenshot")] == [
+            "login_1", "login_2"
+        ]
+
+    def test_retention_drops_old_and_oversized_objects(self, store):
+        old = store.put_bytes(b"old", "old", "screenshot")
+        stale = time.time() - 3 * 86400
+        os.utime(old, (stale, stale))
+        store.put_bytes(b"a" * 600, "big_1", "screenshot")
+        time.sleep(0.01)
+        newest = store.put_bytes(b"b" * 600, "big_2", "screenshot")
+
+        removed = store.enforce_retention()
+
+        assert removed == 2
+        assert [entry["path"] for entry in store.find()] == [newest]
+
+    def test_compresses_finished_logs_only(self, store, tmp_path):
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        finished = logs_dir / "test_execution_20250101_000000.log"
+        finished.write_text("done\n")
+
+        assert store.compress_logs() == 1
+        assert not finished.exists()
+        with gzip.open(f"{finished}.gz", "rt") as handle:
+            assert handle.read() == "done\n"
@@ -0,0 +1,238 @@
+"""Tests for the cloud session governor, against a stub WebDriver server."""
+
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.config import Config
+from utilities.cloud_governor import CloudGovernor, TokenBucket
+from utilities.driver_factory import DriverFactory
+from utilities.watchdog import WatchdogTimeout
+
+
+class FakeCloud:
+    """
+    WebDriver endpoint with a device limit and a minimum creation interval.
+
+    Session requests over the limit get Perfecto-style "no device"
+    errors, and requests closer together than ``min_interval`` get a 429.
+    """
+
+    def __init__(self, devices, min_interval=0.0):
+        self.devices = devices
+        self.min_interval = min_interval
+        self.sessions = set()
+        self.peak = 0
+        self.rejected = []
+        self.last_create = None
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_port}/wd/hub"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create(self):
+        with self.lock:
+            now = time.monotonic()
+            if self.last_create is not None and now - self.last_create < self.min_interval:
+                self.rejected.append("rate")
+                return 429, {"error": "unknown error", "message": "Too Many Requests"}
+            self.last_create = now
+            if len(self.sessions) >= self.devices:
+                self.rejected.append("device")
+                return 500, {"error": "session not created",
+                             "message": "Device not available: all devices are in use"}
+            session_id = uuid.uuid4().hex
+            self.sessions.add(session_id)
+            self.peak = max(self.peak, len(self.sessions))
+            return 200, {"sessionId": session_id, "capabilities": {"platformName": "Android"}}
+
+    def _handler(self):
+        cloud = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, value):
+                body = json.dumps({"value": value}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path.endswith("/session"):
+                    self._reply(*cloud.create())
+                else:
+                    self._reply(200, None)
+
+            def do_DELETE(self):
+                with cloud.lock:
+                    cloud.sessions.discard(self.path.rstrip("/").rsplit("/", 1)[-1])
+                self._reply(200, None)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def perfecto(monkeypatch):
+    monkeypatch.setattr(Config, "CLOUD_PROVIDER", "perfecto")
+    monkeypatch.setattr(Config, "PLATFORM", "android")
+    monkeypatch.setattr(Config, "DEVICE_LOG_ENABLED", False)
+
+    def start(devices, governor, min_interval=0.0):
+        cloud = FakeCloud(devices, min_interval)
+        monkeypatch.setattr(Config, "PERFECTO_SERVER_URL", cloud.url)
+        monkeypatch.setattr(CloudGovernor, "_instance", governor)
+        return cloud
+
+    return start
+
+
+def _run_tests(count, hold=0.2):
+    errors = []
+
+    def test():
+        try:
+            driver = DriverFactory.create_driver()
+            time.sleep(hold)
+            DriverFactory.quit_driver(driver)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=test) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestCloudGovernor:
+
+    def test_cap_keeps_sessions_within_the_plan(self, perfecto):
+        governor = CloudGovernor(max_sessions=2, rate=0, max_attempts=1)
+        cloud = perfecto(devices=2, governor=governor)
+        assert _run_tests(5) == []
+        assert cloud.rejected == [] and cloud.peak == 2
+        assert governor.stats["sessions"] == 5
+        assert governor.queue_wait.max > 0  # later tests queued for a slot
+        assert governor.summary_lines()[0].startswith("sessions 5 created, 0 failed")
+        cloud.close()
+
+    @pytest.mark.parametrize("error", [RuntimeError("logcat unavailable"), WatchdogTimeout("logcat hung")])
+    def test_failed_session_setup_ends_the_session_and_frees_the_slot(self, perfecto, monkeypatch, error):
+        governor = CloudGovernor(max_sessions=1, rate=0, max_attempts=1, queue_timeout=1)
+        cloud = perfecto(devices=1, governor=governor)
+        monkeypatch.setattr(Config, "DEVICE_LOG_ENABLED", True)
+
+        def broken_log(driver):
+            raise error
+
+        monkeypatch.setattr("utilities.driver_factory.DeviceLogCollector.start_for", broken_log)
+        with pytest.raises(type(error), match="logcat"):
+            DriverFactory.create_driver()
+        assert cloud.sessions == set() and governor._active == 0
+        cloud.close()
+
+    def test_no_device_and_rate_limit_errors_are_retried(self, perfecto):
+        governor = CloudGovernor(max_sessions=3, rate=0, max_attempts=20,
+                                 backoff_base=0.05, backoff_max=0.2, rng=random.Random(1))
+        cloud = perfecto(devices=1, governor=governor, min_interval=0.02)
+        assert _run_tests(3, hold=0.1) == []
+        assert cloud.peak == 1
+        assert governor.stats["retries"] == len(cloud.rejected) > 0
+        cloud.close()
+
+    def test_other_errors_fail_at_once_and_free_the_slot(self):
+        governor = CloudGovernor(max_sessions=1, rate=0, max_attempts=5)
+
+        def broken():
+            raise ValueError("invalid capabilities")
+
+        with pytest.raises(ValueError):
+            governor.create_session(broken)
+        assert governor.stats["retries"] == 0
+        assert governor.create_session(object) is not None  # slot was released
+
+    def test_timeout_during_creation_frees_the_slot(self):
+        governor = CloudGovernor(max_sessions=1, rate=0, queue_timeout=0.05)
+
+        def hung():
+            raise WatchdogTimeout()
+
+        with pytest.raises(WatchdogTimeout):
+            governor.create_session(hung)
+        assert governor._active == 0
+        assert governor.create_session(object) is not None
+
+    def test_timeout_while_queued_gives_up_the_place(self, monkeypatch):
+        governor = CloudGovernor(max_sessions=1, rate=0)
+        first = governor.create_session(object)
+
+        def interrupted(self, timeout=None):
+            raise WatchdogTimeout()
+
+        monkeypatch.setattr(threading.Event, "wait", interrupted)
+        with pytest.raises(WatchdogTimeout):
+            governor.create_session(object)
+        monkeypatch.undo()
+        assert not governor._waiters
+        governor.release(first)
+        assert governor._active == 0
+
+    def test_waiters_are_served_in_arrival_order(self):
+        governor = CloudGovernor(max_sessions=1, rate=0)
+        first = governor.create_session(object)
+        granted = []
+
+        def wait(name):
+            session = governor.create_session(object)
+            granted.append(name)
+            governor.release(session)
+
+        threads = []
+        for name in ("a", "b", "c"):
+            threads.append(threading.Thread(target=wait, args=(name,)))
+            threads[-1].start()
+            while len(governor._waiters) < len(threads):
+                time.sleep(0.001)
+        governor.release(first)
+        for thread in threads:
+            thread.join()
+        assert granted == ["a", "b", "c"]
+        assert governor._active == 0
+
+    def test_queue_timeout(self):
+        governor = CloudGovernor(max_sessions=1, rate=0, queue_timeout=0.05)
+        governor.create_session(object)
+        with pytest.raises(TimeoutError):
+            governor.create_session(object)
+        assert not governor._waiters
+
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+
+        bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+        assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+        now[0] = 10.0
+        assert bucket.acquire() == 0.0
+        assert slept == [0.5, 1.0]
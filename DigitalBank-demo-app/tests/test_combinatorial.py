@@ -0,0 +1,84 @@
+"""Offline tests for pairwise/t-way case generation."""
+
+import itertools
+
+import pytest
+
+from utilities.combinatorial import CombinationGenerator
+
+DOMAINS = {
+    "account": ["savings", "checking"],
+    "amount": ["1000", "0.01", "", "abc"],
+    "description": ["Salary", "", "Rent, March"],
+    "credit": [True, False],
+}
+
+
+def _pairs(cases, fields):
+    return {
+        ((a, case[a]), (b, case[b]))
+        for case in cases
+        for a, b in itertools.combinations(fields, 2)
+    }
+
+
+class TestCombinationGenerator:
+
+    def test_pairwise_covers_every_pair_with_fewer_cases(self):
+        generator = CombinationGenerator(DOMAINS)
+        cases = generator.cases()
+
+        expected = {
+            ((a, va), (b, vb))
+            for a, b in itertools.combinations(DOMAINS, 2)
+            for va in DOMAINS[a] for vb in DOMAINS[b]
+        }
+        assert _pairs(cases, list(DOMAINS)) == expected
+        assert 12 <= len(cases) <= 14  # 4 x 3 is the lower bound; 48 exhaustive
+        assert generator.coverage(cases) == 1.0
+
+    def test_generation_is_deterministic(self):
+        assert CombinationGenerator(DOMAINS, seed=7).cases() == CombinationGenerator(DOMAINS, seed=7).cases()
+
+    def test_constraints_are_respected(self):
+        constraints = ["not (credit == False and amount == '')",
+                       lambda case: case["account"] != "checking" or case["amount"] != "abc"]
+        cases = CombinationGenerator(DOMAINS, constraints=constraints).cases()
+
+        assert not any(c["credit"] is False and c["amount"] == "" for c in cases)
+        assert not any(c["account"] == "checking" and c["amount"] == "abc" for c in cases)
+        assert ((("amount", ""), ("credit", True))) in _pairs(cases, ["amount", "credit"])
+
+    def test_three_way_strength(self):
+        domains = {name: [0, 1, 2] for name in "abcde"}
+        cases = CombinationGenerator(domains, strength=3).cases()
+
+        triples = {
+            tuple((f, case[f]) for f in fields)
+            for case in cases
+            for fields in itertools.combinations(domains, 3)
+        }
+        assert len(triples) == 10 * 27
+        assert len(cases) < 3 ** 5
+
+    def test_included_cases_come_first(self):
+        happy = {"account": "savings", "amount": "1000", "description": "Salary", "credit": True}
+        cases = CombinationGenerator(DOMAINS, include=[happy]).cases()
+
+        assert cases[0] == happy
+        with pytest.raises(ValueError):
+            CombinationGenerator(DOMAINS, include=[{**happy, "amount": "7"}])
+
+    def test_report_counts_device_minutes_saved(self):
+        generator = CombinationGenerator(DOMAINS)
+        report = generator.report(minutes_per_case=2)
+
+        assert report.exhaustive_cases == 48
+        assert report.coverage == 1.0
+        assert report.device_minutes == report.cases * 2
+        assert report.minutes_saved == (48 - report.cases) * 2
+        assert "48 exhaustive" in generator.summary(minutes_per_case=2)
+
+    def test_partial_suite_coverage(self):
+        generator = CombinationGenerator({"a": [0, 1], "b": [0, 1]})
+        assert generator.coverage([{"a": 0, "b": 0}, {"a": 1, "b": 1}]) == 0.5
@@ -0,0 +1,55 @@
+"""Offline tests for the streaming data provider."""
+
+import json
+
+import pytest
+
+from utilities.data_provider import DataProvider
+
+
+@pytest.fixture
+def transfers(tmp_path):
+    path = tmp_path / "transfers.csv"
+    path.write_text(
+        "account,amount,description,expected\n"
+        "Savings,1000,Salary Deposit,success\n"
+        "Savings,,Salary Deposit,error\n"
+        "\n"
+        'Savings,abc,"Rent, March",error\n'
+    )
+    return str(path)
+
+
+class TestDataProvider:
+
+    def test_where_filters_records(self, transfers):
+        records = list(DataProvider(transfers, where="expected == 'error'").records())
+        assert [record["amount"] for record in records] == ["", "abc"]
+        assert records[1]["description"] == "Rent, March"
+
+    def test_cases_load_their_record_lazily(self, transfers):
+        cases = list(DataProvider(transfers, id_fields=["amount"]).cases())
+
+        assert [case.case_id for case in cases] == ["L2-1000", "L3-empty", "L5-abc"]
+        assert cases[2].load() == {
+            "account": "Savings", "amount": "abc",
+            "description": "Rent, March", "expected": "error",
+        }
+
+    def test_sampling_is_deterministic(self, tmp_path):
+        path = tmp_path / "cases.jsonl"
+        path.write_text("".join(json.dumps({"n": n}) + "\n" for n in range(1000)))
+
+        first = [c.line for c in DataProvider(str(path), sample=0.1, seed=3).cases()]
+        second = [c.line for c in DataProvider(str(path), sample=0.1, seed=3).cases()]
+
+        assert first == second
+        assert 50 < len(first) < 150
+
+    def test_limit_stops_streaming(self, tmp_path):
+        path = tmp_path / "cases.jsonl"
+        path.write_text("".join(json.dumps({"n": n}) + "\n" for n in range(100)))
+
+        records = list(DataProvider(str(path), where="n % 2 == 0", limit=3).records())
+
+        assert records == [{"n": 0}, {"n": 2}, {"n": 4}]
@@ -0,0 +1,115 @@
+"""Offline tests for the background device-log ring buffer."""
+
+import threading
+import time
+
+from utilities.device_log import DeviceLogCollector
+from utilities.failure_evidence import FailureEvidence
+
+
+class FakeLogDriver:
+    """Driver double whose get_log returns only entries added since the last call."""
+
+    capabilities = {}
+
+    def __init__(self):
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def emit(self, *messages):
+        with self.lock:
+            self.pending.extend({"timestamp": 1, "level": "INFO", "message": m} for m in messages)
+
+    def get_log(self, log_type):
+        with self.lock:
+            entries, self.pending = self.pending, []
+        return entries
+
+
+class TestDeviceLogCollector:
+
+    def test_ring_buffer_keeps_newest_lines(self):
+        driver = FakeLogDriver()
+        collector = DeviceLogCollector(driver, log_type="logcat", max_bytes=100)
+        driver.emit(*(f"message {n:03d}" for n in range(50)))
+        collector.poll()
+
+        lines = collector.lines()
+        assert lines[-1].endswith("message 049")
+        assert sum(len(line) + 1 for line in lines) <= 100
+        assert collector.dropped_lines == 50 - len(lines)
+        assert collector.dump().startswith(f"----- {collector.dropped_lines} older lines dropped".encode())
+
+    def test_markers_delimit_test_windows(self):
+        driver = FakeLogDriver()
+        collector = DeviceLogCollector(driver, log_type="logcat")
+        driver.emit("before")
+        collector.poll()
+        collector.mark("START t::a")
+        driver.emit("during")
+        collector.poll()
+        collector.mark("END t::a")
+        driver.emit("after")
+        collector.poll()
+
+        window = collector.window("START t::a", "END t::a")
+        assert [line.split()[-1] for line in window[1:-1]] == ["during"]
+        assert "START t::a" in window[0] and "END t::a" in window[-1]
+        assert collector.window("START t::missing") == []
+
+    def test_background_polling_and_registry(self):
+        driver = FakeLogDriver()
+        collector = DeviceLogCollector.start_for(driver, log_type="logcat", interval=0.01)
+        try:
+            driver.emit("streamed")
+            deadline = time.monotonic() + 2
+            while not collector.lines() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert DeviceLogCollector.for_driver(driver) is collector
+            assert collector.lines()[0].endswith("streamed")
+        finally:
+            DeviceLogCollector.stop_for(driver)
+        assert DeviceLogCollector.for_driver(driver) is None
+
+    def test_failure_evidence_keeps_the_failed_tests_window(self):
+        driver = FakeLogDriver()
+        collector = DeviceLogCollector.start_for(driver, log_type="logcat", interval=60)
+        try:
+            driver.emit("earlier test")
+            collector.poll()
+            collector.mark("START t::b")
+            driver.emit("crash")
+            data = FailureEvidence(driver)._device_log("t::b").decode()
+            driver.emit("unmarked")
+            tail = FailureEvidence(driver, log_lines=2)._device_log().decode()
+        finally:
+            DeviceLogCollector.stop_for(driver)
+
+        assert "START t::b" in data and data.endswith("crash")
+        assert "earlier test" not in data
+        assert tail.splitlines()[-1].endswith("unmarked") and len(tail.splitlines()) == 2
+
+    def test_concurrent_polls_keep_lines_in_order(self):
+        driver = FakeLogDriver()
+        collector = DeviceLogCollector(driver, log_type="logcat")
+        fetched = threading.Event()
+
+        class SlowEntry(dict):
+            """Entry that is slow to format, after get_log has already returned it."""
+
+            def get(self, key, default=None):
+                if not fetched.is_set():
+                    fetched.set()
+                    time.sleep(0.1)  # a second poll would land its batch meanwhile
+                return super().get(key, default)
+
+        with driver.lock:
+            driver.pending.append(SlowEntry(timestamp=1, level="INFO", message="first"))
+        poller = threading.Thread(target=collector.poll)
+        poller.start()
+        fetched.wait(1)
+        driver.emit("second")
+        collector.poll()
+        poller.join()
+
+        assert [line.split()[-1] for line in collector.lines()] == ["first", "second"]
@@ -0,0 +1,96 @@
+"""Offline tests for the structured JSONL event stream."""
+
+import threading
+
+import pytest
+
+from config.config import Config
+from utilities import events
+from utilities.events import Event, EventBus, JsonlSink, page_action
+
+
+class FakePage:
+    locators = {"login_button": ("accessibility id", "Login Button")}
+
+    @page_action("login_button")
+    def click_login(self):
+        return "clicked"
+
+    @page_action()
+    def broken(self):
+        raise RuntimeError("boom")
+
+
+def _page_events(sink):
+    """Events emitted by page code, without the pytest report events."""
+    return [event for event in EventBus.read(sink.path) if event["page"] != "pytest"]
+
+
+@pytest.fixture
+def sink(tmp_path):
+    saved_sinks, saved_test = EventBus.sinks, EventBus.test_id
+    EventBus.sinks = []
+    sink = EventBus.add_sink(JsonlSink(str(tmp_path / "events.jsonl"), buffer_size=2))
+    yield sink
+    EventBus.sinks, EventBus.test_id = saved_sinks, saved_test
+
+
+class TestEventBus:
+
+    def test_events_are_buffered_until_batch_is_full(self, tmp_path):
+        sink = JsonlSink(str(tmp_path / "buffered.jsonl"), buffer_size=2)
+        event = Event(None, "LoginPage", "click", None, 0.1, "ok", {})
+
+        sink.consume(event)
+        assert not (tmp_path / "buffered.jsonl").exists()
+
+        sink.consume(event)
+        assert len(list(EventBus.read(sink.path))) == 2
+
+    def test_no_event_is_lost_across_threads(self, tmp_path):
+        sink = JsonlSink(str(tmp_path / "threads.jsonl"), buffer_size=7)
+        event = Event(None, "TransferPage", "enter_amount", None, 0.1, "ok", {})
+
+        def emit():
+            for _ in range(2000):
+                sink.consume(event)
+
+        workers = [threading.Thread(target=emit) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        sink.close()
+        assert len(list(EventBus.read(sink.path))) == 16000
+
+    def test_page_action_records_page_locator_and_outcome(self, sink):
+        EventBus.set_test("tests/test_login_page.py::test_valid_login")
+        assert FakePage().click_login() == "clicked"
+        with pytest.raises(RuntimeError):
+            FakePage().broken()
+        sink.flush()
+
+        ok, error = _page_events(sink)
+        assert ok["test_id"] == "tests/test_login_page.py::test_valid_login"
+        assert (ok["page"], ok["action"], ok["outcome"]) == ("FakePage", "click_login", "ok")
+        assert ok["locator"] == ["accessibility id", "Login Button"]
+        assert (error["action"], error["outcome"]) == ("broken", "error")
+
+    def test_summarize_aggregates_per_page_action(self, sink):
+        EventBus.emit("click", page="LoginPage", duration=0.5)
+        EventBus.emit("click", page="LoginPage", duration=1.5, outcome="timeout")
+        sink.flush()
+
+        stats = EventBus.summarize(sink.path)[("LoginPage", "click")]
+        assert stats["count"] == 2 and stats["errors"] == 1
+        assert stats["total_duration"] == 2.0 and stats["max_duration"] == 1.5
+
+    def test_emit_without_sinks_is_a_no_op(self, tmp_path, monkeypatch):
+        built = []
+        monkeypatch.setattr(Config, "EVENTS_DIR", str(tmp_path))
+        monkeypatch.setattr(events, "Event", lambda *args: built.append(args))
+        monkeypatch.setattr(EventBus, "sinks", [])
+
+        EventBus.emit("click", page="LoginPage")
+        assert built == []  # returns before an event is even built
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,85 @@
+"""Offline tests for concurrent failure-evidence capture."""
+
+import json
+import tarfile
+import threading
+import time
+
+import pytest
+
+from utilities.artifact_store import ArtifactStore
+from utilities.failure_evidence import FailureEvidence
+
+
+class FakeDriver:
+    capabilities = {"platformName": "Android", "securityToken": "abc", "deviceName": "Pixel"}
+
+    def __init__(self, delay=0.0, hang=None):
+        self.delay = delay
+        self.hang = hang or threading.Event()
+        self.hang.set()
+
+    def get_screenshot_as_png(self):
+        time.sleep(self.delay)
+        return b"\x89PNG fake"
+
+    @property
+    def page_source(self):
+        time.sleep(self.delay)
+        self.hang.wait()
+        return "<hierarchy/>"
+
+    def get_log(self, log_type):
+        time.sleep(self.delay)
+        return [{"timestamp": n, "level": "INFO", "message": f"line {n}"} for n in range(10)]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ArtifactStore(root=str(tmp_path / "artifacts"))
+    monkeypatch.setattr(ArtifactStore, "_instance", store)
+    return store
+
+
+def read_bundle(path):
+    with tarfile.open(path, "r:gz") as archive:
+        return {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+
+class TestFailureEvidence:
+
+    def test_bundle_contains_every_capture(self, store):
+        path = FailureEvidence(FakeDriver(), log_lines=3).capture("failure_x", test_id="t::x")
+        files = read_bundle(path)
+
+        assert files["screenshot.png"] == b"\x89PNG fake"
+        assert files["page_source.xml"] == b"<hierarchy/>"
+        assert files["device.log"].decode().splitlines()[-1].endswith("line 9")
+        assert len(files["device.log"].decode().splitlines()) == 3
+        capabilities = json.loads(files["capabilities.json"])
+        assert capabilities["securityToken"] == "<redacted>"
+        manifest = json.loads(files["manifest.json"])
+        assert {c["status"] for c in manifest["captures"].values()} == {"ok"}
+        assert store.find(kind="failure_bundle", test_id="t::x")
+
+    def test_captures_run_concurrently(self, store):
+        start = time.perf_counter()
+        FailureEvidence(FakeDriver(delay=0.2)).collect()
+
+        assert time.perf_counter() - start < 0.6
+
+    def test_hung_capture_is_abandoned_at_the_deadline(self, store):
+        hang = threading.Event()
+        driver = FakeDriver(hang=hang)
+        hang.clear()
+        try:
+            start = time.perf_counter()
+            path = FailureEvidence(driver, timeout=0.3).capture("failure_hung")
+            elapsed = time.perf_counter() - start
+        finally:
+            hang.set()
+
+        assert elapsed < 1.0
+        files = read_bundle(path)
+        assert "page_source.xml" not in files
+        assert json.loads(files["manifest.json"])["captures"]["page_source"]["status"] == "timeout"
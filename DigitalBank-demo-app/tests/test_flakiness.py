@@ -0,0 +1,135 @@
+"""Offline tests for flakiness scoring and budgeted reruns."""
+
+import json
+
+import pytest
+
+from utilities.flakiness import FlakeTracker, is_verdict
+from utilities.watchdog import WatchdogTimeout
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    path = tmp_path / "flake_history.json"
+    path.write_text(json.dumps({
+        "flaky": "PPFPPPFPPF",
+        "broken": "FFFFFFFFFF",
+        "regressed": "P" * 30 + "FF",
+        "new": "PF",
+    }))
+    return str(path)
+
+
+def tracker(path, **kwargs):
+    options = {"threshold": 0.1, "min_runs": 5, "max_reruns": 2, "budget": 3}
+    options.update(kwargs)
+    return FlakeTracker(path, **options)
+
+
+class Attempts:
+    """Test body double that fails a given number of times, then passes."""
+
+    def __init__(self, failures, fail=lambda: AssertionError("element not found")):
+        self.failures = failures
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.fail()
+
+
+class TestFlakeTracker:
+
+    def test_scores_use_failure_transition_rate(self, history_path):
+        flakes = tracker(history_path)
+
+        flaky = flakes.stats("flaky")
+        assert (flaky.runs, flaky.failures) == (10, 3)
+        assert flaky.failure_transition_rate == pytest.approx(3 / 7)
+        assert flakes.stats("broken").score == 0
+        assert flakes.stats("regressed").score == pytest.approx(1 / 30)
+        assert flakes.stats("new").score == 0  # too little history
+
+    def test_flaky_failure_is_rerun_until_it_passes(self, history_path):
+        flakes = tracker(history_path)
+        flakes.record("flaky", False)
+        attempt, resets = Attempts(failures=1), []
+
+        assert flakes.retry("flaky", attempt, reset=lambda: resets.append(1) or True)
+        assert attempt.calls == 2 and len(resets) == 2
+        assert flakes.flaky == {"flaky": 2}
+        assert flakes.history("flaky").endswith("FFP")
+
+    def test_explicit_failures_in_a_rerun_are_recorded(self, history_path):
+        flakes = tracker(history_path)
+        flakes.record("flaky", False)
+        attempt = Attempts(failures=1, fail=lambda: _raised(pytest.fail, "explicit failure"))
+
+        assert flakes.retry("flaky", attempt)
+        assert attempt.calls == 2
+        assert flakes.history("flaky").endswith("FFP")
+
+    def test_timed_out_rerun_is_recorded_and_ends_the_retries(self, history_path):
+        flakes = tracker(history_path)
+        flakes.record("flaky", False)
+        attempt = Attempts(failures=5, fail=lambda: WatchdogTimeout("hung"))
+
+        assert not flakes.retry("flaky", attempt)
+        assert attempt.calls == 1
+        assert flakes.failed == {"flaky": 1}
+        assert flakes.history("flaky").endswith("FF")
+
+    def test_true_failures_are_not_rerun(self, history_path):
+        flakes = tracker(history_path)
+        flakes.record("broken", False)
+        attempt = Attempts(failures=1)
+
+        assert not flakes.retry("broken", attempt)
+        assert attempt.calls == 0
+        assert flakes.failed == {"broken": 0}
+        assert any(line.startswith("FAILED broken") for line in flakes.summary_lines())
+
+    def test_reruns_are_capped_by_budget(self, history_path):
+        flakes = tracker(history_path, budget=1)
+
+        assert not flakes.retry("flaky", Attempts(failures=5))
+        assert flakes.budget_used == 1
+        assert not flakes.should_rerun("flaky")
+
+    def test_failed_reset_stops_reruns(self, history_path):
+        flakes = tracker(history_path)
+        attempt = Attempts(failures=0)
+
+        assert not flakes.retry("flaky", attempt, reset=lambda: False)
+        assert attempt.calls == 0 and flakes.budget_used == 0
+
+    def test_history_is_merged_and_windowed_on_save(self, history_path):
+        first, second = tracker(history_path, window=12), tracker(history_path, window=12)
+        first.record("flaky", True)
+        second.record("broken", True)
+        first.save()
+        second.save()
+
+        with open(history_path) as handle:
+            saved = json.load(handle)
+        assert saved["flaky"] == "PPFPPPFPPFP"
+        assert saved["broken"] == "FFFFFFFFFFP"
+
+
+def _raised(action, *args):
+    try:
+        action(*args)
+    except BaseException as e:
+        return e
+
+
+def test_only_passes_and_failures_are_flake_evidence():
+    assert is_verdict(None)
+    assert is_verdict(AssertionError("element not found"))
+    assert is_verdict(_raised(pytest.fail, "explicit failure"))
+    assert is_verdict(WatchdogTimeout("hung"))
+    assert not is_verdict(_raised(pytest.skip, "no device"))
+    assert not is_verdict(_raised(pytest.xfail, "known bug"))
+    assert not is_verdict(KeyboardInterrupt())
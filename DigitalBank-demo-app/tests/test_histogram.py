@@ -0,0 +1,53 @@
+"""Offline tests for the HDR-style latency histogram."""
+
+import random
+
+import pytest
+
+from utilities.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        assert histogram.percentile(50) == 50
+        assert histogram.percentile(99) == 99
+        assert histogram.percentile(100) == 100
+        assert histogram.mean() == pytest.approx(50.5)
+
+    def test_relative_error_is_bounded(self):
+        rng = random.Random(3)
+        values = sorted(rng.randint(1, 60_000_000) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[int(percentile / 100 * len(values)) - 1]
+            assert histogram.percentile(percentile) == pytest.approx(exact, rel=1 / 128)
+        assert histogram.max == values[-1] and histogram.percentile(100) == values[-1]
+        assert len(histogram.counts) < 4000  # a few KB for a range up to a minute
+
+    def test_merge_matches_single_histogram(self):
+        combined, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in range(0, 100_000, 7):
+            combined.record(value)
+            (first if value % 2 else second).record(value)
+        first.merge(second)
+
+        assert first.total == combined.total and first.min == combined.min
+        assert first.percentiles() == combined.percentiles()
+
+    def test_seconds_and_invalid_values(self):
+        histogram = LatencyHistogram()
+        histogram.record_seconds(0.25)
+        assert histogram.to_dict()["max"] == 250_000
+        assert LatencyHistogram().percentile(50) is None
+        with pytest.raises(ValueError):
+            histogram.record(-1)
+        with pytest.raises(ValueError):
+            histogram.merge(LatencyHistogram(sub_bucket_bits=4))
@@ -0,0 +1,123 @@
+"""Offline tests for the launch-time benchmark."""
+
+import pytest
+
+from utilities.launch_benchmark import (
+    LaunchBenchmark,
+    LaunchHistory,
+    launch_stats,
+    reject_outliers,
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeElement:
+
+    def is_displayed(self):
+        return True
+
+
+class FakeLaunchDriver:
+    """Driver double whose signature element appears after a scripted delay."""
+
+    def __init__(self, clock, cold, warm, polls_needed=2):
+        self.clock = clock
+        self.delays = {"cold": list(cold), "warm": list(warm)}
+        self.polls_needed = polls_needed
+        self.calls = []
+        self.mode = None
+        self.polls = 0
+
+    def implicitly_wait(self, seconds):
+        self.calls.append(("implicitly_wait", seconds))
+
+    def terminate_app(self, app_id):
+        self.mode = "cold"
+
+    def background_app(self, seconds):
+        self.mode = "warm"
+
+    def activate_app(self, app_id):
+        self.calls.append(("activate_app", app_id))
+        self.polls = 0
+
+    def find_elements(self, by, value):
+        self.polls += 1
+        if self.polls < self.polls_needed:
+            return []
+        self.clock.now += self.delays[self.mode].pop(0)
+        return [FakeElement()]
+
+
+class TestStatistics:
+
+    def test_iqr_rejects_outlier(self):
+        kept, rejected = reject_outliers([1.0, 1.1, 0.9, 1.05, 0.95, 5.0], "iqr")
+        assert rejected == [5.0] and len(kept) == 5
+
+    def test_mad_and_none(self):
+        samples = [1.0, 1.1, 0.9, 1.05, 0.95, 5.0]
+        assert reject_outliers(samples, "mad")[1] == [5.0]
+        assert reject_outliers(samples, "none") == (samples, [])
+        with pytest.raises(ValueError):
+            reject_outliers(samples, "zscore")
+
+    def test_confidence_interval_contains_mean(self):
+        stats = launch_stats("cold", [1.0, 1.2, 1.1, 0.9, 1.0], outliers="none")
+        assert stats.mean == pytest.approx(1.04)
+        assert stats.ci_low < stats.mean < stats.ci_high
+        # t(4) = 2.776
+        assert stats.ci_high - stats.mean == pytest.approx(2.776 * stats.stdev / 5 ** 0.5)
+
+
+class TestLaunchBenchmark:
+
+    def test_warmup_runs_are_discarded(self):
+        clock = FakeClock()
+        driver = FakeLaunchDriver(clock, cold=[9.0, 2.0, 2.2, 2.1], warm=[5.0, 0.5, 0.6, 0.4])
+        benchmark = LaunchBenchmark(driver, ("id", "login"), app_id="app", runs=3, warmup=1,
+                                    outliers="none", clock=clock)
+
+        results = benchmark.run()
+
+        assert results["cold"].samples == pytest.approx([2.0, 2.2, 2.1])
+        assert results["warm"].median == pytest.approx(0.5)
+        assert driver.calls[0] == ("implicitly_wait", 0)
+        assert driver.calls.count(("activate_app", "app")) == 8
+
+    def test_launch_times_out(self):
+        clock = FakeClock()
+
+        class NeverVisible(FakeLaunchDriver):
+            def find_elements(self, by, value):
+                clock.now += 1
+                return []
+
+        benchmark = LaunchBenchmark(NeverVisible(clock, [], []), ("id", "login"), app_id="app",
+                                    timeout=3, clock=clock)
+        with pytest.raises(TimeoutError):
+            benchmark.launch("cold")
+
+
+class TestLaunchHistory:
+
+    def test_trend_comparison(self, tmp_path):
+        history = LaunchHistory(path=str(tmp_path / "launch_history.jsonl"), threshold=0.1)
+        before = {"cold": launch_stats("cold", [1.0, 1.02, 0.98, 1.01], "none")}
+        history.append(before, "android", "emulator-5554", build="1.0")
+        assert history.previous("android", "other") is None
+
+        after = {"cold": launch_stats("cold", [1.5, 1.52, 1.48, 1.51], "none")}
+        [(mode, change, regressed)] = history.compare(after, history.previous("android", "emulator-5554"))
+        assert mode == "cold" and change == pytest.approx(0.5, abs=0.01) and regressed
+
+        [(_, _, regressed)] = history.compare(before, history.previous("android", "emulator-5554"))
+        assert not regressed
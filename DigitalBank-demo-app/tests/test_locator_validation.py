@@ -0,0 +1,148 @@
+"""Offline tests for locator validation against page-source fixtures."""
+
+import os
+import time
+
+import pytest
+
+from config.config import Config
+from utilities.locator_validation import (
+    PAGE_CATALOG,
+    LocatorValidator,
+    capture,
+    page_locators,
+)
+from utilities.locator_strategies import AppiumBy
+from utilities.page_source import PageSource
+from utilities.self_healing import healing
+
+LOGIN_ANDROID = """<hierarchy>
+  <android.widget.EditText class="android.widget.EditText" content-desc="Enter Email Address" displayed="true"/>
+  <android.widget.EditText class="android.widget.EditText" content-desc="Enter Password" password="true" displayed="true"/>
+  <android.widget.Button class="android.widget.Button" content-desc="Login Button" text="Login" displayed="true"/>
+  <android.widget.TextView class="android.widget.TextView" content-desc="Settings Cog Icon" displayed="true"/>
+  <android.widget.TextView class="android.widget.TextView" text="Register" displayed="true"/>
+  <android.widget.TextView class="android.widget.TextView" text="Register" displayed="true"/>
+</hierarchy>"""
+
+LOGIN_ANDROID_ERROR = """<hierarchy>
+  <android.widget.TextView class="android.widget.TextView"
+      resource-id="xyz.digitalbank.demo:id/errorTextView" text="Invalid email" displayed="true"/>
+</hierarchy>"""
+
+
+class HealingLoginPage:
+    """Login page double whose locators carry alternates, as a healed page would."""
+
+    def __init__(self, driver):
+        self.locators = {
+            "email": (AppiumBy.ACCESSIBILITY_ID, "Enter Email Address"),
+            "password": healing(
+                (AppiumBy.ACCESSIBILITY_ID, "Enter Password"),
+                (AppiumBy.ID, "xyz.digitalbank.demo:id/passwordInput"),
+                (AppiumBy.XPATH, "//android.widget.EditText[@password='true']"),
+            ),
+            "register_link": healing(
+                (AppiumBy.ACCESSIBILITY_ID, "Click here to Register new account"),
+                (AppiumBy.ID, "xyz.digitalbank.demo:id/registerLink"),
+                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Register")'),
+            ),
+            "error_message": (AppiumBy.ID, "xyz.digitalbank.demo:id/errorTextView"),
+        }
+
+
+HEALING_LOGIN_PAGE = f"{__name__}.HealingLoginPage"
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    android = tmp_path / "android"
+    android.mkdir()
+    (android / "login.xml").write_text(LOGIN_ANDROID)
+    (android / "login-error.xml").write_text(LOGIN_ANDROID_ERROR)
+    return str(tmp_path)
+
+
+def _by_name(results, role="primary"):
+    return {result.name: result for result in results if result.role == role}
+
+
+class TestPageLocators:
+
+    def test_reads_both_platforms_without_a_device(self):
+        platform = Config.PLATFORM
+        android = page_locators(PAGE_CATALOG["login"], "android")
+        ios = page_locators(PAGE_CATALOG["login"], "ios")
+        assert "email" in android and "username" in ios
+        assert Config.PLATFORM == platform
+
+    def test_platform_keyed_pages(self):
+        assert "welcome_text" in page_locators(PAGE_CATALOG["welcome"], "android")
+        assert "welcome_label" in page_locators(PAGE_CATALOG["welcome"], "ios")
+
+
+class TestLocatorValidator:
+
+    def test_statuses_across_screen_variants(self, fixtures_dir):
+        results = LocatorValidator(fixtures_dir, {"login": HEALING_LOGIN_PAGE}).validate(("android",))
+        primaries = _by_name(results)
+
+        assert primaries["email"].status == "ok"
+        assert primaries["error_message"].status == "ok"
+        assert primaries["error_message"].fixtures == ["login-error.xml"]
+        assert primaries["register_link"].status == "miss"
+        assert {r.platform for r in results} == {"android"}  # no iOS fixtures
+
+        assert _by_name(results, role="alternate 1")["password"].status == "miss"
+        password_alternates = _by_name(results, role="alternate 2")
+        assert password_alternates["password"].slow  # XPath alternate
+        assert password_alternates["password"].status == "ok"
+        assert password_alternates["register_link"].status == "ambiguous"
+
+        lines = LocatorValidator.report_lines(results)
+        assert any(line.startswith("MISS") and "login.register_link (primary)" in line for line in lines)
+        assert not any("login.email (primary)" in line for line in lines)
+
+    def test_unsupported_locators_are_reported(self):
+        result = LocatorValidator.check(
+            "android", "screen", "scroll", "primary",
+            ("-android uiautomator", "new UiScrollable(new UiSelector())"),
+            [PageSource(LOGIN_ANDROID)], ["screen.xml"],
+        )
+        assert result.status == "unsupported"
+
+    def test_whole_catalog_in_under_a_second(self, fixtures_dir):
+        for platform in ("android", "ios"):
+            os.makedirs(os.path.join(fixtures_dir, platform), exist_ok=True)
+            for screen in PAGE_CATALOG:
+                with open(os.path.join(fixtures_dir, platform, f"{screen}.xml"), "w") as handle:
+                    handle.write(LOGIN_ANDROID)
+        start = time.perf_counter()
+        results = LocatorValidator(fixtures_dir).validate()
+        assert time.perf_counter() - start < 1.0
+        assert {(r.platform, r.screen) for r in results} == {
+            (platform, screen) for platform in ("android", "ios") for screen in PAGE_CATALOG
+        }
+
+
+class TestCapture:
+
+    def test_writes_one_fixture_per_screen(self, tmp_path):
+        class Driver:
+            page_source = LOGIN_ANDROID
+
+        prompts = []
+        paths = capture(Driver(), ["login", "login-error"], fixtures_dir=str(tmp_path),
+                        platform="android", prompt=prompts.append)
+        assert [os.path.basename(path) for path in paths] == ["login.xml", "login-error.xml"]
+        assert len(prompts) == 1
+
+
+def test_captured_fixtures_match_page_objects():
+    """Fail CI when a captured screen no longer matches its page object."""
+    results = LocatorValidator().validate()
+    if not results:
+        pytest.skip(f"no page-source fixtures captured in {Config.PAGE_SOURCE_FIXTURES_DIR}")
+    # Alternates are only kept once confirmed here, so a broken one fails too
+    broken = [r for r in results if r.status in ("miss", "ambiguous")]
+    assert not broken, "\n".join(LocatorValidator.report_lines(broken))
@@ -0,0 +1,110 @@
+"""Offline tests for page-source locator evaluation and the any-of waiter."""
+
+import pytest
+from utilities.locator_strategies import AppiumBy
+from utilities.mobile_actions import MobileActions
+from utilities.page_source import PageSource
+
+ANDROID_SOURCE = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <android.widget.FrameLayout class="android.widget.FrameLayout" displayed="true">
+    <android.widget.EditText class="android.widget.EditText"
+        resource-id="xyz.digitalbank.demo:id/amountEditText"
+        content-desc="Enter Amount" text="" displayed="true"/>
+    <android.widget.TextView class="android.widget.TextView"
+        resource-id="xyz.digitalbank.demo:id/errorTextView"
+        text="Amount is required" displayed="true"/>
+    <android.widget.Button class="android.widget.Button" text="Register" displayed="false"/>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+IOS_SOURCE = """<?xml version="1.0" encoding="UTF-8"?>
+<AppiumAUT>
+  <XCUIElementTypeApplication type="XCUIElementTypeApplication" name="DigitalBank" visible="true">
+    <XCUIElementTypeButton type="XCUIElementTypeButton" name="Submit " visible="true"/>
+    <XCUIElementTypeTextField type="XCUIElementTypeTextField" value="Enter Amount" visible="true"/>
+  </XCUIElementTypeApplication>
+</AppiumAUT>"""
+
+
+class FakeElement:
+    def is_displayed(self):
+        return True
+
+
+class FakeDriver:
+    """Driver double exposing only the calls made by the any-of waiter."""
+
+    def __init__(self, sources, present):
+        self.sources = list(sources)
+        self.present = present
+        self.page_source_calls = 0
+        self.implicit_waits = []
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        return self.sources[min(self.page_source_calls, len(self.sources)) - 1]
+
+    def find_elements(self, by, value):
+        return [FakeElement()] if (by, value) in self.present else []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+
+
+class TestPageSource:
+
+    @pytest.mark.parametrize("locator", [
+        (AppiumBy.ID, "xyz.digitalbank.demo:id/errorTextView"),
+        (AppiumBy.ID, "errorTextView"),
+        (AppiumBy.ACCESSIBILITY_ID, "Enter Amount"),
+        (AppiumBy.XPATH, "//android.widget.TextView[@text='Amount is required']"),
+        (AppiumBy.CLASS_NAME, "android.widget.EditText"),
+    ])
+    def test_android_locators_match(self, locator):
+        assert PageSource(ANDROID_SOURCE).is_present(locator) is True
+
+    def test_hidden_nodes_are_skipped(self):
+        snapshot = PageSource(ANDROID_SOURCE)
+        locator = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Register")')
+        assert snapshot.is_present(locator) is False
+        assert snapshot.is_present(locator, visible_only=False) is True
+
+    @pytest.mark.parametrize("locator", [
+        (AppiumBy.IOS_PREDICATE, 'type=="XCUIElementTypeButton" AND name=="Submit "'),
+        (AppiumBy.IOS_CLASS_CHAIN, '**/XCUIElementTypeButton[`name == "Submit "`]'),
+        (AppiumBy.ACCESSIBILITY_ID, "Submit "),
+    ])
+    def test_ios_locators_match(self, locator):
+        assert PageSource(IOS_SOURCE).is_present(locator) is True
+
+    def test_unsupported_locator_returns_none(self):
+        locator = (AppiumBy.IOS_PREDICATE, 'name BEGINSWITH "Sub"')
+        assert PageSource(IOS_SOURCE).is_present(locator) is None
+
+
+class TestWaitForAnyElement:
+
+    def test_returns_first_outcome_from_single_snapshot(self):
+        error = (AppiumBy.ID, "xyz.digitalbank.demo:id/errorTextView")
+        success = (AppiumBy.ID, "xyz.digitalbank.demo:id/successTextView")
+        driver = FakeDriver([ANDROID_SOURCE], present={error})
+
+        name, element = MobileActions(driver).wait_for_any_element(
+            {"success": success, "error": error}, timeout=1
+        )
+
+        assert name == "error" and element is not None
+        assert driver.page_source_calls == 1
+        assert driver.implicit_waits[0] == 0
+
+    def test_times_out_without_match(self):
+        success = (AppiumBy.ID, "xyz.digitalbank.demo:id/successTextView")
+        driver = FakeDriver([ANDROID_SOURCE], present=set())
+
+        name, element = MobileActions(driver).wait_for_any_element(
+            {"success": success}, timeout=0.2, poll_interval=0.05
+        )
+
+        assert (name, element) == (None, None)
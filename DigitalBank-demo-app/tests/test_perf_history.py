@@ -0,0 +1,109 @@
+"""Offline tests for the SQLite performance history."""
+
+import os
+import random
+
+import pytest
+
+from utilities.events import Event, JsonlSink
+from utilities.perf_history import PerfHistory, mann_whitney_greater
+
+pytest_plugins = ("pytester",)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Offline tests emitting events under production page names
+OFFLINE_TESTS = """
+from utilities.events import EventBus
+
+
+def test_fake_transfer():
+    EventBus.emit("enter_amount", page="TransferPage", duration=0.2)
+
+
+def test_fake_session():
+    EventBus.emit("create_session", page="DriverFactory", duration=3.0)
+"""
+
+
+def write_run(path, login=1.0, transfer=2.0, samples=5, seed=0):
+    """Event file of one run with jittered page-action and test timings."""
+    rng = random.Random(seed)
+    sink = JsonlSink(str(path), buffer_size=1000)
+    for _ in range(samples):
+        sink.consume(Event(None, "LoginPage", "enter_email", None, login * rng.uniform(0.95, 1.05), "ok", None))
+        sink.consume(Event(None, "TransferPage", "enter_amount", None, transfer * rng.uniform(0.95, 1.05),
+                           "ok", None))
+    sink.consume(Event("tests/test_login_page.py::test_valid_login", "pytest", "test_call", None, 12.0, "ok", None))
+    sink.consume(Event(None, "DriverFactory", "create_session", None, 8.0, "ok", None))
+    sink.consume(Event(None, "FailureEvidence", "capture_evidence", None, 0.5, "ok", {"path": "x"}))
+    sink.consume(Event(None, "LoginPage", "enter_email", None, None, "ok", None))  # no duration
+    sink.consume(Event(None, "pytest", "test_call", None, 1.0, "ok", None))  # outside a test
+    sink.close()
+    return str(path)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = PerfHistory(path=str(tmp_path / "history.sqlite"), batch_size=4, max_runs=50)
+    yield history
+    history.close()
+
+
+def test_mann_whitney_matches_the_normal_approximation():
+    assert mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == pytest.approx(0.0061, abs=1e-4)
+    assert mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) > 0.99
+    assert mann_whitney_greater([1, 1, 1], [1, 1, 1]) > 0.5
+    assert mann_whitney_greater([], [1]) == 1.0
+
+
+class TestPerfHistory:
+
+    def test_ingests_each_file_once_in_batches(self, history, tmp_path):
+        path = write_run(tmp_path / "events_1.jsonl")
+        run_id = history.ingest(path, exit_status=0)
+        assert run_id is not None
+        assert history.ingest(path) is None
+
+        kinds = dict(history.db.execute("SELECT kind, COUNT(*) FROM timings GROUP BY kind").fetchall())
+        assert kinds == {"command": 10, "test_call": 1, "session": 1, "artifact": 1}
+        started, finished = history.db.execute("SELECT started, finished FROM runs").fetchone()
+        assert started <= finished
+
+    def test_flags_only_a_significant_slowdown(self, history, tmp_path):
+        for run in range(13):
+            login = 1.5 if run >= 10 else 1.0
+            history.ingest(write_run(tmp_path / f"events_{run}.jsonl", login=login, seed=run))
+
+        flagged, comparisons = history.compare(recent=3, baseline=10, alpha=0.01, min_change=0.1)
+        assert [(c.kind, c.name) for c in flagged] == [("command", "LoginPage.enter_email")]
+        assert flagged[0].change == pytest.approx(0.5, abs=0.06)
+        assert ("command", "TransferPage.enter_amount") in {(c.kind, c.name) for c in comparisons}
+
+        lines = history.report_lines(flagged, comparisons)
+        assert lines[0].startswith("1 significant slowdowns")
+        assert lines[1].startswith("SLOWER") and lines[1].endswith("command LoginPage.enter_email")
+
+    def test_trend_and_pruning(self, tmp_path):
+        history = PerfHistory(path=str(tmp_path / "history.sqlite"), max_runs=3)
+        for run in range(5):
+            history.ingest(write_run(tmp_path / f"events_{run}.jsonl", login=1.0 + run, samples=1))
+        assert len(history.run_ids()) == 3
+        assert [value for _, value in history.trend("command", "LoginPage.enter_email")] == \
+            pytest.approx([3.0, 4.0, 5.0], rel=0.06)
+        assert history.db.execute("SELECT COUNT(DISTINCT run_id) FROM timings").fetchone()[0] == 3
+        assert PerfHistory.sparkline([1, 2, 3]) == "▁▅█"
+        history.close()
+
+
+def test_offline_runs_stay_out_of_the_history(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", PROJECT_ROOT)
+    with open(os.path.join(PROJECT_ROOT, "tests", "conftest.py"), encoding="utf-8") as handle:
+        pytester.makeconftest(handle.read())
+    pytester.makepyfile(test_scratch=OFFLINE_TESTS)
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    result.assert_outcomes(passed=2)
+    reports = pytester.path / "reports"
+    assert not (reports / "perf_history.sqlite").exists()
+    assert not (reports / "events").exists() or not any((reports / "events").iterdir())
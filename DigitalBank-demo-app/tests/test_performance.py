@@ -0,0 +1,111 @@
+"""Offline tests for the app performance sampler and baselines."""
+
+import json
+import time
+
+from utilities.performance import (
+    AppiumPerformanceSource,
+    FakePerformanceSource,
+    PerformanceBaselines,
+    PerformanceSampler,
+    TimeSeries,
+)
+
+
+class FakePerfDriver:
+    """Driver double returning Appium-shaped performance data."""
+
+    def __init__(self, shell_output="Janky frames: 7 (3.50%)"):
+        self.shell_output = shell_output
+
+    def get_performance_data(self, package, data_type, timeout):
+        if data_type == "cpuinfo":
+            return [["user", "kernel"], ["12.5", "2.5"]]
+        return [["totalPrivateDirty", "totalPss"], ["1000", "51200"]]
+
+    def execute_script(self, script, args):
+        if isinstance(self.shell_output, Exception):
+            raise self.shell_output
+        return self.shell_output
+
+
+class TestTimeSeries:
+
+    def test_summary_statistics(self):
+        series = TimeSeries("memory_kb")
+        for n, value in enumerate([10, 30, 20, 40]):
+            series.append(float(n), value)
+
+        summary = series.summary()
+        assert len(series) == 4 and series.values.itemsize == 8
+        assert summary["min"] == 10 and summary["max"] == 40 and summary["mean"] == 25
+        assert summary["first"] == 10 and summary["last"] == 40
+        assert TimeSeries("empty").summary() == {}
+
+
+class TestSources:
+
+    def test_appium_source_parses_cpu_memory_and_frames(self):
+        metrics = AppiumPerformanceSource(FakePerfDriver(), package="pkg").sample()
+        assert metrics == {"cpu_percent": 15.0, "memory_kb": 51200.0, "janky_frames": 7.0}
+
+    def test_frames_disabled_after_refused_shell(self):
+        source = AppiumPerformanceSource(FakePerfDriver(RuntimeError("insecure")), package="pkg")
+        assert "janky_frames" not in source.sample()
+        assert source.frames is False
+
+    def test_fake_source_replays_recording(self, tmp_path):
+        path = tmp_path / "login.jsonl"
+        path.write_text("\n".join(json.dumps({"memory_kb": v}) for v in (1, 2)) + "\n")
+        source = FakePerformanceSource.from_file(str(path))
+        assert [source.sample()["memory_kb"] for _ in range(3)] == [1, 2, 2]
+
+
+class TestPerformanceSampler:
+
+    def test_background_sampling(self):
+        samples = [{"cpu_percent": n, "memory_kb": 100 + n} for n in range(5)]
+        with PerformanceSampler(FakePerformanceSource(samples), interval=0.01) as sampler:
+            time.sleep(0.1)
+
+        summary = sampler.summary()
+        assert summary["memory_kb"]["samples"] >= 2
+        assert summary["memory_kb"]["max"] == 104
+        assert summary["cpu_percent"]["first"] == 0
+
+    def test_gives_up_after_consecutive_errors(self):
+        class BrokenSource:
+            def sample(self):
+                raise RuntimeError("not supported")
+
+        sampler = PerformanceSampler(BrokenSource(), interval=0.01, max_errors=3)
+        sampler.start()
+        sampler._thread.join(1)
+        assert not sampler._thread.is_alive()
+        assert sampler.errors == 3
+        assert sampler.stop() == {}
+
+
+class TestPerformanceBaselines:
+
+    def test_regression_above_threshold(self, tmp_path):
+        path = tmp_path / "performance.json"
+        path.write_text(json.dumps({"login": {"memory_kb": 100000, "cpu_percent": 50}}))
+        baselines = PerformanceBaselines(path=str(path), threshold=0.2, update=False)
+
+        within = {"memory_kb": {"max": 110000}, "cpu_percent": {"max": 55}}
+        over = {"memory_kb": {"max": 130000}, "cpu_percent": {"max": 55}}
+        assert baselines.check("login", within, test_id="t::ok") == []
+        regressions = baselines.check("login", over, test_id="t::slow")
+        assert len(regressions) == 1 and "memory_kb" in regressions[0]
+        assert baselines.check("transfer", over) == []  # no baseline yet
+        assert any("REGRESSION" in line for line in baselines.summary_lines())
+
+    def test_update_records_highest_peaks(self, tmp_path):
+        path = tmp_path / "baselines" / "performance.json"
+        baselines = PerformanceBaselines(path=str(path), update=True)
+        baselines.check("transfer", {"memory_kb": {"max": 90}})
+        baselines.check("transfer", {"memory_kb": {"max": 120}, "cpu_percent": {"max": 30}})
+        baselines.save()
+
+        assert json.loads(path.read_text()) == {"transfer": {"memory_kb": 120, "cpu_percent": 30}}
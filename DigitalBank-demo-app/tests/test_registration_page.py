@@ -1,49 +1,78 @@
 """Test cases for Registration Page following SRP (Single Responsibility Principle)."""
 
+import random
+
 import pytest
+from pages.login_page import LoginPage
 from pages.registration_page import RegistrationPage
 from utilities.logger import Logger
 
 logger = Logger.get_logger(__name__)
 
 
-@pytest.mark.usefixtures("setup_and_teardown")
-class TestRegistrationPage:
-    """Test suite for verifying registration page functionality."""
+def open_registration(driver):
+    """Go from the login screen to the registration form."""
+    LoginPage(driver).click_register_link()
+    page = RegistrationPage(driver)
+    page.actions.wait_for_element(page.locators["title"])
+    return page
+
+
+def unused_identity():
+    """An email and SSN no earlier run has registered."""
+    number = random.randrange(10 ** 9)
+    return {
+        "email": f"testuser+{number}@gmail.com",
+        "ssn": f"{random.randint(100, 665)}-{random.randint(10, 99)}-{random.randint(1000, 9999)}",
+    }
+
+
+@pytest.mark.screen_check("registration", navigate=open_registration)
+class TestRegistrationScreen:
+    """Read-only presence checks sharing one session and page-source snapshot."""
 
     @pytest.fixture(autouse=True)
-    def init_page(self, setup_and_teardown):
-        self.driver = setup_and_teardown
-        self.page = RegistrationPage(self.driver)
+    def init_page(self, screen):
+        self.screen = screen
+        self.page = RegistrationPage(screen.driver)
 
     # ---------- FIELD PRESENCE TESTS ---------- #
 
     def test_first_name_field_present(self):
-        assert self.page.is_field_present("first_name")
+        assert self.screen.is_present(self.page.locators["first_name"])
 
     def test_last_name_field_present(self):
-        assert self.page.is_field_present("last_name")
+        assert self.screen.is_present(self.page.locators["last_name"])
 
     def test_email_field_present(self):
-        assert self.page.is_field_present("email")
+        assert self.screen.is_present(self.page.locators["email"])
 
     def test_password_field_present(self):
-        assert self.page.is_field_present("password")
+        assert self.screen.is_present(self.page.locators["password"])
 
     def test_dob_field_present(self):
-        assert self.page.is_field_present("dob")
+        assert self.screen.is_present(self.page.locators["dob"])
 
     def test_address_field_present(self):
-        assert self.page.is_field_present("address")
+        assert self.screen.is_present(self.page.locators["address"])
 
     def test_region_field_present(self):
-        assert self.page.is_field_present("region")
+        assert self.screen.is_present(self.page.locators["region"])
 
     def test_locality_field_present(self):
-        assert self.page.is_field_present("locality")
+        assert self.screen.is_present(self.page.locators["locality"])
 
     def test_register_button_present(self):
-        assert self.page.is_field_present("register_button")
+        assert self.screen.is_present(self.page.locators["register_button"])
+
+
+class TestRegistrationPage:
+    """Test suite for verifying registration page functionality."""
+
+    @pytest.fixture(autouse=True)
+    def init_page(self, driver):
+        self.driver = driver
+        self.page = open_registration(self.driver)
 
     # ---------- VALID INPUT TESTS ---------- #
 
@@ -67,35 +96,20 @@ class TestRegistrationPage:
         self.page.click_register()
         assert True
 
-    # ---------- NEGATIVE TEST CASES ---------- #
-
-    def test_invalid_email_format(self):
-        """Verify that invalid email triggers an error message."""
-        self.page.enter_email("invalid-email")
-        self.page.click_register()
-        error = self.page.get_error_message()
-        assert error is not None and "invalid" in error.lower()
-
-    def test_empty_first_name(self):
-        """Check that first name cannot be empty."""
-        self.page.enter_first_name("")
-        self.page.click_register()
-        error = self.page.get_error_message()
-        assert error is not None and "first name" in error.lower()
-
-    def test_empty_password(self):
-        """Check that password cannot be empty."""
-        self.page.enter_password("")
+    @pytest.mark.perf_flow("registration")
+    def test_successful_registration(self):
+        """Register a new account with every mandatory field filled in."""
+        identity = unused_identity()
+        self.page.enter_first_name("Sowmya")
+        self.page.enter_last_name("Sridhar")
+        self.page.enter_email(identity["email"])
+        self.page.enter_password("StrongPass@123")
+        self.page.enter_ssn(identity["ssn"])
+        self.page.fill_personal_details()
         self.page.click_register()
-        error = self.page.get_error_message()
-        assert error is not None and "password" in error.lower()
+        assert self.page.wait_for_register_outcome() == "success"
 
-    def test_weak_password(self):
-        """Check that weak passwords are rejected."""
-        self.page.enter_password("1234")
-        self.page.click_register()
-        error = self.page.get_error_message()
-        assert error is not None and "weak" in error.lower()
+    # ---------- NEGATIVE TEST CASES ---------- #
 
     def test_missing_mandatory_fields(self):
         """Click register without entering mandatory fields."""
@@ -103,9 +117,45 @@ class TestRegistrationPage:
         error = self.page.get_error_message()
         assert error is not None and "required" in error.lower()
 
-    def test_invalid_ssn(self):
-        """Check that invalid SSN is handled properly."""
-        self.page.enter_ssn("abcd123")
+    # ---------- DATA-DRIVEN NEGATIVE CASES ---------- #
+
+    @pytest.mark.data_source("registration_cases.jsonl", id_fields=["field", "value"])
+    def test_invalid_field_from_dataset(self, data_case):
+        """Check each invalid field value from data/registration_cases.jsonl."""
+        case = data_case.load()
+        getattr(self.page, f"enter_{case['field']}")(case["value"], expect_rejection=True)
         self.page.click_register()
         error = self.page.get_error_message()
-        assert error is not None and "ssn" in error.lower()
+        assert error is not None and case["expected_error"] in error.lower()
+
+    # ---------- COMBINATORIAL CASES ---------- #
+
+    # Only the text fields vary; the other mandatory fields are always filled
+    # in, so exactly the combination with every text field valid registers
+    VALID_TEXT_FIELDS = {
+        "first_name": "Sowmya", "last_name": "Sridhar", "email": "testuser@gmail.com",
+        "password": "StrongPass@123", "ssn": "123-45-6789",
+    }
+
+    @pytest.mark.combinations(
+        {
+            "first_name": ["Sowmya", ""],
+            "last_name": ["Sridhar", ""],
+            "email": ["testuser@gmail.com", "invalid-email", ""],
+            "password": ["StrongPass@123", "1234", ""],
+            "ssn": ["123-45-6789", "abcd123"],
+        },
+        include=[VALID_TEXT_FIELDS],
+    )
+    def test_field_combinations(self, combo):
+        """Pairwise combinations of valid and invalid registration text inputs."""
+        # A valid email or SSN stands for one nobody has registered yet
+        identity = unused_identity()
+        self.page.fill_personal_details()
+        for field, value in combo.items():
+            valid = value == self.VALID_TEXT_FIELDS[field]
+            getattr(self.page, f"enter_{field}")(identity.get(field, value) if valid else value,
+                                                 expect_rejection=not valid)
+        self.page.click_register()
+        expected = "success" if combo == self.VALID_TEXT_FIELDS else "error"
+        assert self.page.wait_for_register_outcome() == expected
@@ -0,0 +1,117 @@
+"""Offline tests for the incremental result cache."""
+
+import time
+import types
+
+import pytest
+
+from pages.login_page import LoginPage
+from pages.registration_page import RegistrationPage
+from utilities.data_provider import DataCase, DataProvider
+from utilities.result_cache import ResultCache
+
+
+def check_login():
+    assert True
+
+
+def check_login_changed():
+    assert 1 == 1
+
+
+class FakeReport:
+    def __init__(self, when="call", outcome="passed", duration=1.5):
+        self.when = when
+        self.outcome = outcome
+        self.duration = duration
+        self.passed = outcome == "passed"
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+
+
+def make_item(function=check_login, page=LoginPage, params=None, nodeid="tests/test_x.py::test_a"):
+    module = types.ModuleType("tests.test_fake")
+    module.Page = page
+    item = types.SimpleNamespace(nodeid=nodeid, function=function, module=module, fixturenames=[])
+    if params is not None:
+        item.callspec = types.SimpleNamespace(params=params)
+    return item
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "result_cache.json")
+
+
+def run(cache_path, item, outcome="passed", **kwargs):
+    cache = ResultCache(cache_path, build="1.4.2 (87)", max_age_hours=24, **kwargs)
+    hit = cache.lookup(item)
+    if hit is None:
+        cache.record(item, FakeReport("setup"))
+        cache.record(item, FakeReport("call", outcome))
+        cache.save()
+    return hit
+
+
+class TestResultCache:
+
+    def test_passing_result_is_reused_for_identical_inputs(self, cache_path):
+        assert run(cache_path, make_item()) is None
+        hit = run(cache_path, make_item())
+
+        assert hit["outcome"] == "passed"
+        assert hit["duration"] == 1.5
+
+    def test_fingerprint_changes_force_a_rerun(self, cache_path):
+        run(cache_path, make_item())
+
+        assert run(cache_path, make_item(function=check_login_changed)) is None
+        assert run(cache_path, make_item(page=RegistrationPage)) is None
+        assert ResultCache(cache_path, build="1.4.3 (88)").lookup(make_item()) is None
+
+    def test_failure_drops_the_cached_pass(self, cache_path):
+        run(cache_path, make_item())
+        item = make_item()
+        cache = ResultCache(cache_path, build="1.4.2 (87)", force=True)
+        cache.lookup(item)
+        cache.record(item, FakeReport("call", "failed"))
+        cache.save()
+
+        assert run(cache_path, make_item()) is None
+
+    def test_expired_and_forced_results_run_again(self, cache_path, monkeypatch):
+        run(cache_path, make_item())
+        assert run(cache_path, make_item(), force=True) is None
+
+        later = time.time() + 25 * 3600
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert run(cache_path, make_item()) is None
+
+    def test_dataset_cases_are_hashed_by_content_without_loading(self, cache_path, tmp_path, monkeypatch):
+        def case(name, rows):
+            path = tmp_path / name
+            path.write_text("amount,description\n" + "".join(f"{row}\n" for row in rows))
+            return list(DataProvider(str(path)).cases())[-1]
+
+        def fingerprint(data_case):
+            return cache.fingerprint(make_item(params={"data_case": data_case}))
+
+        monkeypatch.setattr(DataCase, "load", lambda self: pytest.fail("records must not be loaded"))
+        cache = ResultCache(cache_path, build="1")
+        same = fingerprint(case("a.csv", ["10,rent"]))
+
+        # Same record at another offset, a changed record, a renamed column
+        assert fingerprint(case("b.csv", ["99,gas", "10,rent"])) == same
+        assert fingerprint(case("c.csv", ["11,rent"])) != same
+        path = tmp_path / "d.csv"
+        path.write_text("value,description\n10,rent\n")
+        assert fingerprint(next(DataProvider(str(path)).cases())) != same
+
+    def test_disabled_without_app_build(self, cache_path):
+        cache = ResultCache(cache_path, build="")
+        item = make_item()
+
+        assert cache.lookup(item) is None
+        cache.record(item, FakeReport())
+        cache.save()
+        assert not cache.enabled
@@ -0,0 +1,111 @@
+"""Offline tests for shared-session screen checks."""
+
+import pytest
+
+from utilities.locator_strategies import AppiumBy
+from utilities.screen_checks import ScreenCheckGroups
+
+LOGIN_SOURCE = """<hierarchy>
+  <android.widget.Button class="android.widget.Button" content-desc="Login Button" displayed="true"/>
+  <android.widget.EditText class="android.widget.EditText" content-desc="Enter Password" displayed="true"/>
+</hierarchy>"""
+
+
+class FakeMarker:
+    def __init__(self, name):
+        self.args = (name,)
+
+
+class FakeItem:
+    def __init__(self, nodeid, screen=None):
+        self.nodeid = nodeid
+        self.screen = screen
+
+    def get_closest_marker(self, name):
+        return FakeMarker(self.screen) if self.screen and name == "screen_check" else None
+
+
+class FakeDriver:
+    page_source = LOGIN_SOURCE
+
+    def __init__(self):
+        self.live_lookups = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_elements(self, by, value):
+        self.live_lookups.append((by, value))
+        return []
+
+
+@pytest.fixture
+def sessions():
+    opened, closed = [], []
+
+    def create():
+        opened.append(FakeDriver())
+        return opened[-1]
+
+    groups = ScreenCheckGroups(create_driver=create, quit_driver=closed.append)
+    return groups, opened, closed
+
+
+class TestScreenCheckGroups:
+
+    def test_schedule_keeps_groups_together(self, sessions):
+        groups, _, _ = sessions
+        items = [FakeItem("a", "login"), FakeItem("b"), FakeItem("c", "reg"),
+                 FakeItem("d", "login"), FakeItem("e")]
+
+        assert [item.nodeid for item in groups.schedule(items)] == ["a", "d", "b", "c", "e"]
+
+    def test_one_session_per_group_closed_after_last_check(self, sessions):
+        groups, opened, closed = sessions
+        groups.schedule([FakeItem(str(n), "login") for n in range(3)])
+
+        results = []
+        for _ in range(3):
+            snapshot = groups.acquire("login")
+            results.append(snapshot.is_present((AppiumBy.ACCESSIBILITY_ID, "Login Button")))
+            assert closed == []
+            groups.release("login")
+
+        assert results == [True, True, True]
+        assert len(opened) == 1
+        assert closed == opened
+
+    def test_unsupported_locator_falls_back_to_live_lookup(self, sessions):
+        groups, opened, _ = sessions
+        groups.schedule([FakeItem("a", "login")])
+        snapshot = groups.acquire("login")
+
+        assert snapshot.is_present((AppiumBy.ACCESSIBILITY_ID, "Settings Cog Icon")) is False
+        assert opened[0].live_lookups == []
+        scrollable = (AppiumBy.ANDROID_UIAUTOMATOR, "new UiScrollable(new UiSelector())")
+        assert snapshot.is_present(scrollable) is False
+        assert opened[0].live_lookups == [scrollable]
+
+    def test_session_is_navigated_to_the_screen_before_capture(self, sessions):
+        groups, opened, _ = sessions
+        groups.schedule([FakeItem("a", "registration")])
+
+        def open_registration(driver):
+            driver.page_source = LOGIN_SOURCE.replace("Login Button", "Register Button")
+        snapshot = groups.acquire("registration", navigate=open_registration)
+
+        assert snapshot.driver is opened[0]
+        assert snapshot.is_present((AppiumBy.ACCESSIBILITY_ID, "Register Button"))
+
+    def test_capture_failure_is_reported_to_every_check(self):
+        attempts = []
+
+        def broken():
+            attempts.append(1)
+            raise ConnectionError("no device")
+
+        groups = ScreenCheckGroups(create_driver=broken, quit_driver=lambda driver: None)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="no device"):
+                groups.acquire("login")
+        assert len(attempts) == 1
@@ -0,0 +1,218 @@
+"""Offline tests for scroll-until-found search against a simulated long list."""
+
+import re
+
+import pytest
+
+from config.config import Config
+from pages.registration_page import RegistrationPage
+from pages.transfer_page import TransferPage
+from utilities.locator_strategies import AppiumBy
+from utilities.scroll_search import ScrollSearch, _ui_selector
+
+ROW = 100
+WINDOW = {"width": 500, "height": 1000}
+
+
+class FakeElement:
+
+    def __init__(self, text):
+        self.text = text
+        self.id = f"el-{text}"
+
+    def is_displayed(self):
+        return True
+
+
+class ListDriver:
+    """Screen showing a list of ``rows`` items; only on-screen rows are in the source."""
+
+    def __init__(self, rows=40, android=True):
+        self.rows = rows
+        self.android = android
+        self.offset = 0
+        self.scripts = []
+        self.native = []
+
+    @property
+    def max_offset(self):
+        return self.rows * ROW - WINDOW["height"]
+
+    def on_screen(self):
+        first = self.offset // ROW
+        last = min(self.rows, (self.offset + WINDOW["height"]) // ROW)
+        return [f"Item {i}" for i in range(first, last)]
+
+    @property
+    def page_source(self):
+        if self.android:
+            rows = "".join(f'<android.widget.TextView text="{t}" displayed="true"/>' for t in self.on_screen())
+            return f"<hierarchy><android.widget.ListView>{rows}</android.widget.ListView></hierarchy>"
+        rows = "".join(f'<XCUIElementTypeStaticText name="{t}" visible="true"/>' for t in self.on_screen())
+        return (f"<XCUIElementTypeApplication><XCUIElementTypeTable>{rows}"
+                "</XCUIElementTypeTable></XCUIElementTypeApplication>")
+
+    def get_window_size(self):
+        return dict(WINDOW)
+
+    def _move(self, pixels):
+        self.offset = max(0, min(self.max_offset, self.offset + pixels))
+
+    def execute_script(self, script, args):
+        self.scripts.append((script, args))
+        if script == "mobile: scrollGesture":
+            down = args["direction"] == "down"
+            self._move(int(args["height"] * args["percent"]) * (1 if down else -1))
+            return self.offset < self.max_offset if down else self.offset > 0
+        if script == "mobile: dragFromToForDuration":
+            self._move(args["fromY"] - args["toY"])
+            return None
+        raise ValueError(script)
+
+    def find_element(self, strategy, value):
+        if strategy == AppiumBy.ANDROID_UIAUTOMATOR:
+            self.native.append(value)
+            raise LookupError("UiScrollable not available")
+        text = value
+        if text not in self.on_screen():
+            raise LookupError(value)
+        return FakeElement(text)
+
+    def find_elements(self, strategy, value):
+        return []
+
+
+class UiAutomator2Driver(ListDriver):
+    """Account list behind a spinner; like UiAutomator2 it rejects the ``name`` strategy."""
+
+    capabilities = {"platformName": "Android"}
+
+    def __init__(self):
+        super().__init__(rows=12)
+        self.clicked = []
+
+    def find_element(self, strategy, value):
+        if strategy == AppiumBy.NAME:
+            raise ValueError("InvalidSelectorException: Locator Strategy 'name' is not supported")
+        if strategy == AppiumBy.ID and value.endswith("accountSpinner"):
+            return ClickRecorder(self, "spinner")
+        if strategy == AppiumBy.ANDROID_UIAUTOMATOR:
+            match = re.fullmatch(r'new UiSelector\(\)\.text\("(.*)"\)', value)
+            if match and match.group(1) in self.on_screen():
+                return ClickRecorder(self, match.group(1))
+        return super().find_element(strategy, value)
+
+
+class ClickRecorder(FakeElement):
+
+    def __init__(self, driver, text):
+        super().__init__(text)
+        self.driver = driver
+
+    def click(self):
+        self.driver.clicked.append(self.text)
+
+
+@pytest.fixture(autouse=True)
+def android(monkeypatch):
+    monkeypatch.setattr(Config, "PLATFORM", "android")
+    ScrollSearch.forget()
+    yield
+    ScrollSearch.forget()
+
+
+def item(n):
+    return (AppiumBy.NAME, f"Item {n}")
+
+
+def downward(driver):
+    """Percents of the scrolls that moved down the list."""
+    return [args["percent"] for _, args in driver.scripts if args.get("direction") == "down"]
+
+
+class TestScrollSearch:
+
+    def test_visible_element_needs_no_scrolling(self):
+        driver = ListDriver()
+        element = ScrollSearch(driver, screen="List").find(item(3))
+        assert element.text == "Item 3"
+        assert driver.scripts == []
+
+    def test_steps_grow_while_snapshots_overlap(self):
+        driver = ListDriver()
+        element = ScrollSearch(driver, screen="List", native=False).find(item(25))
+        assert element.text == "Item 25"
+        percents = downward(driver)
+        assert percents[0] == 0.5
+        assert percents[1] == pytest.approx(0.75)
+        assert max(percents) <= Config.SCROLL_MAX_STEP
+
+    def test_remembered_offset_is_reached_in_fewer_scrolls(self):
+        first = ListDriver()
+        ScrollSearch(first, screen="List", native=False).find(item(30))
+
+        second = ListDriver()
+        element = ScrollSearch(second, screen="List", native=False).find(item(30))
+        assert element.text == "Item 30"
+        assert sum(downward(second)) == pytest.approx(sum(downward(first)))
+        assert len(second.scripts) <= len(first.scripts)
+
+        ScrollSearch.forget("List")
+        assert ScrollSearch._offsets == {}
+
+    def test_remembered_offset_counts_from_the_top(self):
+        ScrollSearch(ListDriver(rows=80), screen="List", native=False).find(item(30))
+
+        scrolled = ListDriver(rows=80)
+        scrolled.offset = 1500  # already scrolled; Item 30 is not on screen
+        element = ScrollSearch(scrolled, screen="List", native=False).find(item(30))
+        assert element.text == "Item 30"
+
+    def test_items_above_the_screen_are_found(self):
+        driver = ListDriver()
+        driver.offset = 2000
+        assert ScrollSearch(driver, screen="List", native=False).find(item(2)).text == "Item 2"
+
+    def test_stops_at_the_end_of_the_list(self):
+        driver = ListDriver(rows=15)
+        assert ScrollSearch(driver, screen="List", max_swipes=50, native=False).find(item(99)) is None
+        assert driver.offset == driver.max_offset
+        assert len(driver.scripts) < 10
+
+    def test_native_scroll_into_view_is_tried_first(self):
+        driver = ListDriver()
+        assert ScrollSearch(driver, screen="List").find(item(20)).text == "Item 20"
+        assert driver.native == [
+            'new UiScrollable(new UiSelector().scrollable(true))'
+            '.scrollIntoView(new UiSelector().text("Item 20"))'
+        ]
+
+    def test_ios_scrolls_by_dragging(self, monkeypatch):
+        monkeypatch.setattr(Config, "PLATFORM", "ios")
+        driver = ListDriver(android=False)
+        element = ScrollSearch(driver, screen="List", native=False).find(item(18))
+        assert element.text == "Item 18"
+        assert {script for script, _ in driver.scripts} == {"mobile: dragFromToForDuration"}
+
+    def test_transfer_account_is_selected_on_uiautomator2(self):
+        driver = UiAutomator2Driver()
+        page = TransferPage(driver)
+        page.select_account("Item 2")
+        page.select_account("Item 9")
+        assert driver.clicked == ["spinner", "Item 2", "spinner", "Item 9"]
+
+    def test_field_presence_check_never_scrolls(self):
+        driver = ListDriver()
+        page = RegistrationPage(driver)
+        page.locators["zip"] = item(25)
+        assert not page.is_field_present("zip")
+        assert driver.scripts == [] and driver.offset == 0
+        assert page.scroll_to_field("zip")
+
+
+def test_ui_selector_translation():
+    assert _ui_selector((AppiumBy.ACCESSIBILITY_ID, "Zip Code")) == 'new UiSelector().description("Zip Code")'
+    assert _ui_selector((AppiumBy.ID, "pkg:id/zip")) == 'new UiSelector().resourceId("pkg:id/zip")'
+    assert _ui_selector((AppiumBy.ID, "zip")) == 'new UiSelector().resourceIdMatches(".*:id/zip")'
+    assert _ui_selector((AppiumBy.NAME, 'say "hi"')) == 'new UiSelector().text("say \\"hi\\"")'
+    assert _ui_selector((AppiumBy.XPATH, "//a")) is None
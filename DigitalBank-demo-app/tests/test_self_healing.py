@@ -0,0 +1,171 @@
+"""Offline tests for self-healing locators and the healing cache."""
+
+import json
+import time
+
+import pytest
+
+from config.config import Config
+from utilities.locator_strategies import AppiumBy
+from utilities.self_healing import HealingCache, LocatorHealer, healing
+
+# The login button lost its accessibility id in a new build
+UPDATED_LOGIN_SOURCE = """<hierarchy>
+  <android.widget.EditText class="android.widget.EditText" content-desc="Enter Email Address" displayed="true"/>
+  <android.widget.Button class="android.widget.Button" text="Login" displayed="true"
+      resource-id="xyz.digitalbank.demo:id/loginButton"/>
+  <android.widget.TextView class="android.widget.TextView" text="Login" displayed="true"/>
+</hierarchy>"""
+
+LOGIN_BUTTON = healing(
+    (AppiumBy.ACCESSIBILITY_ID, "Login Button"),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Login")'),
+    (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton"),
+)
+
+
+class FakeElement:
+    def __init__(self, locator, displayed=True):
+        self.locator = locator
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class FakeDriver:
+    """Driver double that only finds locators in ``present``, ``hidden`` or ``repeated``."""
+
+    def __init__(self, present, hidden=(), repeated=()):
+        self.present = set(present)
+        self.hidden = set(hidden)
+        self.repeated = set(repeated)
+        self.lookups = []
+        self.sources = 0
+        self.implicit_wait = 10
+        self.waits = []
+
+    def find_element(self, by, value):
+        self.lookups.append((by, value))
+        if (by, value) not in self.present:
+            raise LookupError(f"no such element: {by}={value}")
+        return FakeElement((by, value))
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def find_elements(self, by, value):
+        self.lookups.append((by, value))
+        self.waits.append(self.implicit_wait)
+        if (by, value) in self.repeated:
+            return [FakeElement((by, value)), FakeElement((by, value))]
+        if (by, value) in self.hidden:
+            return [FakeElement((by, value), displayed=False)]
+        return [FakeElement((by, value))] if (by, value) in self.present else []
+
+    @property
+    def page_source(self):
+        self.sources += 1
+        return UPDATED_LOGIN_SOURCE
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HealingCache(path=str(tmp_path / "healing_cache.json"), ttl_hours=24)
+
+
+class TestHealingLocator:
+
+    def test_behaves_as_primary_tuple(self):
+        by, value = LOGIN_BUTTON
+        assert (by, value) == (AppiumBy.ACCESSIBILITY_ID, "Login Button")
+        assert LOGIN_BUTTON == (AppiumBy.ACCESSIBILITY_ID, "Login Button")
+        assert len(LOGIN_BUTTON.alternates) == 2
+
+
+class TestLocatorHealer:
+
+    def test_healthy_primary_needs_no_snapshot(self, cache):
+        driver = FakeDriver(present=[tuple(LOGIN_BUTTON)])
+        element = LocatorHealer(driver, page="LoginPage", cache=cache).find_element(LOGIN_BUTTON, "login_button")
+        assert element.locator == tuple(LOGIN_BUTTON)
+        assert driver.sources == 0 and cache.entries() == []
+
+    def test_heals_with_first_unambiguous_alternate_and_caches_it(self, cache):
+        resource_id = (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton")
+        driver = FakeDriver(present=[resource_id])
+        healer = LocatorHealer(driver, page="LoginPage", cache=cache)
+
+        # text("Login") matches two nodes, so the resource id wins
+        assert healer.find_element(LOGIN_BUTTON, "login_button").locator == resource_id
+        assert driver.sources == 1
+
+        driver.lookups.clear()
+        assert healer.find_element(LOGIN_BUTTON, "login_button").locator == resource_id
+        assert driver.lookups == [resource_id]  # straight to the cached winner
+        assert driver.sources == 1
+
+        cache.save()
+        reloaded = HealingCache(path=cache.path, ttl_hours=24)
+        [line] = reloaded.report_lines()
+        assert line.startswith("LoginPage.login_button: accessibility id 'Login Button' -> id ")
+        assert "used 2x" in line
+
+    def test_unhealable_miss_raises_original_error(self, cache):
+        driver = FakeDriver(present=[])
+        broken = healing((AppiumBy.ACCESSIBILITY_ID, "Gone"), (AppiumBy.ACCESSIBILITY_ID, "Also gone"))
+        with pytest.raises(LookupError, match="Gone"):
+            LocatorHealer(driver, cache=cache).find_element(broken, "gone")
+
+    def test_stale_winner_is_dropped(self, cache):
+        resource_id = (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton")
+        cache.put("LoginPage.login_button", tuple(LOGIN_BUTTON), resource_id)
+        driver = FakeDriver(present=[tuple(LOGIN_BUTTON)])  # primary fixed again
+
+        healer = LocatorHealer(driver, page="LoginPage", cache=cache)
+        assert healer.find_element(LOGIN_BUTTON, "login_button").locator == tuple(LOGIN_BUTTON)
+        assert cache.entries() == []
+
+    def test_cached_winner_is_looked_up_without_waiting(self, cache):
+        resource_id = (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton")
+        cache.put("LoginPage.login_button", tuple(LOGIN_BUTTON), resource_id)
+        driver = FakeDriver(present=[resource_id])
+        assert LocatorHealer(driver, page="LoginPage", cache=cache).find_element(
+            LOGIN_BUTTON, "login_button").locator == resource_id
+        assert driver.waits == [0] and driver.implicit_wait == Config.IMPLICIT_WAIT
+
+    @pytest.mark.parametrize("state", ["hidden", "repeated"])
+    def test_cached_winner_must_match_one_displayed_element(self, cache, state):
+        resource_id = (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton")
+        cache.put("LoginPage.login_button", tuple(LOGIN_BUTTON), resource_id)
+        driver = FakeDriver(present=[tuple(LOGIN_BUTTON)], **{state: [resource_id]})
+
+        healer = LocatorHealer(driver, page="LoginPage", cache=cache)
+        assert healer.find_element(LOGIN_BUTTON, "login_button").locator == tuple(LOGIN_BUTTON)
+        assert cache.entries() == []
+
+    def test_presence_check_neither_heals_nor_drops_the_cache(self, cache):
+        resource_id = (AppiumBy.ID, "xyz.digitalbank.demo:id/loginButton")
+        cache.put("LoginPage.login_button", tuple(LOGIN_BUTTON), resource_id)
+        driver = FakeDriver(present=[])  # another screen is showing
+
+        healer = LocatorHealer(driver, page="LoginPage", cache=cache)
+        with pytest.raises(LookupError):
+            healer.find_element(LOGIN_BUTTON, "login_button", heal=False)
+        assert driver.sources == 0
+        assert [entry["strategy"] for entry in cache.entries()] == [AppiumBy.ID]
+
+
+class TestHealingCache:
+
+    def test_unused_entries_expire(self, tmp_path):
+        path = tmp_path / "healing_cache.json"
+        old = time.time() - 48 * 3600
+        path.write_text(json.dumps({
+            "android|LoginPage.email|accessibility id=Enter Email Address": {
+                "name": "LoginPage.email", "primary": ["accessibility id", "Enter Email Address"],
+                "strategy": "id", "value": "emailInput", "healed": old, "last_used": old, "uses": 3,
+            }
+        }))
+        assert HealingCache(path=str(path), ttl_hours=24).entries() == []
+        assert len(HealingCache(path=str(path), ttl_hours=72).entries()) == 1
@@ -0,0 +1,24 @@
+"""Guards that importing the framework stays free of heavy dependencies."""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_startup import FRAMEWORK_MODULES, HEAVY_PACKAGES
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_framework_import_is_lazy(tmp_path):
+    script = (
+        "import sys\n"
+        f"for name in {FRAMEWORK_MODULES!r}: __import__(name)\n"
+        f"print(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_PACKAGES!r})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+        cwd=tmp_path, env={**os.environ, "PYTHONPATH": PROJECT_ROOT},
+    )
+
+    assert result.stdout.strip() == "[]"
+    assert os.listdir(tmp_path) == [], "import created log or artifact directories"
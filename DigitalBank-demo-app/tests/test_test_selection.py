@@ -0,0 +1,170 @@
+"""Offline tests for change-based test selection."""
+
+import subprocess
+import textwrap
+
+import pytest
+
+from utilities.events import EventBus, JsonlSink
+from utilities.test_selection import ImpactSelector, PageModuleIndex, changed_lines
+
+PAGE = textwrap.dedent('''\
+    from utilities.events import page_action
+
+
+    class CheckoutPage:
+        def __init__(self, driver):
+            self.driver = driver
+            self.locators = {
+                "amount": ("id", "amountEditText"),
+                "submit": ("id", "submitButton"),
+            }
+
+        @property
+        def amount_field(self):
+            return self.driver.find_element(*self.locators["amount"])
+
+        @page_action("amount")
+        def enter_amount(self, amount):
+            self.amount_field.send_keys(amount)
+
+        @page_action("submit")
+        def submit(self):
+            self.driver.find_element(*self.locators["submit"]).click()
+''')
+
+TESTS = textwrap.dedent('''\
+    import pytest
+    from pages.checkout_page import CheckoutPage
+
+
+    @pytest.fixture
+    def page(driver):
+        return CheckoutPage(driver)
+
+
+    def test_amount(page):
+        page.enter_amount("10")
+
+
+    class TestSubmit:
+        def test_submit(self, page):
+            page.submit()
+
+        @pytest.mark.data_source("payments.csv")
+        def test_from_data(self, page, data_case):
+            page.submit()
+''')
+
+CONFTEST = "from utilities.events import EventBus\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = {
+        "pages/checkout_page.py": PAGE,
+        "tests/test_checkout.py": TESTS,
+        "tests/test_helpers.py": "from utilities.money import parse\n\ndef test_parse():\n    parse('1')\n",
+        "tests/conftest.py": CONFTEST,
+        "utilities/events.py": "",
+        "utilities/money.py": "",
+        "config/config.py": "",
+    }
+    for path, source in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(source)
+    return tmp_path
+
+
+@pytest.fixture
+def selector(project):
+    return ImpactSelector(root=str(project), map_path=str(project / "test_map.json"))
+
+
+class TestPageModuleIndex:
+
+    def test_locator_change_reaches_methods_through_properties(self):
+        index = PageModuleIndex("pages/checkout_page.py", PAGE)
+        assert index.affected({8}) == {"CheckoutPage": {"amount_field", "enter_amount"}}
+        assert index.affected({9}) == {"CheckoutPage": {"submit"}}
+
+    def test_construction_and_import_changes_affect_the_whole_class(self):
+        index = PageModuleIndex("pages/checkout_page.py", PAGE)
+        assert index.affected({6}) == {"CheckoutPage": None}
+        assert index.affected({1}) == {"CheckoutPage": None}
+
+
+class TestImpactSelector:
+
+    def test_changed_locator_selects_only_its_tests(self, selector):
+        selection = selector.select({"pages/checkout_page.py": {9}})
+        assert not selection.full
+        assert selection.tests == [
+            "tests/test_checkout.py::TestSubmit::test_from_data",
+            "tests/test_checkout.py::TestSubmit::test_submit",
+        ]
+
+    def test_shared_infrastructure_runs_everything(self, selector):
+        assert selector.select({"utilities/events.py": {1}}).full
+        assert selector.select({"config/config.py": {1}}).full
+        assert selector.select({"tests/conftest.py": {1}}).full
+
+    def test_other_changes(self, selector):
+        assert selector.select({"utilities/money.py": {1}}).tests == ["tests/test_helpers.py::test_parse"]
+        assert selector.select({"data/payments.csv": {2}}).tests == [
+            "tests/test_checkout.py::TestSubmit::test_from_data"
+        ]
+        assert selector.select({"README.md": {1}}).tests == []
+
+    def test_recorded_run_adds_calls_made_through_helpers(self, selector, project, monkeypatch):
+        # test_parse reaches the page through a helper the static scan cannot follow
+        events = project / "events.jsonl"
+        sink = JsonlSink(str(events))
+        monkeypatch.setattr(EventBus, "sinks", [sink])
+        EventBus.set_test("tests/test_helpers.py::test_parse")
+        EventBus.emit("submit", page="CheckoutPage")
+        EventBus.set_test(None)
+        sink.close()
+
+        mapping = ImpactSelector.record([str(events)], map_path=selector.map_path)
+        assert mapping == {"tests/test_helpers.py::test_parse": ["CheckoutPage.submit"]}
+        assert "tests/test_helpers.py::test_parse" in selector.select({"pages/checkout_page.py": {9}}).tests
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+def test_changed_lines_from_git(project):
+    _git(project, "init", "-q")
+    _git(project, "add", ".")
+    _git(project, "commit", "-q", "-m", "base")
+    page = project / "pages" / "checkout_page.py"
+    page.write_text(PAGE.replace("submitButton", "sendButton"))
+    (project / "data").mkdir()
+    (project / "data" / "payments.csv").write_text("amount\n1\n")
+    _git(project, "add", "data")
+    (project / "tests" / "test_refunds.py").write_text("def test_refund():\n    pass\n")  # untracked
+
+    assert changed_lines("HEAD", str(project)) == {
+        "pages/checkout_page.py": {9},
+        "data/payments.csv": None,
+        "tests/test_refunds.py": None,
+    }
+
+
+def test_changes_outside_the_project_are_seen(tmp_path):
+    app = tmp_path / "app"
+    (app / "pages").mkdir(parents=True)
+    (app / "pages" / "checkout_page.py").write_text(PAGE)
+    (tmp_path / "requirements.txt").write_text("Appium-Python-Client\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    (tmp_path / "requirements.txt").write_text("Appium-Python-Client==4.0\n")
+
+    changes = changed_lines("HEAD", str(app))
+    assert changes == {"../requirements.txt": {1}}
+    selection = ImpactSelector(root=str(app), map_path=str(app / "test_map.json")).select(changes)
+    assert selection.full and "requirements.txt" in selection.reason
@@ -0,0 +1,157 @@
+"""Offline tests for keyboard-free text entry with read-back verification."""
+
+import pytest
+
+from config.config import Config
+from pages.transfer_page import TransferPage
+from utilities.histogram import LatencyHistogram
+from utilities.mobile_actions import MobileActions
+from utilities.text_entry import TextEntry, TextNotEntered
+
+
+class FakeField:
+    """Input field recording how its value was set; typing opens the keyboard."""
+
+    def __init__(self, driver, hint="Email Address", value="", masked=False):
+        self.driver = driver
+        self.id = "field-1"
+        self.hint = hint
+        self.value = value
+        self.masked = masked
+        self.calls = []
+
+    def _shown(self):
+        if not self.value:
+            return self.hint
+        return "•" * len(self.value) if self.masked else self.value
+
+    @property
+    def text(self):
+        return self._shown()
+
+    def get_attribute(self, name):
+        return self._shown() if name == "value" else None
+
+    def clear(self):
+        self.calls.append("clear")
+        self.value = ""
+
+    def send_keys(self, text):
+        self.calls.append("send_keys")
+        self.driver.keyboard_shown = True
+        self.value += text
+
+
+class FakeDriver:
+
+    def __init__(self, replace_supported=True, replace_drops=0):
+        self.keyboard_shown = False
+        self.replace_supported = replace_supported
+        self.replace_drops = replace_drops
+        self.field = FakeField(self)
+        self.scripts = []
+
+    def execute_script(self, script, args):
+        self.scripts.append((script, args))
+        if script != "mobile: replaceElementValue" or not self.replace_supported:
+            raise ValueError(f"Unknown mobile command '{script}'")
+        assert args["elementId"] == self.field.id
+        # A dropped suffix imitates an IME or input filter rejecting characters
+        self.field.value = args["text"][:len(args["text"]) - self.replace_drops]
+
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch):
+    monkeypatch.setattr(Config, "PLATFORM", "android")
+    monkeypatch.setattr(TextEntry, "typed", False)
+    monkeypatch.setattr(TextEntry, "latency", {m: LatencyHistogram() for m in TextEntry.METHODS})
+
+
+class TestTextEntry:
+
+    def test_android_sets_the_value_without_the_keyboard(self):
+        driver = FakeDriver()
+        driver.field.value = "old@example.com"
+        assert TextEntry(driver).enter(driver.field, "john@example.com") == "replace"
+        assert driver.field.value == "john@example.com"
+        assert driver.field.calls == []
+        assert not driver.keyboard_shown
+
+    def test_keystrokes_marker_types_key_by_key(self, monkeypatch):
+        monkeypatch.setattr(TextEntry, "typed", True)
+        driver = FakeDriver()
+        assert TextEntry(driver).enter(driver.field, "john@example.com") == "typed"
+        assert driver.field.calls == ["clear", "send_keys"]
+        assert driver.scripts == []
+
+    def test_typed_mode_and_appending_type(self):
+        driver = FakeDriver()
+        assert TextEntry(driver, mode="typed").enter(driver.field, "a") == "typed"
+        assert TextEntry(driver).enter(driver.field, "b", clear=False) == "typed"
+        assert driver.field.value == "ab"
+
+    def test_ios_types_then_verifies_the_value_attribute(self, monkeypatch):
+        monkeypatch.setattr(Config, "PLATFORM", "ios")
+        driver = FakeDriver()
+        assert TextEntry(driver).enter(driver.field, 42) == "typed"
+        assert driver.field.value == "42"
+        assert driver.scripts == []
+
+    def test_unsupported_setter_falls_back_to_typing(self):
+        driver = FakeDriver(replace_supported=False)
+        assert TextEntry(driver).enter(driver.field, "john@example.com") == "typed"
+        assert driver.field.value == "john@example.com"
+
+    def test_mismatch_after_replace_retypes_once(self):
+        driver = FakeDriver(replace_drops=1)
+        assert TextEntry(driver).enter(driver.field, "1000.50") == "typed"
+        assert driver.field.value == "1000.50"
+        assert len(TextEntry.latency["typed"]) == 1 and not len(TextEntry.latency["replace"])
+
+    def test_unverifiable_value_raises(self):
+        driver = FakeDriver(replace_supported=False)
+        driver.field.send_keys = lambda text: None  # keystrokes are lost
+        with pytest.raises(TextNotEntered, match="'Email Address'"):
+            TextEntry(driver).enter(driver.field, "john@example.com")
+
+    def test_only_expected_rejections_are_left_to_the_app(self):
+        driver = FakeDriver(replace_drops=3)
+        driver.capabilities = {"platformName": "Android"}
+        driver.find_element = lambda strategy, value: driver.field
+        driver.field.hint = "Enter Amount"
+        driver.field.send_keys = lambda text: None  # numeric field filters out letters
+        page = TransferPage(driver)
+        with pytest.raises(TextNotEntered):
+            page.enter_amount("abc")
+        page.enter_amount("abc", expect_rejection=True)
+        assert driver.field.text == "Enter Amount"
+
+    def test_send_keys_lets_a_mismatch_fail_the_test(self):
+        driver = FakeDriver(replace_supported=False)
+        driver.find_element = lambda strategy, value: driver.field
+        driver.field.is_displayed = lambda: True
+        driver.field.send_keys = lambda text: None
+        with pytest.raises(TextNotEntered):
+            MobileActions(driver).send_keys(("id", "email"), "john@example.com")
+
+    def test_secret_values_are_checked_by_length_only(self):
+        driver = FakeDriver()
+        driver.field.masked = True
+        assert TextEntry(driver).enter(driver.field, "Test@1234", secret=True) == "replace"
+
+        driver.replace_drops = 2
+        driver.field.send_keys = lambda text: None
+        with pytest.raises(TextNotEntered) as error:
+            TextEntry(driver).enter(driver.field, "Test@1234", secret=True)
+        assert "Test@1234" not in str(error.value)
+
+    def test_latency_is_summarised_per_method(self):
+        driver = FakeDriver()
+        entry = TextEntry(driver)
+        entry.enter(driver.field, "a")
+        TextEntry(driver, mode="typed").enter(driver.field, "b")
+        lines = TextEntry.summary_lines()
+        assert [line.split()[0] for line in lines] == ["replace", "typed"]
+
+        results = entry.benchmark(driver.field, "john@example.com", runs=3)
+        assert {method: len(h) for method, h in results.items()} == {"replace": 3, "typed": 3}
@@ -0,0 +1,70 @@
+"""Offline tests for span tracing and Chrome trace export."""
+
+import json
+
+import pytest
+
+from utilities.tracing import Tracer, traced, traced_class
+
+
+@traced_class()
+class FakeActions:
+
+    def click(self, driver):
+        return driver.execute("findElement", {"using": "id", "value": "submit"})
+
+
+class FakeDriver:
+
+    def execute(self, driver_command, params=None):
+        return {"command": driver_command}
+
+
+@traced()
+def select_account(actions, driver):
+    return actions.click(driver)
+
+
+@pytest.fixture
+def recording():
+    Tracer.reset()
+    Tracer.recording = True
+    yield
+    Tracer.reset()
+
+
+class TestTracer:
+
+    def test_nested_spans_export_as_chrome_trace(self, recording, tmp_path):
+        driver = Tracer.instrument_driver(FakeDriver())
+        with Tracer.span("test_valid_transaction", "test"):
+            select_account(FakeActions(), driver)
+
+        path = Tracer.export(str(tmp_path / "trace.json"))
+        with open(path, encoding="utf-8") as handle:
+            events = [e for e in json.load(handle)["traceEvents"] if e["ph"] == "X"]
+
+        by_name = {event["name"]: event for event in events}
+        assert set(by_name) == {
+            "test_valid_transaction", "select_account",
+            "FakeActions.click", "HTTP findElement",
+        }
+        assert by_name["HTTP findElement"]["args"]["parent"] == "FakeActions.click"
+        assert by_name["FakeActions.click"]["args"]["parent"] == "select_account"
+        outer, inner = by_name["select_account"], by_name["HTTP findElement"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_nothing_is_recorded_when_not_sampled(self, tmp_path):
+        Tracer.recording = False
+        select_account(FakeActions(), Tracer.instrument_driver(FakeDriver()))
+        assert Tracer.export(str(tmp_path / "trace.json")) == ""
+
+    def test_exception_is_recorded_on_span(self, recording, tmp_path):
+        with pytest.raises(ValueError):
+            with Tracer.span("failing"):
+                raise ValueError("boom")
+
+        with open(Tracer.export(str(tmp_path / "trace.json")), encoding="utf-8") as handle:
+            span = [e for e in json.load(handle)["traceEvents"] if e["ph"] == "X"][0]
+        assert span["args"]["error"] == "ValueError"
@@ -0,0 +1,138 @@
+"""Offline tests for the transfer load mode."""
+
+import threading
+
+import pytest
+
+from config.config import Config
+from pages.transfer_page import TransferPage
+from utilities.transfer_load import TransferLoad, transfer_transaction
+
+CASES = [{"account": "Savings", "amount": "10", "description": "load"}]
+
+
+class FakeTransferPage:
+    """Page double recording the flow's calls."""
+
+    def __init__(self, outcome="success"):
+        self.calls = []
+        self.outcome = outcome
+
+    def __getattr__(self, name):
+        def action(*args):
+            self.calls.append(name)
+            return self.outcome if name == "wait_for_submit_outcome" else None
+        return action
+
+
+class ConfirmationDriver:
+    """Android session on the confirmation screen; the form is ``screens_back`` back presses away."""
+
+    capabilities = {"platformName": "Android"}
+
+    def __init__(self, screens_back):
+        self.screens_back = screens_back
+        self.backs = 0
+
+    def back(self):
+        self.backs += 1
+
+    def find_element(self, strategy, value):
+        from selenium.common.exceptions import NoSuchElementException
+
+        if value.endswith("amountEditText") and self.backs >= self.screens_back:
+            return FakeField()
+        raise NoSuchElementException(value)
+
+
+class FakeField:
+
+    def is_displayed(self):
+        return True
+
+
+class FakeClock:
+    """Clock that only moves when a transaction or sleep advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+    def transaction(self, seconds, fail_every=0):
+        count = [0]
+
+        def transaction(page, case):
+            with self.lock:
+                count[0] += 1
+                self.now += seconds
+                return not (fail_every and count[0] % fail_every == 0)
+        transaction.count = count
+        return transaction
+
+
+class TestTransferLoad:
+
+    def test_transfer_transaction_runs_the_page_flow(self):
+        page = FakeTransferPage()
+        assert transfer_transaction(page, CASES[0])
+        assert page.calls == ["select_account", "enter_amount", "enter_description",
+                              "select_credit", "submit_transaction", "wait_for_submit_outcome"]
+        assert not transfer_transaction(FakeTransferPage("error"), CASES[0])
+
+    def test_closed_loop_excludes_warmup_and_counts_errors(self):
+        clock = FakeClock()
+        transaction = clock.transaction(1, fail_every=4)
+        load = TransferLoad([object(), object()], CASES, transaction=transaction,
+                            duration=30, warmup=10, interval=10, clock=clock, sleep=clock.sleep)
+        report = load.run()
+
+        assert report.sessions == 2
+        # one clock unit per transaction across both sessions; warm-up ones are not counted
+        assert report.transactions == pytest.approx(30, abs=2)
+        assert transaction.count[0] == pytest.approx(40, abs=2)
+        assert 0 < report.errors < report.transactions
+        assert report.histogram.percentile(50) >= 1_000_000
+        assert sum(interval.transactions for interval in report.intervals) == report.transactions
+
+    def test_fixed_rate_counts_queueing_delay(self):
+        # 50ms transactions scheduled every 20ms fall behind; latency from the
+        # scheduled start grows instead of hiding the backlog
+        clock = FakeClock()
+        load = TransferLoad([object()], CASES, transaction=clock.transaction(0.05), mode="fixed",
+                            rate=50, duration=0.4, warmup=0, interval=0.2, clock=clock, sleep=clock.sleep)
+        report = load.run()
+
+        assert report.histogram.percentile(99) > 2 * report.histogram.percentile(0)
+        assert report.histogram.max > 100_000
+
+    def test_reset_after_every_transaction_and_validation(self):
+        clock = FakeClock()
+        resets = []
+        transaction = clock.transaction(1, fail_every=2)
+        load = TransferLoad([object()], CASES, transaction=transaction,
+                            duration=5, warmup=0, reset=resets.append, clock=clock, sleep=clock.sleep)
+        report = load.run()
+        assert report.errors and report.errors < report.transactions
+        assert len(resets) == transaction.count[0]
+
+        with pytest.raises(ValueError):
+            TransferLoad([object()], CASES, mode="fixed")
+        with pytest.raises(ValueError):
+            TransferLoad([object()], [])
+
+    def test_return_to_form_goes_back_from_the_confirmation(self, monkeypatch):
+        monkeypatch.setattr(Config, "LOAD_RESET_TIMEOUT", 0.05)
+        driver = ConfirmationDriver(screens_back=1)
+        assert TransferPage(driver).return_to_form()
+        assert driver.backs == 1
+        assert TransferPage(driver).return_to_form() and driver.backs == 1
+
+        assert not TransferPage(ConfirmationDriver(screens_back=5)).return_to_form(attempts=2)
@@ -1,13 +1,9 @@
 import pytest
-from pages.transferpage import TransferPage
-from utilities.driverfactory import DriverFactory
+from pages.transfer_page import TransferPage
 
 @pytest.fixture(scope="function")
-def transfer_page(request):
-    driver = DriverFactory.get_driver()
-    page = TransferPage(driver)
-    yield page
-    driver.quit()
+def transfer_page(driver):
+    return TransferPage(driver)
 
 # ---------------------- Field Presence Tests ----------------------
 def test_fields_presence(transfer_page):
@@ -18,27 +14,47 @@ def test_fields_presence(transfer_page):
     assert transfer_page.submit_button.is_displayed(), "Submit button not present"
 
 # ---------------------- Valid Tests ----------------------
-@pytest.mark.parametrize("account, amount, description", [
-    ("Individual Savings - 1000393.0", "1000", "Salary Deposit"),
-    ("Individual Savings - 1000393.0", "500", "Gift Transfer")
-])
-def test_valid_transaction(transfer_page, account, amount, description):
-    transfer_page.select_account(account)
-    transfer_page.enter_amount(amount)
-    transfer_page.enter_description(description)
+@pytest.mark.data_source("transfer_cases.csv", where="expected == 'success'",
+                         id_fields=["amount", "description"])
+@pytest.mark.perf_flow("transfer")
+def test_valid_transaction(transfer_page, data_case):
+    case = data_case.load()
+    transfer_page.select_account(case["account"])
+    transfer_page.enter_amount(case["amount"])
+    transfer_page.enter_description(case["description"])
     transfer_page.select_credit()
     transfer_page.submit_transaction()
-    # add assertion here based on toast/message/confirmation element after submit
+    assert transfer_page.wait_for_submit_outcome() == "success", "Transaction was not confirmed"
 
 # ---------------------- Negative Tests ----------------------
-@pytest.mark.parametrize("amount, description", [
-    ("", "Salary Deposit"),       # Empty amount
-    ("abc", "Salary Deposit"),    # Invalid amount
-    ("100", ""),                  # Empty description
-])
-def test_invalid_transaction(transfer_page, amount, description):
-    transfer_page.enter_amount(amount)
-    transfer_page.enter_description(description)
+@pytest.mark.data_source("transfer_cases.csv", where="expected == 'error'",
+                         id_fields=["amount", "description"])
+def test_invalid_transaction(transfer_page, data_case):
+    case = data_case.load()
+    transfer_page.enter_amount(case["amount"], expect_rejection=True)
+    transfer_page.enter_description(case["description"], expect_rejection=True)
     transfer_page.select_credit()
     transfer_page.submit_transaction()
-    # add assertion here for validation message or error
+    assert transfer_page.wait_for_submit_outcome() == "error", "Validation error not shown"
+
+# ---------------------- Combinatorial Tests ----------------------
+VALID_AMOUNTS = ("1000", "0.01")
+# Every combination transfers from one named account; the account is not a factor
+TRANSFER_ACCOUNT = "Individual Savings - 1000393.0"
+
+@pytest.mark.combinations(
+    {
+        "amount": ["1000", "0.01", "", "abc"],
+        "description": ["Salary Deposit", "", "Rent, March"],
+        "credit": [True, False],
+    },
+    id_fields=["amount", "description", "credit"],
+)
+def test_transfer_field_combinations(transfer_page, combo):
+    transfer_page.select_account(TRANSFER_ACCOUNT)
+    transfer_page.enter_amount(combo["amount"], expect_rejection=combo["amount"] not in VALID_AMOUNTS)
+    transfer_page.enter_description(combo["description"])
+    transfer_page.set_credit(combo["credit"])
+    transfer_page.submit_transaction()
+    expected = "success" if combo["amount"] in VALID_AMOUNTS and combo["description"] else "error"
+    assert transfer_page.wait_for_submit_outcome() == expected
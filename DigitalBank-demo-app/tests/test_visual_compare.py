@@ -0,0 +1,86 @@
+"""Offline tests for golden-image screenshot comparison."""
+
+import io
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from utilities.artifact_store import ArtifactStore
+from utilities.visual_compare import VisualComparator
+
+
+def _png(frame):
+    buffer = io.BytesIO()
+    Image.fromarray(frame).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def comparator(tmp_path):
+    VisualComparator.clear_cache()
+    return VisualComparator(golden_dir=str(tmp_path), downscale=2,
+                            pixel_threshold=24, tolerance=0.01)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 256, size=(200, 100, 3), dtype=np.uint8)
+
+
+class TestVisualComparator:
+
+    def test_first_run_records_golden(self, comparator, frame):
+        result = comparator.compare(_png(frame), "login")
+        assert result.matched
+        assert os.path.exists(comparator.golden_path("login"))
+
+    def test_identical_frame_matches(self, comparator, frame):
+        comparator.compare(_png(frame), "login")
+        result = comparator.compare(_png(frame), "login")
+        assert result.matched and result.changed_pixels == 0
+
+    def test_changes_inside_status_bar_are_ignored(self, comparator, frame):
+        comparator.compare(_png(frame), "login")
+        changed = frame.copy()
+        changed[:8] = 255 - changed[:8]
+        assert comparator.compare(_png(changed), "login").matched
+
+    def test_changes_outside_mask_fail(self, comparator, frame, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "utilities.artifact_store.ArtifactStore._instance",
+            ArtifactStore(root=str(tmp_path / "artifacts")),
+        )
+        comparator.compare(_png(frame), "login")
+        changed = frame.copy()
+        changed[100:140] = 255 - changed[100:140]
+        result = comparator.compare(_png(changed), "login")
+        assert not result.matched
+        assert result.diff_ratio > comparator.tolerance
+        assert result.diff_path
+
+    def test_list_masks_are_accepted(self, tmp_path, frame):
+        # e.g. masks read from a JSON file
+        comparator = VisualComparator(golden_dir=str(tmp_path), downscale=2, pixel_threshold=24,
+                                      tolerance=0.01, masks=[[0.0, 0.0, 1.0, 0.04]])
+        comparator.compare(_png(frame), "login")
+        changed = frame.copy()
+        changed[:8] = 255 - changed[:8]
+        changed[100:140] = 255 - changed[100:140]
+        assert comparator.compare(_png(changed), "login", masks=[[0.0, 0.5, 1.0, 0.7]]).matched
+
+    def test_decoded_golden_is_cached(self, comparator, frame):
+        comparator.compare(_png(frame), "login")
+        comparator.compare(_png(frame), "login")
+        comparator.compare(_png(frame), "login")
+        info = VisualComparator._load_golden.cache_info()
+        assert info.misses == 1 and info.hits == 1
+
+    def test_array_golden_survives_downscaling(self, comparator, frame):
+        luminance = comparator._to_luminance(_png(frame))
+        comparator.compare(luminance, "login")
+        result = comparator.compare(luminance, "login")
+        assert result.matched and result.changed_pixels == 0
+        assert comparator.compare(_png(frame), "login").matched
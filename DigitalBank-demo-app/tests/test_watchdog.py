@@ -0,0 +1,249 @@
+"""Tests for the per-test watchdog, against a stub server that hangs commands."""
+
+import os
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from utilities.artifact_store import ArtifactStore
+from utilities.watchdog import Watchdog, WatchdogTimeout
+
+pytest_plugins = ("pytester",)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fails just inside its budget; capturing evidence for the failure then
+# outlasts the budget, while pytest is making the report
+SLOW_EVIDENCE_TESTS = """
+import time
+
+import pytest
+
+
+class SlowSourceDriver:
+    session_id = "abc123"
+    capabilities = {"platformName": "Android"}
+    sources = 0
+
+    def get_screenshot_as_png(self):
+        return b"\\x89PNG fake"
+
+    @property
+    def page_source(self):
+        # Only the report's capture is slow; the watchdog's own reclaim is quick
+        SlowSourceDriver.sources += 1
+        if SlowSourceDriver.sources == 1:
+            time.sleep(1.0)
+        return "<hierarchy/>"
+
+    def get_log(self, log_type):
+        return []
+
+
+@pytest.fixture
+def driver():
+    return SlowSourceDriver()
+
+
+@pytest.mark.time_budget(1)
+def test_fails_late(driver):
+    time.sleep(0.8)
+    assert False, "failed inside the budget"
+
+
+def test_next():
+    pass
+"""
+
+# Time out inside the driver fixture: first while the session is being
+# created, then while queued behind a held slot (one slot in all)
+HUNG_SETUP_TESTS = """
+import time
+
+import pytest
+from appium import webdriver
+
+from utilities.cloud_governor import CloudGovernor
+
+GOVERNOR = CloudGovernor.shared()
+START = time.monotonic()
+held = []
+
+
+def hung_session(*args, **kwargs):
+    while True:
+        time.sleep(0.01)
+
+
+webdriver.Remote = hung_session
+
+
+@pytest.mark.time_budget(0.5)
+def test_hangs_creating_the_session(driver):
+    pass
+
+
+def test_creating_slot_was_freed():
+    assert GOVERNOR._active == 0
+    held.append(GOVERNOR.create_session(object))
+
+
+@pytest.mark.time_budget(0.5)
+def test_hangs_waiting_for_a_slot(driver):
+    pass
+
+
+def test_queue_was_left_at_once():
+    assert not GOVERNOR._waiters
+    GOVERNOR.release(held[0])
+    assert GOVERNOR._active == 0
+    assert time.monotonic() - START < 10
+"""
+
+
+class HangingServer:
+    """WebDriver endpoint whose commands block until the session is deleted."""
+
+    def __init__(self):
+        self.deleted = threading.Event()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.deleted.wait(10)
+                self.send_error(404, "invalid session id")
+
+            def do_DELETE(self):
+                server.deleted.set()
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.http.server_port}/wd/hub"
+        threading.Thread(target=self.http.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.http.shutdown()
+        self.http.server_close()
+
+
+class HungDriver:
+    """Driver double whose element lookup keeps polling a hanging server."""
+
+    session_id = "abc123"
+    capabilities = {"platformName": "Android"}
+
+    def __init__(self, url):
+        self.url = url
+        self.command_executor = SimpleNamespace(_client_config=SimpleNamespace(remote_server_addr=url))
+
+    def find_element(self):
+        while True:
+            try:
+                urllib.request.urlopen(f"{self.url}/session/{self.session_id}/element", timeout=30)
+            except OSError:
+                time.sleep(0.01)
+
+    def get_screenshot_as_png(self):
+        return b"\x89PNG fake"
+
+    @property
+    def page_source(self):
+        return "<hierarchy/>"
+
+    def get_log(self, log_type):
+        return []
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ArtifactStore(root=str(tmp_path / "artifacts"))
+    monkeypatch.setattr(ArtifactStore, "_instance", store)
+    return store
+
+
+class TestWatchdog:
+
+    def test_hung_lookup_is_reclaimed_and_failed(self, store):
+        server = HangingServer()
+        driver = HungDriver(server.url)
+        watchdog = Watchdog()
+
+        def expire():
+            return "budget spent (" + "; ".join(Watchdog.reclaim(driver, "watchdog_x", test_id="t::x")) + ")"
+
+        start = time.monotonic()
+        watchdog.arm(0.2, expire)
+        with pytest.raises(WatchdogTimeout) as error:
+            driver.find_element()
+        watchdog.disarm()
+
+        assert time.monotonic() - start < 5
+        assert server.deleted.is_set()
+        assert "session abc123 deleted" in str(error.value)
+        assert "evidence: " in str(error.value)
+        assert watchdog.expired == [str(error.value)]
+        server.close()
+
+    def test_disarmed_budget_never_fires(self):
+        watchdog = Watchdog()
+        fired = []
+        watchdog.arm(0.05, lambda: fired.append(1) or "late")
+        watchdog.disarm()
+        time.sleep(0.15)
+        assert fired == [] and watchdog.expired == []
+
+    def test_rearming_replaces_the_deadline(self):
+        watchdog = Watchdog()
+        watchdog.arm(0.05, lambda: "first")
+        watchdog.arm(5, lambda: "second")
+        time.sleep(0.15)
+        watchdog.disarm()
+        assert watchdog.expired == []
+
+    def test_not_swallowed_by_broad_handlers(self):
+        watchdog = Watchdog()
+        watchdog.arm(0.05, lambda: "stuck in a retry loop")
+        with pytest.raises(WatchdogTimeout, match="retry loop"):
+            while True:
+                try:
+                    time.sleep(0.01)
+                except Exception:
+                    pass
+        watchdog.disarm()
+
+
+def test_expiry_while_reporting_does_not_abort_the_run(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", PROJECT_ROOT)
+    monkeypatch.setenv("DEVICE_LOG_ENABLED", "false")
+    with open(os.path.join(PROJECT_ROOT, "tests", "conftest.py"), encoding="utf-8") as handle:
+        pytester.makeconftest(handle.read())
+    pytester.makepyfile(test_scratch=SLOW_EVIDENCE_TESTS)
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    assert "INTERNALERROR" not in result.stdout.str() + result.stderr.str()
+    result.assert_outcomes(failed=1, passed=1)
+    result.stdout.fnmatch_lines(["*failed inside the budget*"])
+
+
+def test_expiry_in_the_driver_fixture_frees_the_cloud_slot(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", PROJECT_ROOT)
+    monkeypatch.setenv("DEVICE_LOG_ENABLED", "false")
+    monkeypatch.setenv("CLOUD_PROVIDER", "perfecto")
+    monkeypatch.setenv("CLOUD_MAX_SESSIONS", "1")
+    monkeypatch.setenv("CLOUD_QUEUE_TIMEOUT", "60")
+    with open(os.path.join(PROJECT_ROOT, "tests", "conftest.py"), encoding="utf-8") as handle:
+        pytester.makeconftest(handle.read())
+    pytester.makepyfile(test_scratch=HUNG_SETUP_TESTS)
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    result.assert_outcomes(errors=2, passed=2)
+    result.stdout.fnmatch_lines(["*exceeded its 0.5s time budget*", "*cloud session slot*"])
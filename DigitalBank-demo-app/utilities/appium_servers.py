@@ -0,0 +1,378 @@
+"""Pool of local Appium server processes, one per free port."""
+
+import atexit
+import json
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+
+from config.config import Config
+from utilities.logger import Logger
+
+
+# Key of the pinned server's URL in an xdist worker's ``workerinput``
+WORKER_URL_KEY = "appium_server_url"
+
+
+def free_port(host="127.0.0.1"):
+    """Return a TCP port that is currently free on ``host``."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def current_worker():
+    """Worker id: the xdist worker of this process, else the current thread."""
+    return os.getenv("PYTEST_XDIST_WORKER") or threading.current_thread().name
+
+
+def worker_server_url(config):
+    """URL of the controller's server pinned to this xdist worker, or None outside a worker."""
+    return getattr(config, "workerinput", {}).get(WORKER_URL_KEY)
+
+
+class AppiumServer:
+    """
+    One Appium server process.
+
+    The server runs in its own process group so Ctrl-C in the terminal does
+    not kill it before the pool has shut it down, and so ``stop`` also ends
+    any child processes (e.g. when ``appium`` is an npx wrapper). Output
+    goes to ``<log_dir>/appium-<port>.log``.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, command, port, host="127.0.0.1", base_path="/wd/hub", log_dir=None):
+        """
+        Initialize the server.
+
+        Args:
+            command (list): Executable and leading arguments
+            port (int): Port to listen on
+            host (str): Address to listen on
+            base_path (str): Appium base path
+            log_dir (str, optional): Directory for the server log
+        """
+        self.command = command
+        self.port = port
+        self.host = host
+        self.base_path = base_path
+        self.log_dir = log_dir or os.path.join(Config.LOGS_DIR, "appium")
+        self.process = None
+        self.restarts = 0
+        self.failed_checks = 0
+        # Held while the server restarts; callers needing it wait here, not on the pool
+        self.restart_lock = threading.Lock()
+        self._log = None
+
+    @property
+    def url(self):
+        """WebDriver URL of the server."""
+        return f"http://{self.host}:{self.port}{self.base_path.rstrip('/')}"
+
+    @property
+    def log_path(self):
+        return os.path.join(self.log_dir, f"appium-{self.port}.log")
+
+    def start(self):
+        """Spawn the process; use ``wait_ready`` to wait until it serves."""
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._log = open(self.log_path, "ab")
+        self.process = subprocess.Popen(
+            self.command + ["--address", self.host, "--port", str(self.port), "--base-path", self.base_path],
+            stdin=subprocess.DEVNULL, stdout=self._log, stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        self.failed_checks = 0
+        self.logger.info("Started Appium server pid %s on %s", self.process.pid, self.url)
+
+    def alive(self):
+        """True while the process is running."""
+        return self.process is not None and self.process.poll() is None
+
+    def status(self, timeout=2):
+        """
+        Query the ``/status`` endpoint.
+
+        Returns:
+            dict: The status ``value``, or None if the server did not answer
+        """
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=timeout) as response:
+                return json.load(response).get("value") or {}
+        except (OSError, ValueError):
+            return None
+
+    def healthy(self, timeout=2):
+        """True if the process runs and reports ready (Appium 1 has no flag)."""
+        if not self.alive():
+            return False
+        status = self.status(timeout)
+        return status is not None and status.get("ready", True)
+
+    def wait_ready(self, timeout):
+        """
+        Wait until the server answers ``/status``.
+
+        Raises:
+            RuntimeError: If the process exits or is not ready in time
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.alive():
+                raise RuntimeError(
+                    f"Appium server on port {self.port} exited with code {self.process.returncode}; "
+                    f"see {self.log_path}"
+                )
+            if self.healthy(timeout=1):
+                return
+            time.sleep(0.1)
+        raise RuntimeError(f"Appium server on port {self.port} not ready after {timeout}s; see {self.log_path}")
+
+    def stop(self, timeout=10):
+        """Terminate the process group, killing it if it does not exit in time."""
+        if self.alive():
+            self._signal(signal.SIGTERM)
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Appium server pid %s ignored SIGTERM; killing it", self.process.pid)
+                self._signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+                self.process.wait(timeout)
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def _signal(self, signum):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self.process.pid, signum)
+            else:
+                self.process.terminate()
+        except ProcessLookupError:
+            pass
+
+
+class AppiumServerPool:
+    """
+    Spawn and supervise N local Appium servers on free ports.
+
+    Workers (xdist worker processes, or threads within one process) are
+    pinned to a server on first use; new workers go to the server with the
+    fewest workers. A monitor thread checks every server's ``/status``
+    each ``health_interval`` seconds and restarts a server whose process
+    died or that failed two checks in a row, on the same port when
+    possible so pinned workers keep their URL. A server is given up after
+    ``max_restarts`` restarts and its workers are moved to the others.
+
+    Under xdist only the controller runs a pool: ``pin`` gives each worker
+    the URL of one server through its ``workerinput``, so ``size`` should
+    match the worker count. Servers are stopped by ``shutdown``, which is
+    also registered with ``atexit``.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, size=None, executable=None, host=None, base_path=None,
+                 startup_timeout=None, health_interval=None, max_restarts=None, log_dir=None):
+        """
+        Initialize the pool.
+
+        Args:
+            size (int, optional): Number of servers
+            executable (str, optional): Server command line, e.g. "appium"
+            host (str, optional): Address the servers listen on
+            base_path (str, optional): Appium base path
+            startup_timeout (float, optional): Seconds to wait for a server
+            health_interval (float, optional): Seconds between health checks;
+                0 disables the monitor thread
+            max_restarts (int, optional): Restarts per server before giving up
+            log_dir (str, optional): Directory for server logs
+        """
+        self.size = size if size is not None else Config.APPIUM_POOL_SIZE
+        self.command = shlex.split(executable or Config.APPIUM_EXECUTABLE)
+        self.host = host or Config.APPIUM_HOST
+        self.base_path = base_path or Config.APPIUM_BASE_PATH
+        self.startup_timeout = startup_timeout if startup_timeout is not None else Config.APPIUM_STARTUP_TIMEOUT
+        self.health_interval = health_interval if health_interval is not None else Config.APPIUM_HEALTH_INTERVAL
+        self.max_restarts = max_restarts if max_restarts is not None else Config.APPIUM_MAX_RESTARTS
+        self.log_dir = log_dir
+        self.servers = []
+        self.assignments = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._monitor = None
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide pool configured from ``Config``."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def running(cls):
+        """True if the shared pool has live servers."""
+        return cls._instance is not None and bool(cls._instance.servers)
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def start(self):
+        """
+        Spawn all servers and wait until each is ready.
+
+        Returns:
+            AppiumServerPool: self
+        """
+        ports = set()
+        for _ in range(self.size):
+            port = free_port(self.host)
+            while port in ports:
+                port = free_port(self.host)
+            ports.add(port)
+            server = AppiumServer(self.command, port, self.host, self.base_path, self.log_dir)
+            server.start()
+            self.servers.append(server)
+        atexit.register(self.shutdown)
+        try:
+            # All processes boot concurrently; wait for each in turn
+            for server in self.servers:
+                server.wait_ready(self.startup_timeout)
+        except RuntimeError:
+            self.shutdown()
+            raise
+        if self.health_interval > 0:
+            self._stop.clear()
+            self._monitor = threading.Thread(target=self._watch, name="appium-pool-monitor", daemon=True)
+            self._monitor.start()
+        self.logger.info("Appium server pool ready: %s", ", ".join(s.url for s in self.servers))
+        return self
+
+    def assign(self, worker=None):
+        """
+        Server pinned to a worker, pinning the least-used server on first use.
+
+        Args:
+            worker (str, optional): Worker id; defaults to ``current_worker()``
+
+        Returns:
+            AppiumServer: Assigned server
+        """
+        worker = worker or current_worker()
+        with self._lock:
+            usable = [s for s in self.servers if s.restarts <= self.max_restarts]
+            if not usable:
+                raise RuntimeError("No Appium server in the pool is usable")
+            server = self.assignments.get(worker)
+            if server not in usable:
+                load = {id(s): 0 for s in usable}
+                for assigned in self.assignments.values():
+                    if id(assigned) in load:
+                        load[id(assigned)] += 1
+                server = min(usable, key=lambda s: load[id(s)])
+                self.assignments[worker] = server
+                self.logger.info("Worker %s -> Appium server %s", worker, server.url)
+            return server
+
+    def url_for(self, worker=None):
+        """
+        URL of the worker's server, restarting it first if its process died.
+
+        If the server is being restarted, waits until it is ready.
+
+        Returns:
+            str: WebDriver URL
+        """
+        server = self.assign(worker)
+        if not server.alive() or server.restart_lock.locked():
+            self._restart(server)  # or wait for the restart under way
+            server = self.assign(worker)
+        return server.url
+
+    def pin(self, workerinput):
+        """
+        Pin an xdist worker to a server and pass it the URL.
+
+        Args:
+            workerinput (dict): The worker's ``workerinput``; needs "workerid"
+        """
+        workerinput[WORKER_URL_KEY] = self.url_for(workerinput["workerid"])
+
+    def check(self):
+        """
+        Health-check every server once and restart unhealthy ones.
+
+        Returns:
+            list: Servers that were restarted
+        """
+        restarted = []
+        for server in list(self.servers):
+            if server.restarts > self.max_restarts:
+                continue
+            if server.healthy():
+                server.failed_checks = 0
+                continue
+            server.failed_checks += 1
+            if not server.alive() or server.failed_checks >= 2:
+                self._restart(server)
+                restarted.append(server)
+        return restarted
+
+    def shutdown(self):
+        """Stop the monitor and every server. Safe to call more than once."""
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=self.health_interval + 1)
+            self._monitor = None
+        with self._lock:
+            for server in self.servers:
+                server.stop()
+                if server.restarts:
+                    self.logger.info("Appium server %s was restarted %d times", server.url, server.restarts)
+            self.servers = []
+            self.assignments = {}
+        atexit.unregister(self.shutdown)
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _watch(self):
+        while not self._stop.wait(self.health_interval):
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error("Appium server health check failed: %s", e)
+
+    def _restart(self, server):
+        # Only the server's own lock is held while it boots, so assign() and
+        # restarts of other servers go on meanwhile
+        with server.restart_lock:
+            if server.alive() and server.healthy():
+                return  # another worker already restarted it
+            with self._lock:
+                server.restarts += 1
+            if server.restarts > self.max_restarts:
+                server.stop()
+                self.logger.error("Giving up on Appium server %s after %d restarts; see %s",
+                                  server.url, self.max_restarts, server.log_path)
+                return
+            self.logger.warning("Restarting Appium server %s (restart %d)", server.url, server.restarts)
+            server.stop()
+            server.start()
+            try:
+                server.wait_ready(self.startup_timeout)
+            except RuntimeError:
+                # The port may have been taken meanwhile; move to a new one
+                server.stop()
+                server.port = free_port(self.host)
+                server.start()
+                server.wait_ready(self.startup_timeout)
@@ -0,0 +1,295 @@
+"""Content-addressed artifact storage with log compression and retention."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+from config.config import Config
+from utilities.logger import Logger
+
+
+class ArtifactStore:
+    """
+    Bounded store for screenshots, page sources and other run artifacts.
+
+    Artifacts are stored once per content hash under ``objects/`` and
+    recorded in an append-only ``index.jsonl`` so reports can look them up
+    by name or kind without scanning the directory. At session start the
+    store enforces its size and age limits and gzips finished log files in
+    a background thread.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    INDEX_FILE = "index.jsonl"
+    OBJECTS_DIR = "objects"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, root=None, max_bytes=None, max_age_days=None):
+        """
+        Initialize the store.
+
+        Args:
+            root (str, optional): Store directory
+            max_bytes (int, optional): Size budget for stored objects
+            max_age_days (float, optional): Maximum artifact and log age
+        """
+        self.root = root or Config.ARTIFACTS_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.ARTIFACT_MAX_BYTES
+        self.max_age_days = (
+            max_age_days if max_age_days is not None else Config.ARTIFACT_MAX_AGE_DAYS
+        )
+        self.index_path = os.path.join(self.root, self.INDEX_FILE)
+        self._lock = threading.Lock()
+        self._compressor = None
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide store configured from ``Config``."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    # ---------------- WRITING ---------------- #
+
+    def put_bytes(self, data, name, kind, extension="", test_id=None):
+        """
+        Store artifact content, writing it only if it is not stored yet.
+
+        Args:
+            data (bytes): Artifact content
+            name (str): Human-readable artifact name
+            kind (str): Artifact category, e.g. "screenshot" or "page_source"
+            extension (str): File extension including the dot
+            test_id (str, optional): Test that produced the artifact
+
+        Returns:
+            str: Path of the stored object
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, extension)
+
+        if os.path.exists(path):
+            # Refresh mtime so retention treats the shared object as recent
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, path)
+
+        self._append_index({
+            "name": name,
+            "kind": kind,
+            "sha256": digest,
+            "path": path,
+            "bytes": len(data),
+            "created": time.time(),
+            "test": test_id,
+        })
+        return path
+
+    def put_file(self, source_path, name, kind, test_id=None, remove_source=True):
+        """
+        Store an existing file.
+
+        Args:
+            source_path (str): File to import into the store
+            name (str): Human-readable artifact name
+            kind (str): Artifact category
+            test_id (str, optional): Test that produced the artifact
+            remove_source (bool): Delete the original after importing
+
+        Returns:
+            str: Path of the stored object
+        """
+        with open(source_path, "rb") as handle:
+            data = handle.read()
+        extension = os.path.splitext(source_path)[1]
+        path = self.put_bytes(data, name, kind, extension, test_id)
+        if remove_source:
+            os.remove(source_path)
+        return path
+
+    # ---------------- READING ---------------- #
+
+    def find(self, name=None, kind=None, test_id=None):
+        """
+        Look up artifacts in the index.
+
+        Args:
+            name (str, optional): Exact artifact name
+            kind (str, optional): Artifact category
+            test_id (str, optional): Producing test
+
+        Returns:
+            list: Index entries (dicts) whose object still exists, oldest first
+        """
+        return [
+            entry for entry in self._read_index()
+            if (name is None or entry["name"] == name)
+            and (kind is None or entry["kind"] == kind)
+            and (test_id is None or entry.get("test") == test_id)
+        ]
+
+    # ---------------- MAINTENANCE ---------------- #
+
+    def start_session(self):
+        """Enforce retention and start compressing finished log files."""
+        try:
+            self.enforce_retention()
+        except Exception as e:
+            self.logger.warning(f"Artifact retention failed: {str(e)}")
+        self.compress_logs_async()
+
+    def finish_session(self, timeout=10):
+        """Wait for the background log compression to finish."""
+        if self._compressor is not None:
+            self._compressor.join(timeout)
+
+    def enforce_retention(self, now=None):
+        """
+        Delete artifacts older than the age limit, then the oldest ones
+        until the store fits its size budget, and compact the index.
+
+        Args:
+            now (float, optional): Reference timestamp, defaults to now
+
+        Returns:
+            int: Number of objects removed
+        """
+        now = now or time.time()
+        max_age = self.max_age_days * 86400
+        objects = sorted(self._scan_objects(), key=lambda item: item[1])
+        total = sum(size for _, _, size in objects)
+        removed = set()
+
+        for path, mtime, size in objects:
+            if now - mtime > max_age or total > self.max_bytes:
+                os.remove(path)
+                removed.add(path)
+                total -= size
+
+        for path, mtime, _ in self._scan_logs(compressed_only=True):
+            if now - mtime > max_age:
+                os.remove(path)
+
+        if removed:
+            self._compact_index()
+            self.logger.info(
+                f"Retention removed {len(removed)} artifacts; "
+                f"store now {total / 1_048_576:.1f} MB"
+            )
+        return len(removed)
+
+    def compress_logs_async(self):
+        """
+        Gzip finished log files in a daemon thread.
+
+        Returns:
+            threading.Thread: The compression thread
+        """
+        self._compressor = threading.Thread(
+            target=self.compress_logs, name="log-compressor", daemon=True
+        )
+        self._compressor.start()
+        return self._compressor
+
+    def compress_logs(self):
+        """
+        Gzip every plain log file that no live handler is writing to.
+
+        Returns:
+            int: Number of files compressed
+        """
+        active = self._active_log_files()
+        compressed = 0
+        for path, _, _ in self._scan_logs():
+            if os.path.abspath(path) in active:
+                continue
+            try:
+                with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(path)
+                compressed += 1
+            except OSError as e:
+                self.logger.warning(f"Failed to compress log {path}: {str(e)}")
+        return compressed
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _object_path(self, digest, extension):
+        return os.path.join(
+            self.root, self.OBJECTS_DIR, digest[:2], f"{digest}{extension}"
+        )
+
+    def _append_index(self, entry):
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return []
+        with self._lock, open(self.index_path, encoding="utf-8") as handle:
+            entries = [json.loads(line) for line in handle if line.strip()]
+        return [entry for entry in entries if os.path.exists(entry["path"])]
+
+    def _compact_index(self):
+        entries = self._read_index()
+        with self._lock:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                for entry in entries:
+                    handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.index_path)
+
+    def _scan_objects(self):
+        objects_root = os.path.join(self.root, self.OBJECTS_DIR)
+        if not os.path.isdir(objects_root):
+            return []
+        found = []
+        for bucket in os.scandir(objects_root):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    found.append((entry.path, stat.st_mtime, stat.st_size))
+        return found
+
+    @staticmethod
+    def _scan_logs(compressed_only=False):
+        if not os.path.isdir(Config.LOGS_DIR):
+            return []
+        suffix = ".log.gz" if compressed_only else ".log"
+        found = []
+        for entry in os.scandir(Config.LOGS_DIR):
+            if entry.is_file() and entry.name.endswith(suffix):
+                stat = entry.stat()
+                found.append((entry.path, stat.st_mtime, stat.st_size))
+        return found
+
+    @staticmethod
+    def _active_log_files():
+        loggers = [logging.getLogger()] + [
+            candidate for candidate in logging.Logger.manager.loggerDict.values()
+            if isinstance(candidate, logging.Logger)
+        ]
+        return {
+            os.path.abspath(handler.baseFilename)
+            for candidate in loggers
+            for handler in candidate.handlers
+            if isinstance(handler, logging.FileHandler)
+        }
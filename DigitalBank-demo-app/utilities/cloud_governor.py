@@ -0,0 +1,290 @@
+"""Concurrency and rate governor for cloud (Perfecto) session creation."""
+
+import random
+import re
+import threading
+import time
+from collections import deque
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.histogram import LatencyHistogram
+from utilities.logger import Logger
+
+# Session-creation errors that mean "try again later", not "broken request"
+CAPACITY_ERRORS = re.compile(
+    r"no (available )?devices?|devices? (is |are )?(not available|unavailable|busy|in use)"
+    r"|all devices are|concurren|maximum number of|too many requests|\b429\b|rate limit",
+    re.IGNORECASE,
+)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Holds up to ``burst`` tokens, refilled at ``rate`` per second. A caller
+    that finds the bucket empty reserves the next token and sleeps until it
+    is due, outside the lock, so callers are served in arrival order.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate (float): Tokens per second; 0 disables limiting
+            burst (int): Bucket capacity
+            clock (callable): Monotonic clock
+            sleep (callable): Sleep function
+        """
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, waiting for it if needed.
+
+        Returns:
+            float: Seconds waited
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self.sleep(wait)
+        return wait
+
+
+class _Ticket(threading.Event):
+    """A queued request for a slot; set when granted or cancelled."""
+
+    def __init__(self):
+        super().__init__()
+        self.thread = threading.get_ident()
+        self.granted = False
+
+
+class CloudGovernor:
+    """
+    Gate cloud session creation behind a session cap and a rate limit.
+
+    - At most ``max_sessions`` sessions are open at once. Callers beyond
+      the cap wait in a FIFO queue; a released slot is handed straight to
+      the longest waiter, so no caller can overtake another.
+    - Each creation attempt takes a token from a ``TokenBucket``.
+    - A creation error that matches ``CAPACITY_ERRORS`` ("no device
+      available", concurrency or rate-limit responses) is retried after an
+      exponential backoff with full jitter, up to ``max_attempts`` times.
+      Other errors are raised at once.
+
+    Queue waits are recorded in a ``LatencyHistogram`` and emitted as
+    ``session_queue`` events. The cap is per process: with xdist, divide
+    the plan's concurrency between the workers.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_sessions=None, rate=None, burst=None, max_attempts=None,
+                 backoff_base=None, backoff_max=None, queue_timeout=None,
+                 clock=time.monotonic, sleep=time.sleep, rng=None):
+        """
+        Initialize the governor.
+
+        Args:
+            max_sessions (int, optional): Concurrent session cap
+            rate (float, optional): Session creations per second
+            burst (int, optional): Creations allowed back to back
+            max_attempts (int, optional): Creation attempts per session
+            backoff_base (float, optional): First backoff ceiling in seconds
+            backoff_max (float, optional): Backoff ceiling cap in seconds
+            queue_timeout (float, optional): Longest wait for a slot
+            clock (callable): Monotonic clock
+            sleep (callable): Sleep function
+            rng (random.Random, optional): Jitter source
+        """
+        self.max_sessions = max_sessions if max_sessions is not None else Config.CLOUD_MAX_SESSIONS
+        self.max_attempts = max_attempts if max_attempts is not None else Config.CLOUD_CREATE_ATTEMPTS
+        self.backoff_base = backoff_base if backoff_base is not None else Config.CLOUD_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else Config.CLOUD_BACKOFF_MAX
+        self.queue_timeout = queue_timeout if queue_timeout is not None else Config.CLOUD_QUEUE_TIMEOUT
+        self.bucket = TokenBucket(
+            rate if rate is not None else Config.CLOUD_SESSION_RATE,
+            burst if burst is not None else Config.CLOUD_SESSION_BURST,
+            clock, sleep,
+        )
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.queue_wait = LatencyHistogram()
+        self.stats = {"sessions": 0, "retries": 0, "failures": 0, "rate_wait": 0.0, "peak": 0}
+        self._active = 0
+        self._held = set()
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide governor configured from ``Config``."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def is_capacity_error(error):
+        """True if a creation error means the cloud is out of capacity for now."""
+        return bool(CAPACITY_ERRORS.search(str(error)))
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def create_session(self, create):
+        """
+        Create a session within the cap and rate limit.
+
+        Args:
+            create (callable): Opens and returns a session (driver)
+
+        Returns:
+            object: The session; pass it to ``release`` when it is closed
+
+        Raises:
+            TimeoutError: If no slot frees up within ``queue_timeout``
+        """
+        start = self.clock()
+        self._acquire_slot()
+        waited = self.clock() - start
+        self.queue_wait.record_seconds(waited)
+        try:
+            driver = self._create(create)
+        except BaseException:
+            # Includes a watchdog timeout, which must not keep the slot either
+            self.stats["failures"] += 1
+            self._release_slot()
+            raise
+        with self._lock:
+            self._held.add(id(driver))
+            self.stats["sessions"] += 1
+        EventBus.emit("session_queue", page="CloudGovernor", duration=waited, active=self._active)
+        return driver
+
+    def release(self, driver):
+        """Free the slot of a session created here; other sessions are ignored."""
+        with self._lock:
+            if id(driver) not in self._held:
+                return
+            self._held.discard(id(driver))
+        self._release_slot()
+
+    def cancel(self, thread_id):
+        """
+        Stop a thread waiting for a slot, e.g. a test out of its time budget.
+
+        Its ``create_session`` raises ``TimeoutError`` at once instead of
+        waiting out ``queue_timeout``.
+
+        Args:
+            thread_id (int): Waiting thread
+
+        Returns:
+            bool: True if the thread was queued
+        """
+        with self._lock:
+            for ticket in self._waiters:
+                if ticket.thread == thread_id:
+                    self._waiters.remove(ticket)
+                    ticket.set()
+                    return True
+        return False
+
+    def summary_lines(self):
+        """
+        Human-readable queue and retry metrics.
+
+        Returns:
+            list: Lines; empty if no session was requested
+        """
+        requested = self.stats["sessions"] + self.stats["failures"]
+        if not requested:
+            return []
+        waits = self.queue_wait.percentiles((50, 95, 100))
+        return [
+            f"sessions {self.stats['sessions']} created, {self.stats['failures']} failed, "
+            f"{self.stats['retries']} capacity retries; peak {self.stats['peak']}/{self.max_sessions} concurrent",
+            "queue wait p50 {:.1f}s p95 {:.1f}s max {:.1f}s; rate-limit wait {:.1f}s total".format(
+                *(waits[p] / 1e6 for p in (50, 95, 100)), self.stats["rate_wait"]
+            ),
+        ]
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _create(self, create):
+        for attempt in range(1, self.max_attempts + 1):
+            self.stats["rate_wait"] += self.bucket.acquire()
+            try:
+                return create()
+            except Exception as e:
+                if attempt == self.max_attempts or not self.is_capacity_error(e):
+                    raise
+                delay = self.rng.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+                self.stats["retries"] += 1
+                self.logger.warning("Session creation hit a capacity limit (attempt %d/%d), retrying in "
+                                    "%.1fs: %s", attempt, self.max_attempts, delay, str(e).splitlines()[0])
+                self.sleep(delay)
+
+    def _acquire_slot(self):
+        with self._lock:
+            if self._active < self.max_sessions and not self._waiters:
+                self._take_slot()
+                return
+            ticket = _Ticket()
+            self._waiters.append(ticket)
+        try:
+            ticket.wait(self.queue_timeout)
+        except BaseException:
+            # Interrupted while queued; give up the place, or the slot if it was just granted
+            if self._leave_queue(ticket):
+                self._release_slot()
+            raise
+        if self._leave_queue(ticket):
+            return
+        if ticket.is_set():
+            raise TimeoutError("Wait for a cloud session slot was cancelled")
+        raise TimeoutError(f"No cloud session slot free after {self.queue_timeout}s "
+                           f"({self.max_sessions} sessions in use)")
+
+    def _leave_queue(self, ticket):
+        """Drop a waiter that stopped waiting; True if it was granted a slot meanwhile."""
+        with self._lock:
+            if ticket.granted:
+                return True
+            if ticket in self._waiters:
+                self._waiters.remove(ticket)
+            return False
+
+    def _take_slot(self):
+        self._active += 1
+        self.stats["peak"] = max(self.stats["peak"], self._active)
+
+    def _release_slot(self):
+        with self._lock:
+            self._active -= 1
+            if self._waiters:
+                # Hand the slot to the longest waiter
+                self._take_slot()
+                ticket = self._waiters.popleft()
+                ticket.granted = True
+                ticket.set()
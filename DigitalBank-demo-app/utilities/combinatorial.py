@@ -0,0 +1,300 @@
+"""Pairwise and t-way combinatorial case generation for form-field suites."""
+
+import itertools
+import math
+import random
+from collections import namedtuple
+
+from config.config import Config
+from utilities.logger import Logger
+
+CoverageReport = namedtuple(
+    "CoverageReport",
+    [
+        "strength", "cases", "exhaustive_cases", "required_tuples",
+        "covered_tuples", "coverage", "device_minutes", "exhaustive_minutes",
+        "minutes_saved",
+    ],
+)
+
+
+class CombinationGenerator:
+    """
+    Build a near-minimal covering set of cases over field domains.
+
+    Every combination of values of any ``strength`` fields (every pair for
+    the default pairwise strength) that the constraints allow appears in at
+    least one generated case. Cases are built greedily, AETG style: each new
+    case starts from an uncovered tuple and fills the remaining fields with
+    the value that covers the most still-uncovered tuples, keeping the best
+    of several randomized candidates. Generation is deterministic for a
+    given ``seed``. Cases listed in ``include`` (e.g. the all-valid happy
+    path) are always emitted first and count towards coverage.
+
+    Constraints are Python expressions over field names (e.g.
+    ``"not (credit == False and amount == '')"``) or callables taking a dict
+    of field values. They are checked on partial cases as fields are
+    assigned; an expression that references a field not assigned yet
+    (``NameError``/``KeyError``) is treated as undecided until it is.
+    """
+
+    def __init__(self, domains, strength=2, constraints=None, include=None, seed=0,
+                 candidates=20):
+        """
+        Initialize the generator.
+
+        Args:
+            domains (dict): Field name to list of values
+            strength (int): Size of field combinations to cover (2 = pairwise)
+            constraints (list, optional): Expressions or callables that every
+                case must satisfy
+            include (list, optional): Cases (dicts over every field) that
+                must be part of the generated set
+            seed (int): Seed for candidate randomization
+            candidates (int): Candidate cases tried per generated case
+        """
+        self.logger = Logger.get_logger(__name__)
+        self.fields = list(domains)
+        self.values = [list(domains[field]) for field in self.fields]
+        if not 1 <= strength <= len(self.fields):
+            raise ValueError(f"strength must be between 1 and {len(self.fields)}, got {strength}")
+        self.strength = strength
+        self.constraints = [self._compile(c) for c in (constraints or [])]
+        self.include = []
+        for case in include or []:
+            row = self._to_row(case)
+            if row is None:
+                raise ValueError(f"Included case {case} has a field or value outside the domains")
+            self.include.append(row)
+        self.seed = seed
+        self.candidates = candidates
+        self._cases = None
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def cases(self):
+        """
+        Generate the covering set.
+
+        Returns:
+            list: One dict of field values per case
+        """
+        if self._cases is None:
+            self._cases = [self._to_case(row) for row in self._generate()]
+        return self._cases
+
+    def params(self, id_fields=None):
+        """
+        Generated cases as ``pytest.param`` objects with readable ids.
+
+        Args:
+            id_fields (list, optional): Fields joined into the test id;
+                defaults to all fields
+
+        Returns:
+            list: One parameter per case
+        """
+        import pytest
+
+        id_fields = id_fields or self.fields
+        return [
+            pytest.param(case, id="-".join(self._id_part(case[field]) for field in id_fields))
+            for case in self.cases()
+        ]
+
+    def coverage(self, cases):
+        """
+        Fraction of the allowed ``strength``-way tuples covered by ``cases``.
+
+        Useful for scoring hand-written or dataset-driven suites against the
+        same domains.
+
+        Args:
+            cases (list): Dicts of field values
+
+        Returns:
+            float: Covered fraction between 0 and 1
+        """
+        required = self._required_tuples()
+        if not required:
+            return 1.0
+        covered = set()
+        for case in cases:
+            row = self._to_row(case)
+            if row is not None:
+                covered.update(self._tuples_of(row))
+        return len(covered & required) / len(required)
+
+    def report(self, minutes_per_case=None):
+        """
+        Summarize coverage and device time against the full cartesian product.
+
+        Args:
+            minutes_per_case (float, optional): Device minutes per case;
+                defaults to ``Config.DEVICE_MINUTES_PER_CASE``
+
+        Returns:
+            CoverageReport: Counts, coverage and device-minute estimates
+        """
+        if minutes_per_case is None:
+            minutes_per_case = Config.DEVICE_MINUTES_PER_CASE
+        cases = self.cases()
+        required = self._required_tuples()
+        covered = set()
+        for case in cases:
+            covered.update(self._tuples_of(self._to_row(case)))
+        covered &= required
+        exhaustive = self._exhaustive_count()
+        return CoverageReport(
+            strength=self.strength,
+            cases=len(cases),
+            exhaustive_cases=exhaustive,
+            required_tuples=len(required),
+            covered_tuples=len(covered),
+            coverage=len(covered) / len(required) if required else 1.0,
+            device_minutes=len(cases) * minutes_per_case,
+            exhaustive_minutes=exhaustive * minutes_per_case,
+            minutes_saved=(exhaustive - len(cases)) * minutes_per_case,
+        )
+
+    def summary(self, minutes_per_case=None):
+        """
+        One-line human-readable version of ``report``.
+
+        Args:
+            minutes_per_case (float, optional): Device minutes per case
+
+        Returns:
+            str: Summary line
+        """
+        r = self.report(minutes_per_case)
+        return (
+            f"{r.strength}-way: {r.cases} cases vs {r.exhaustive_cases} exhaustive, "
+            f"{r.covered_tuples}/{r.required_tuples} tuples covered ({r.coverage:.1%}), "
+            f"{r.device_minutes:.1f} device-min vs {r.exhaustive_minutes:.1f} "
+            f"(saves {r.minutes_saved:.1f})"
+        )
+
+    # ---------------- INTERNALS ---------------- #
+
+    @staticmethod
+    def _compile(constraint):
+        if callable(constraint):
+            return constraint
+        code = compile(constraint, "<constraint>", "eval")
+        namespace = {"__builtins__": {}, "int": int, "float": float, "len": len}
+        return lambda case: eval(code, namespace, case)
+
+    @staticmethod
+    def _id_part(value):
+        return str(value).replace(" ", "_") or "empty"
+
+    def _to_case(self, row):
+        return {self.fields[f]: self.values[f][v] for f, v in sorted(row.items())}
+
+    def _to_row(self, case):
+        """Map a case dict back to value indexes; None if a value is outside the domains."""
+        row = {}
+        for f, field in enumerate(self.fields):
+            if field not in case or case[field] not in self.values[f]:
+                return None
+            row[f] = self.values[f].index(case[field])
+        return row
+
+    def _allowed(self, row):
+        if not self.constraints:
+            return True
+        case = {self.fields[f]: self.values[f][v] for f, v in row.items()}
+        for constraint in self.constraints:
+            try:
+                if not constraint(case):
+                    return False
+            except (NameError, KeyError):
+                continue
+        return True
+
+    def _tuples_of(self, row):
+        if row is None:
+            return []
+        return [
+            tuple((f, row[f]) for f in fields)
+            for fields in itertools.combinations(sorted(row), self.strength)
+        ]
+
+    def _required_tuples(self):
+        required = set()
+        for fields in itertools.combinations(range(len(self.fields)), self.strength):
+            for picks in itertools.product(*(range(len(self.values[f])) for f in fields)):
+                pairs = tuple(zip(fields, picks))
+                if self._allowed(dict(pairs)):
+                    required.add(pairs)
+        return required
+
+    def _exhaustive_count(self, enumerate_limit=200_000):
+        """Size of the cartesian product, counting only allowed cases when small enough."""
+        total = math.prod(len(values) for values in self.values)
+        if not self.constraints or total > enumerate_limit:
+            return total
+        ranges = [range(len(values)) for values in self.values]
+        return sum(
+            1 for picks in itertools.product(*ranges)
+            if self._allowed(dict(enumerate(picks)))
+        )
+
+    def _generate(self):
+        rng = random.Random(self.seed)
+        uncovered = self._required_tuples()
+        pending = iter(sorted(uncovered))
+        rows = list(self.include)
+        for row in rows:
+            uncovered.difference_update(self._tuples_of(row))
+        while uncovered:
+            start = next(t for t in pending if t in uncovered)
+            best_row, best_gain = None, 0
+            for _ in range(self.candidates):
+                row = self._build_row(start, uncovered, rng)
+                if row is None:
+                    continue
+                gain = sum(1 for t in self._tuples_of(row) if t in uncovered)
+                if gain > best_gain:
+                    best_row, best_gain = row, gain
+            if best_row is None:
+                # No allowed completion was found for this tuple
+                self.logger.warning("No valid case covers %s; skipping it", self._to_case(dict(start)))
+                uncovered.discard(start)
+                continue
+            rows.append(best_row)
+            uncovered.difference_update(self._tuples_of(best_row))
+        self.logger.info("Generated %d %d-way cases over %d fields",
+                         len(rows), self.strength, len(self.fields))
+        return rows
+
+    def _build_row(self, start, uncovered, rng):
+        row = dict(start)
+        remaining = [f for f in range(len(self.fields)) if f not in row]
+        rng.shuffle(remaining)
+        for field in remaining:
+            best, best_gain = [], -1
+            for value in range(len(self.values[field])):
+                row[field] = value
+                if not self._allowed(row):
+                    continue
+                gain = self._gain(row, field, uncovered)
+                if gain > best_gain:
+                    best, best_gain = [value], gain
+                elif gain == best_gain:
+                    best.append(value)
+            if not best:
+                return None
+            row[field] = rng.choice(best)
+        return row
+
+    def _gain(self, row, field, uncovered):
+        """Uncovered tuples completed by ``field``'s value given the fields assigned so far."""
+        others = [f for f in row if f != field]
+        gain = 0
+        for combo in itertools.combinations(others, self.strength - 1):
+            key = tuple(sorted([(f, row[f]) for f in combo] + [(field, row[field])]))
+            if key in uncovered:
+                gain += 1
+        return gain
@@ -0,0 +1,201 @@
+"""Streaming test-data provider for data-driven parametrization."""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import zlib
+
+from config.config import Config
+
+
+class DataCase:
+    """
+    Reference to one record of a dataset.
+
+    Only the file path, byte offset and a digest of the raw line are kept,
+    so collecting many thousands of cases never holds their payloads in
+    memory; ``load`` reads the record when the test actually runs.
+    """
+
+    __slots__ = ("path", "offset", "line", "case_id", "digest", "_header")
+
+    def __init__(self, path, offset, line, case_id, header, digest=None):
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.case_id = case_id
+        self.digest = digest
+        self._header = header
+
+    def load(self):
+        """
+        Read the record from disk.
+
+        Returns:
+            dict: Field name to value
+        """
+        with open(self.path, "rb") as handle:
+            handle.seek(self.offset)
+            raw = handle.readline().decode("utf-8")
+        return DataProvider.parse_line(raw, self._header)
+
+    def __repr__(self):
+        return f"DataCase({os.path.basename(self.path)}:{self.line})"
+
+
+class DataProvider:
+    """
+    Lazily stream records from CSV or JSON Lines files.
+
+    Records are read one line at a time with a generator. ``where`` is a
+    Python expression evaluated against each record's fields (e.g.
+    ``"expected == 'error' and amount != ''"``); ``sample`` keeps a
+    deterministic fraction of the matching records, chosen by a hash of the
+    line number and ``seed`` so the same subset is picked on every run and
+    on every xdist worker. CSV records must not contain embedded newlines.
+    """
+
+    def __init__(self, path, where=None, sample=None, limit=None, seed=0, id_fields=None):
+        """
+        Initialize the provider.
+
+        Args:
+            path (str): Dataset path, absolute or relative to ``Config.DATA_DIR``
+            where (str or callable, optional): Filter expression or predicate
+            sample (float, optional): Fraction of records to keep (0-1];
+                defaults to ``Config.DATA_SAMPLE_RATE``
+            limit (int, optional): Stop after this many matching records
+            seed (int): Sampling seed
+            id_fields (list, optional): Fields joined into the test id;
+                defaults to the line number only
+        """
+        if not os.path.isabs(path) and not os.path.exists(path):
+            path = os.path.join(Config.DATA_DIR, path)
+        self.path = path
+        self.where = self._compile(where)
+        self.sample = sample if sample is not None else Config.DATA_SAMPLE_RATE
+        self.limit = limit
+        self.seed = seed
+        self.id_fields = list(id_fields or [])
+        self.is_jsonl = path.endswith((".jsonl", ".ndjson"))
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def records(self):
+        """
+        Stream matching records.
+
+        Yields:
+            dict: One record at a time
+        """
+        for _, _, _, record in self._scan():
+            yield record
+
+    def cases(self):
+        """
+        Stream lightweight case references for parametrization.
+
+        Yields:
+            DataCase: Reference to one matching record
+        """
+        for offset, line, digest, record in self._scan():
+            yield DataCase(self.path, offset, line, self._case_id(line, record), self._header, digest)
+
+    def params(self):
+        """
+        Stream ``pytest.param`` objects with readable ids.
+
+        Yields:
+            _pytest.mark.ParameterSet: One parameter per matching record
+        """
+        import pytest
+
+        for case in self.cases():
+            yield pytest.param(case, id=case.case_id)
+
+    @staticmethod
+    def parse_line(raw, header):
+        """
+        Parse one raw line of a dataset.
+
+        Args:
+            raw (str): Line content
+            header (list): CSV column names, or None for JSON Lines
+
+        Returns:
+            dict: Field name to value
+        """
+        if header is None:
+            return json.loads(raw)
+        values = next(csv.reader(io.StringIO(raw)))
+        return dict(zip(header, values))
+
+    # ---------------- INTERNALS ---------------- #
+
+    @staticmethod
+    def _compile(where):
+        if where is None or callable(where):
+            return where
+        code = compile(where, "<where>", "eval")
+        # Datasets are trusted repo files; builtins are withheld only to keep
+        # expressions to plain field comparisons
+        namespace = {"__builtins__": {}, "int": int, "float": float, "len": len}
+        return lambda record: eval(code, namespace, record)
+
+    def _keep(self, line):
+        bucket = zlib.crc32(f"{self.seed}:{line}".encode()) / 0xFFFFFFFF
+        return bucket < self.sample
+
+    def _scan(self):
+        """Yield (byte offset, line number, line digest, record) for each selected record."""
+        self._header = None
+        matched = 0
+        with open(self.path, "rb") as handle:
+            if not self.is_jsonl:
+                first = handle.readline()
+                self._header = next(csv.reader(io.StringIO(first.decode("utf-8-sig"))))
+            else:
+                first = b""
+            lines = self._lines(handle, 1 if self._header is not None else 0, first.rstrip(b"\r\n"))
+            if self._header is None:
+                rows = ((position, json.loads(raw)) for position, raw in lines)
+            else:
+                # One csv.reader over the whole stream; each input line is one row
+                positions = []
+                reader = csv.reader(self._track(lines, positions))
+                header = self._header
+                rows = ((positions.pop(), dict(zip(header, values))) for values in reader)
+            for (offset, line, digest), record in rows:
+                if self.where is not None and not self.where(record):
+                    continue
+                yield offset, line, digest, record
+                matched += 1
+                if self.limit and matched >= self.limit:
+                    return
+
+    def _lines(self, handle, line, header=b""):
+        """
+        Yield ((offset, line number, digest), decoded line) for sampled, non-blank lines.
+
+        The digest covers the CSV header too, so renaming a column changes it.
+        """
+        offset = handle.tell()
+        sample_all = self.sample >= 1
+        for raw in handle:
+            line += 1
+            start, offset = offset, offset + len(raw)
+            if (sample_all or self._keep(line)) and not raw.isspace():
+                digest = hashlib.blake2b(header + b"\n" + raw.rstrip(b"\r\n"), digest_size=16).hexdigest()
+                yield (start, line, digest), raw.decode("utf-8")
+
+    @staticmethod
+    def _track(lines, positions):
+        for position, raw in lines:
+            positions.append(position)
+            yield raw
+
+    def _case_id(self, line, record):
+        parts = [f"L{line}"] + [str(record.get(field, "")) for field in self.id_fields]
+        return "-".join(part.replace(" ", "_") or "empty" for part in parts)
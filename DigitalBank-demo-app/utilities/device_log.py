@@ -0,0 +1,224 @@
+"""Background device-log collection into a bounded in-memory ring buffer."""
+
+import threading
+from collections import deque
+from datetime import datetime
+
+from config.config import Config
+from utilities.logger import Logger
+
+
+class DeviceLogCollector:
+    """
+    Stream a session's device log (logcat/syslog) into a ring buffer.
+
+    A daemon thread polls Appium's log endpoint every ``interval`` seconds.
+    The endpoint only returns entries added since the previous call, so
+    each poll is incremental. Only the newest ``max_bytes`` of log lines
+    are kept in memory (sizes are counted in characters) and nothing
+    touches the disk unless a test fails.
+    ``mark`` inserts marker lines so a test's window can be found in the
+    buffer; on a passing test the per-test cost is two appends.
+
+    One collector runs per session. It is started and stopped by
+    ``DriverFactory`` and looked up with ``for_driver``.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    MARKER = "-----"
+
+    _collectors = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, driver, log_type=None, max_bytes=None, interval=None):
+        """
+        Initialize the collector.
+
+        Args:
+            driver (webdriver.Remote): Session to collect from
+            log_type (str, optional): Appium log type; defaults to the
+                platform's device log
+            max_bytes (int, optional): Ring buffer size
+            interval (float, optional): Seconds between polls
+        """
+        self.driver = driver
+        self.log_type = log_type or self.platform_log_type()
+        self.max_bytes = max_bytes if max_bytes is not None else Config.DEVICE_LOG_BUFFER_BYTES
+        self.interval = interval if interval is not None else Config.DEVICE_LOG_POLL_INTERVAL
+        self.dropped_lines = 0
+        self._lines = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def platform_log_type():
+        """Appium log type holding the device log for the current platform."""
+        return "logcat" if Config.is_android() else "syslog"
+
+    # ---------------- SESSION REGISTRY ---------------- #
+
+    @classmethod
+    def start_for(cls, driver, **kwargs):
+        """
+        Start collecting for a session.
+
+        Args:
+            driver (webdriver.Remote): Session to collect from
+            **kwargs: Collector options
+
+        Returns:
+            DeviceLogCollector: Running collector
+        """
+        collector = cls(driver, **kwargs)
+        with cls._registry_lock:
+            cls._collectors[id(driver)] = collector
+        collector.start()
+        return collector
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        Return the collector running for a session.
+
+        Args:
+            driver (webdriver.Remote): Session, or None
+
+        Returns:
+            DeviceLogCollector: Collector, or None if there is none
+        """
+        if driver is None:
+            return None
+        with cls._registry_lock:
+            return cls._collectors.get(id(driver))
+
+    @classmethod
+    def stop_for(cls, driver):
+        """
+        Stop and forget the collector of a session before it is quit.
+
+        Args:
+            driver (webdriver.Remote): Session
+        """
+        with cls._registry_lock:
+            collector = cls._collectors.pop(id(driver), None)
+        if collector is not None:
+            collector.stop()
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def start(self):
+        """Start the background polling thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="device-log", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2):
+        """
+        Stop polling.
+
+        Args:
+            timeout (float): Seconds to wait for an in-flight poll
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self):
+        """
+        Fetch new log entries into the buffer now.
+
+        Returns:
+            int: Number of lines added
+        """
+        # get_log is incremental: a second poller must not append a later
+        # batch before this one lands, or lines end up out of order
+        with self._poll_lock:
+            entries = self.driver.get_log(self.log_type)
+            lines = [
+                f"{entry.get('timestamp', '')} {entry.get('level', '')} {entry.get('message', '')}"
+                for entry in entries
+            ]
+            self._append(lines)
+        return len(lines)
+
+    def mark(self, label):
+        """
+        Insert a marker line, e.g. the start or end of a test.
+
+        Args:
+            label (str): Marker text
+        """
+        stamp = datetime.now().isoformat(timespec="milliseconds")
+        self._append([f"{self.MARKER} {label} @ {stamp} {self.MARKER}"])
+
+    def lines(self):
+        """
+        Current buffer content, oldest first.
+
+        Returns:
+            list: Log and marker lines
+        """
+        with self._lock:
+            return list(self._lines)
+
+    def window(self, start_label, end_label=None):
+        """
+        Lines between the last marker containing ``start_label`` and the
+        following marker containing ``end_label`` (or the end of the buffer).
+
+        Args:
+            start_label (str): Start marker text, e.g. "START <test id>"
+            end_label (str, optional): End marker text
+
+        Returns:
+            list: Lines of the window including its markers, or an empty list
+            if the start marker was already evicted
+        """
+        lines = self.lines()
+        starts = [i for i, line in enumerate(lines)
+                  if line.startswith(self.MARKER) and start_label in line]
+        if not starts:
+            return []
+        window = lines[starts[-1]:]
+        if end_label is not None:
+            for i, line in enumerate(window):
+                if line.startswith(self.MARKER) and end_label in line:
+                    return window[:i + 1]
+        return window
+
+    def dump(self):
+        """
+        Encode the whole buffer for writing to disk.
+
+        Returns:
+            bytes: Newline-separated UTF-8 log
+        """
+        lines = self.lines()
+        if self.dropped_lines:
+            lines.insert(0, f"{self.MARKER} {self.dropped_lines} older lines dropped {self.MARKER}")
+        return "\n".join(lines).encode("utf-8")
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _append(self, lines):
+        with self._lock:
+            for line in lines:
+                self._lines.append(line)
+                self._size += len(line) + 1
+            while self._size > self.max_bytes and self._lines:
+                self._size -= len(self._lines.popleft()) + 1
+                self.dropped_lines += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # Unsupported log type or a dead session: stop quietly
+                self.logger.warning("Device log collection stopped: %s", e)
+                return
@@ -1,11 +1,15 @@
 """Driver factory for creating Appium driver instances (Local + Perfecto)."""
 
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
-from appium.options.ios import XCUITestOptions
+import time
+
 from config.config import Config
 from config.capabilities import Capabilities
+from utilities.appium_servers import AppiumServerPool
+from utilities.cloud_governor import CloudGovernor
+from utilities.device_log import DeviceLogCollector
+from utilities.events import EventBus
 from utilities.logger import Logger
+from utilities.tracing import Tracer
 
 
 class DriverFactory:
@@ -13,8 +17,10 @@ class DriverFactory:
     Factory class for creating and managing Appium driver instances.
 
     Supports:
-    - Local Android/iOS emulators or real devices
-    - Perfecto cloud devices
+    - Local Android/iOS emulators or real devices, on one server or on a
+      pool of local servers (``AppiumServerPool``)
+    - Perfecto cloud devices, with session creation capped and rate limited
+      by ``CloudGovernor``
     """
 
     logger = Logger.get_logger(__name__)
@@ -22,7 +28,12 @@ class DriverFactory:
     @staticmethod
     def create_driver():
         """Create and return Appium driver based on platform and environment."""
+        # Imported on first use so test collection does not load Appium
+        from appium import webdriver
+        from appium.options.android import UiAutomator2Options
+        from appium.options.ios import XCUITestOptions
 
+        driver = None
         try:
             DriverFactory.logger.info(
                 f"Creating driver for platform: {Config.PLATFORM}, "
@@ -39,27 +50,79 @@ class DriverFactory:
                     Capabilities.get_ios_capabilities()
                 )
 
-            # Create Appium driver
-            driver = webdriver.Remote(
-                Config.get_server_url(),
-                options=options
-            )
+            # Create Appium driver; cloud sessions go through the governor
+            start = time.perf_counter()
+            server_url = DriverFactory.server_url()
+            if Config.CLOUD_PROVIDER.lower() != "local" and Config.CLOUD_GOVERNOR_ENABLED:
+                driver = CloudGovernor.shared().create_session(
+                    lambda: webdriver.Remote(server_url, options=options)
+                )
+            else:
+                driver = webdriver.Remote(server_url, options=options)
+            EventBus.emit("create_session", page="DriverFactory", duration=time.perf_counter() - start)
 
             driver.implicitly_wait(Config.IMPLICIT_WAIT)
+            if Tracer.enabled:
+                Tracer.instrument_driver(driver)
+            if Config.DEVICE_LOG_ENABLED:
+                DeviceLogCollector.start_for(driver)
             DriverFactory.logger.info("Driver created successfully")
             return driver
 
-        except Exception as e:
+        except BaseException as e:
+            # BaseException too: a watchdog timeout must not leave the session running
             DriverFactory.logger.error(f"Failed to create driver: {e}")
+            if driver is not None:
+                # The session exists; end it and free its cloud slot
+                DriverFactory.quit_driver(driver)
             raise
 
+    @staticmethod
+    def server_url(worker=None):
+        """
+        Appium URL for a new session.
+
+        With a running local server pool, the worker's pooled server;
+        otherwise ``Config.get_server_url()``.
+
+        Args:
+            worker (str, optional): Worker id; defaults to the current one
+        """
+        if Config.CLOUD_PROVIDER.lower() == "local" and AppiumServerPool.running():
+            return AppiumServerPool.shared().url_for(worker)
+        return Config.get_server_url()
+
     @staticmethod
     def quit_driver(driver):
         """Quit the Appium driver and clean up resources."""
         if driver:
+            DeviceLogCollector.stop_for(driver)
             try:
                 DriverFactory.logger.info("Quitting driver")
                 driver.quit()
                 DriverFactory.logger.info("Driver quit successfully")
             except Exception as e:
                 DriverFactory.logger.error(f"Error while quitting driver: {e}")
+            finally:
+                CloudGovernor.shared().release(driver)
+
+    @staticmethod
+    def restart_app(driver):
+        """
+        Terminate and relaunch the app under test inside an existing session.
+
+        Much cheaper than a new session, so tests can be retried while the
+        device session is still warm.
+
+        Returns:
+            bool: True if the app was relaunched
+        """
+        app_id = Config.ANDROID_APP_PACKAGE if Config.is_android() else Config.IOS_BUNDLE_ID
+        try:
+            driver.terminate_app(app_id)
+            driver.activate_app(app_id)
+            DriverFactory.logger.info(f"Restarted app {app_id}")
+            return True
+        except Exception as e:
+            DriverFactory.logger.error(f"Failed to restart app {app_id}: {e}")
+            return False
@@ -0,0 +1,235 @@
+"""Structured event stream for page objects and utilities."""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from config.config import Config
+from utilities.tracing import Tracer
+
+
+class Event:
+    """
+    A single structured event.
+
+    Events only store raw field values; nothing is formatted until a sink
+    serializes them, so emitting on the hot path costs one object
+    allocation.
+    """
+
+    __slots__ = (
+        "ts", "test_id", "page", "action", "locator", "duration", "outcome",
+        "fields",
+    )
+
+    def __init__(self, test_id, page, action, locator, duration, outcome, fields):
+        self.ts = time.time()
+        self.test_id = test_id
+        self.page = page
+        self.action = action
+        self.locator = locator
+        self.duration = duration
+        self.outcome = outcome
+        self.fields = fields
+
+    def to_dict(self):
+        """Return the event as a JSON-serializable dict."""
+        data = {
+            "ts": self.ts,
+            "test_id": self.test_id,
+            "page": self.page,
+            "action": self.action,
+            "locator": list(self.locator) if self.locator else None,
+            "duration": self.duration,
+            "outcome": self.outcome,
+        }
+        if self.fields:
+            data.update(self.fields)
+        return data
+
+
+class JsonlSink:
+    """
+    Buffered JSON Lines writer.
+
+    Events are kept in memory and written in batches of ``buffer_size``;
+    the output file and its directory are only created on the first flush.
+    """
+
+    def __init__(self, path=None, buffer_size=None):
+        """
+        Initialize the sink.
+
+        Args:
+            path (str, optional): Output file; defaults to a timestamped
+                file under ``Config.EVENTS_DIR``
+            buffer_size (int, optional): Events held before writing
+        """
+        if path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(Config.EVENTS_DIR, f"events_{timestamp}.jsonl")
+        self.path = path
+        self.buffer_size = buffer_size or Config.EVENTS_BUFFER_SIZE
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def consume(self, event):
+        """Buffer an event, flushing when the buffer is full."""
+        with self._lock:
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.buffer_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered events to disk."""
+        with self._lock:
+            pending, self._buffer = self._buffer, []
+            if not pending:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.writelines(
+                    json.dumps(event.to_dict(), default=str, separators=(",", ":")) + "\n"
+                    for event in pending
+                )
+
+    def close(self):
+        """Flush remaining events."""
+        self.flush()
+
+
+class EventBus:
+    """
+    Process-wide event dispatcher.
+
+    Page objects and utilities call ``EventBus.emit``; when no sink is
+    registered the call returns before building an event. The current test
+    id is set by the pytest hooks in ``conftest.py`` and attached to every
+    event automatically.
+    """
+
+    sinks = []
+    test_id = None
+
+    @classmethod
+    def add_sink(cls, sink):
+        """Register a sink; it receives every subsequent event."""
+        cls.sinks.append(sink)
+        return sink
+
+    @classmethod
+    def close(cls):
+        """Flush and detach all sinks."""
+        for sink in cls.sinks:
+            sink.close()
+        cls.sinks = []
+
+    @classmethod
+    def set_test(cls, test_id):
+        """Set (or clear with None) the test id attached to events."""
+        cls.test_id = test_id
+
+    @classmethod
+    def emit(cls, action, page=None, locator=None, duration=None,
+             outcome="ok", **fields):
+        """
+        Emit an event to all sinks.
+
+        Args:
+            action (str): Action name, e.g. "click" or "enter_email"
+            page (str, optional): Page object or utility name
+            locator (tuple, optional): Locator involved
+            duration (float, optional): Duration in seconds
+            outcome (str): "ok", "error", "timeout", ...
+            **fields: Additional event fields
+        """
+        if not cls.sinks:
+            return
+        event = Event(cls.test_id, page, action, locator, duration, outcome, fields)
+        for sink in cls.sinks:
+            sink.consume(event)
+
+    @staticmethod
+    def read(path):
+        """
+        Stream events back from a JSONL file.
+
+        Args:
+            path (str): Event file written by ``JsonlSink``
+
+        Yields:
+            dict: One event per line
+        """
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def summarize(path):
+        """
+        Aggregate an event file per (page, action).
+
+        Args:
+            path (str): Event file written by ``JsonlSink``
+
+        Returns:
+            dict: {(page, action): {"count", "errors", "total_duration",
+            "max_duration"}}
+        """
+        summary = defaultdict(
+            lambda: {"count": 0, "errors": 0, "total_duration": 0.0, "max_duration": 0.0}
+        )
+        for event in EventBus.read(path):
+            stats = summary[(event["page"], event["action"])]
+            stats["count"] += 1
+            if event["outcome"] != "ok":
+                stats["errors"] += 1
+            duration = event.get("duration") or 0.0
+            stats["total_duration"] += duration
+            stats["max_duration"] = max(stats["max_duration"], duration)
+        return dict(summary)
+
+
+def page_action(locator_key=None):
+    """
+    Decorator emitting one event and one trace span per page-object action.
+
+    Args:
+        locator_key (str, optional): Key into ``self.locators`` recorded as
+            the event locator
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not EventBus.sinks:
+                if not Tracer.recording:
+                    return func(self, *args, **kwargs)
+                with Tracer.span(f"{type(self).__name__}.{func.__name__}", "page"):
+                    return func(self, *args, **kwargs)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                with Tracer.span(f"{type(self).__name__}.{func.__name__}", "page"):
+                    result = func(self, *args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                locators = getattr(self, "locators", None) or {}
+                EventBus.emit(
+                    func.__name__,
+                    page=type(self).__name__,
+                    locator=locators.get(locator_key) if locator_key else None,
+                    duration=time.perf_counter() - start,
+                    outcome=outcome,
+                )
+        return wrapper
+    return decorator
@@ -0,0 +1,195 @@
+"""Concurrent failure-evidence capture bundled into one compressed artifact."""
+
+import io
+import json
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from config.config import Config
+from utilities.artifact_store import ArtifactStore
+from utilities.device_log import DeviceLogCollector
+from utilities.events import EventBus
+from utilities.logger import Logger
+
+
+class FailureEvidence:
+    """
+    Collect diagnostics from a failed test's session in parallel.
+
+    The screenshot, page source, device log and session capabilities are
+    fetched concurrently on a shared thread pool. All captures share one
+    deadline of ``timeout`` seconds: anything still running by then is
+    recorded as timed out and abandoned, so a hung device adds at most
+    ``timeout`` to teardown. Whatever was captured is written, together with
+    a manifest of per-capture status and timings, into a single ``.tar.gz``
+    stored in the artifact store.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    # Capability keys whose values are never written to bundles
+    SECRET_KEYS = ("token", "password", "secret", "key")
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, driver, timeout=None, log_lines=None):
+        """
+        Initialize the collector.
+
+        Args:
+            driver (webdriver.Remote): Session of the failed test
+            timeout (float, optional): Deadline for all captures in seconds
+            log_lines (int, optional): Device log lines to keep when the
+                failed test's window of a running ``DeviceLogCollector``
+                is not available
+        """
+        self.driver = driver
+        self.timeout = timeout if timeout is not None else Config.EVIDENCE_TIMEOUT
+        self.log_lines = log_lines if log_lines is not None else Config.EVIDENCE_LOG_LINES
+
+    @classmethod
+    def executor(cls):
+        """Return the process-wide capture pool."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=Config.EVIDENCE_WORKERS, thread_name_prefix="evidence"
+                )
+            return cls._executor
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def capture(self, name, test_id=None):
+        """
+        Collect all evidence and store it as one compressed bundle.
+
+        Args:
+            name (str): Bundle name, usually derived from the test name
+            test_id (str, optional): Test that failed
+
+        Returns:
+            str: Stored bundle path, or empty string if nothing was captured
+        """
+        start = time.perf_counter()
+        results = self.collect(test_id)
+        files = {result["file"]: result.pop("data") for result in results.values()
+                 if result.get("data") is not None}
+        if not files:
+            self.logger.error("No failure evidence could be captured for %s", name)
+            EventBus.emit("capture_evidence", page=type(self).__name__,
+                          duration=time.perf_counter() - start, outcome="error")
+            return ""
+
+        files["manifest.json"] = json.dumps(
+            {"test_id": test_id, "captures": results}, indent=2
+        ).encode("utf-8")
+        path = ArtifactStore.shared().put_bytes(
+            self.bundle(files), name, kind="failure_bundle", extension=".tar.gz",
+            test_id=test_id,
+        )
+        missing = sorted(n for n, result in results.items() if result["status"] != "ok")
+        self.logger.info("Failure evidence saved: %s (missing: %s)", path, missing or "none")
+        EventBus.emit("capture_evidence", page=type(self).__name__,
+                      duration=time.perf_counter() - start,
+                      outcome="ok" if not missing else "partial", path=path, missing=missing)
+        return path
+
+    def collect(self, test_id=None):
+        """
+        Run every capture concurrently under the shared deadline.
+
+        Args:
+            test_id (str, optional): Test whose device log window to keep
+
+        Returns:
+            dict: Capture name to ``{"status", "seconds", "file", "data"}``;
+            ``status`` is "ok", "error" or "timeout"
+        """
+        captures = {
+            "screenshot": ("screenshot.png", self._screenshot),
+            "page_source": ("page_source.xml", self._page_source),
+            "device_log": ("device.log", lambda: self._device_log(test_id)),
+            "capabilities": ("capabilities.json", self._capabilities),
+        }
+        started = time.perf_counter()
+        futures = {
+            self.executor().submit(self._timed, func): (name, filename)
+            for name, (filename, func) in captures.items()
+        }
+        wait(futures, timeout=self.timeout)
+
+        results = {}
+        for future, (name, filename) in futures.items():
+            result = {"file": filename, "status": "timeout", "seconds": None, "data": None}
+            if future.done():
+                data, seconds, error = future.result()
+                result.update(seconds=round(seconds, 3), data=data,
+                              status="ok" if error is None else "error")
+                if error is not None:
+                    result["error"] = error
+            else:
+                future.cancel()
+                result["seconds"] = round(time.perf_counter() - started, 3)
+            results[name] = result
+        return results
+
+    @staticmethod
+    def bundle(files):
+        """
+        Pack files into an in-memory ``.tar.gz``.
+
+        Args:
+            files (dict): Archive member name to bytes
+
+        Returns:
+            bytes: Compressed archive
+        """
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=6) as archive:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                archive.addfile(info, io.BytesIO(data))
+        return buffer.getvalue()
+
+    # ---------------- CAPTURES ---------------- #
+
+    @staticmethod
+    def _timed(func):
+        start = time.perf_counter()
+        try:
+            return func(), time.perf_counter() - start, None
+        except Exception as e:
+            return None, time.perf_counter() - start, str(e)
+
+    def _screenshot(self):
+        return self.driver.get_screenshot_as_png()
+
+    def _page_source(self):
+        return self.driver.page_source.encode("utf-8")
+
+    def _device_log(self, test_id=None):
+        collector = DeviceLogCollector.for_driver(self.driver)
+        if collector is not None:
+            # get_log is incremental, so the running collector owns the stream
+            collector.poll()
+            window = collector.window(f"START {test_id}", f"END {test_id}") if test_id else []
+            lines = window or collector.lines()[-self.log_lines:]
+        else:
+            entries = self.driver.get_log(DeviceLogCollector.platform_log_type())[-self.log_lines:]
+            lines = [
+                f"{entry.get('timestamp', '')} {entry.get('level', '')} {entry.get('message', '')}"
+                for entry in entries
+            ]
+        return "\n".join(lines).encode("utf-8")
+
+    def _capabilities(self):
+        capabilities = {
+            key: "<redacted>" if any(secret in key.lower() for secret in self.SECRET_KEYS) else value
+            for key, value in dict(self.driver.capabilities).items()
+        }
+        return json.dumps(capabilities, indent=2, sort_keys=True, default=str).encode("utf-8")
@@ -0,0 +1,242 @@
+"""Per-test outcome history, flakiness scores and budgeted in-session reruns."""
+
+import json
+import os
+from collections import namedtuple
+
+import pytest
+
+from config.config import Config
+from utilities.logger import Logger
+from utilities.watchdog import WatchdogTimeout
+
+FlakeStats = namedtuple(
+    "FlakeStats", ["runs", "failures", "fail_rate", "failure_transition_rate", "score"]
+)
+
+
+def is_verdict(exception):
+    """
+    Whether a test outcome is pass/fail evidence (not a skip, xfail or interrupt).
+
+    Args:
+        exception (BaseException): What the test raised, or None if it passed
+
+    Returns:
+        bool: True for a pass or a failure
+    """
+    if exception is None:
+        return True
+    if isinstance(exception, (pytest.skip.Exception, pytest.xfail.Exception)):
+        return False
+    # pytest.fail() and watchdog timeouts are BaseExceptions but still failures
+    return isinstance(exception, (Exception, pytest.fail.Exception, WatchdogTimeout))
+
+
+class FlakeTracker:
+    """
+    Track pass/fail history across runs and rerun flaky failures at once.
+
+    History is kept per test id as the last ``window`` outcomes ("P"/"F").
+    The flakiness score is the failure-transition rate: the fraction of
+    passes that were immediately followed by a failure. A test that fails
+    every time scores 0 (a true failure), a fresh regression after a long
+    passing streak scores close to 0, and a test that fails intermittently
+    scores roughly its intermittent failure rate.
+
+    A failed test whose score reaches ``threshold`` (after at least
+    ``min_runs`` recorded outcomes) is rerun straight away, while its device
+    session is still warm, up to ``max_reruns`` times. Reruns across the
+    whole run are capped by ``budget``.
+    """
+
+    PASS = "P"
+    FAIL = "F"
+
+    def __init__(self, path=None, window=None, threshold=None, min_runs=None,
+                 max_reruns=None, budget=None):
+        """
+        Initialize the tracker.
+
+        Args:
+            path (str, optional): History file
+            window (int, optional): Outcomes kept per test
+            threshold (float, optional): Score at which failures are rerun
+            min_runs (int, optional): History needed before scoring a test
+            max_reruns (int, optional): Reruns per failing test
+            budget (int, optional): Reruns per test run
+        """
+        self.logger = Logger.get_logger(__name__)
+        self.path = path or Config.FLAKE_HISTORY_PATH
+        self.window = window or Config.FLAKE_HISTORY_WINDOW
+        self.threshold = threshold if threshold is not None else Config.FLAKE_RERUN_THRESHOLD
+        self.min_runs = min_runs if min_runs is not None else Config.FLAKE_MIN_RUNS
+        self.max_reruns = max_reruns if max_reruns is not None else Config.FLAKE_MAX_RERUNS
+        self.budget = budget if budget is not None else Config.FLAKE_RERUN_BUDGET
+        self.budget_used = 0
+        self.flaky = {}
+        self.failed = {}
+        self._history = None
+        self._new = {}
+
+    # ---------------- HISTORY ---------------- #
+
+    def record(self, nodeid, passed):
+        """
+        Append one outcome to a test's history.
+
+        Args:
+            nodeid (str): Test id
+            passed (bool): Whether the attempt passed
+        """
+        self._new[nodeid] = self._new.get(nodeid, "") + (self.PASS if passed else self.FAIL)
+
+    def history(self, nodeid):
+        """
+        Stored and current-run outcomes of a test, oldest first.
+
+        Args:
+            nodeid (str): Test id
+
+        Returns:
+            str: Outcome string such as "PPFPP"
+        """
+        outcomes = self._load().get(nodeid, "") + self._new.get(nodeid, "")
+        return outcomes[-self.window:]
+
+    def stats(self, nodeid):
+        """
+        Compute flakiness statistics for a test.
+
+        Args:
+            nodeid (str): Test id
+
+        Returns:
+            FlakeStats: Run and failure counts, rates and score
+        """
+        outcomes = self.history(nodeid)
+        runs = len(outcomes)
+        failures = outcomes.count(self.FAIL)
+        # Passes that have a next outcome, and how many of those were followed by a failure
+        passes = outcomes[:-1].count(self.PASS)
+        transitions = outcomes.count(self.PASS + self.FAIL)
+        transition_rate = transitions / passes if passes else 0.0
+        return FlakeStats(
+            runs=runs,
+            failures=failures,
+            fail_rate=failures / runs if runs else 0.0,
+            failure_transition_rate=transition_rate,
+            score=transition_rate if runs >= self.min_runs else 0.0,
+        )
+
+    def save(self):
+        """
+        Merge this run's outcomes into the history file.
+
+        The file is re-read before writing so parallel workers only append
+        the outcomes they recorded.
+        """
+        if not self._new:
+            return
+        self._history = None
+        history = self._load()
+        for nodeid, outcomes in self._new.items():
+            history[nodeid] = (history.get(nodeid, "") + outcomes)[-self.window:]
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(history, handle, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+        self._new = {}
+
+    # ---------------- RERUNS ---------------- #
+
+    def should_rerun(self, nodeid, reruns=0):
+        """
+        Decide whether a failed test gets another in-session attempt.
+
+        Args:
+            nodeid (str): Test id
+            reruns (int): Reruns already spent on this test in this run
+
+        Returns:
+            bool: True if the test is flaky and budget remains
+        """
+        if reruns >= self.max_reruns or self.budget_used >= self.budget:
+            return False
+        return self.stats(nodeid).score >= self.threshold > 0
+
+    def retry(self, nodeid, attempt, reset=None):
+        """
+        Rerun a failed test while it scores as flaky and budget remains.
+
+        The first failure must already be recorded. Every rerun is recorded
+        too, so a pass after a failure feeds back into the score. A rerun
+        that times out ends the retries: its session is gone. Skips and
+        interrupts raised by a rerun propagate unrecorded.
+
+        Args:
+            nodeid (str): Test id
+            attempt (callable): Runs the test once, raising on failure
+            reset (callable, optional): Returns the app to a clean state
+                before each rerun; returns False if that was not possible
+
+        Returns:
+            bool: True if a rerun passed
+        """
+        reruns = 0
+        while self.should_rerun(nodeid, reruns):
+            if reset is not None and not reset():
+                break
+            reruns += 1
+            self.budget_used += 1
+            self.logger.info("Rerunning flaky test %s (attempt %d, score %.2f)",
+                             nodeid, reruns + 1, self.stats(nodeid).score)
+            try:
+                attempt()
+            except (Exception, pytest.fail.Exception) as e:
+                self.record(nodeid, False)
+                self.logger.info("Rerun of %s failed: %s", nodeid, e)
+                continue
+            except WatchdogTimeout as e:
+                self.record(nodeid, False)
+                self.logger.warning("Rerun of %s timed out: %s", nodeid, e)
+                break
+            self.record(nodeid, True)
+            self.flaky[nodeid] = reruns
+            return True
+        self.failed[nodeid] = reruns
+        return False
+
+    def summary_lines(self):
+        """
+        Report lines separating flaky passes from true failures.
+
+        Returns:
+            list: Human-readable lines
+        """
+        lines = [f"rerun budget used: {self.budget_used}/{self.budget}"]
+        for nodeid, reruns in sorted(self.flaky.items()):
+            stats = self.stats(nodeid)
+            lines.append(f"FLAKY  {nodeid} passed on rerun {reruns} "
+                         f"(score {stats.score:.2f}, {stats.failures}/{stats.runs} failed)")
+        for nodeid, reruns in sorted(self.failed.items()):
+            stats = self.stats(nodeid)
+            lines.append(f"FAILED {nodeid} after {reruns} reruns "
+                         f"(score {stats.score:.2f}, {stats.failures}/{stats.runs} failed)")
+        return lines
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _load(self):
+        if self._history is None:
+            try:
+                with open(self.path, encoding="utf-8") as handle:
+                    self._history = json.load(handle)
+            except FileNotFoundError:
+                self._history = {}
+            except (OSError, ValueError) as e:
+                self.logger.warning("Ignoring unreadable flake history %s: %s", self.path, e)
+                self._history = {}
+        return self._history
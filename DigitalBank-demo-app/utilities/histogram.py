@@ -0,0 +1,150 @@
+"""HDR-style latency histogram with bounded relative error and fixed memory."""
+
+import math
+from array import array
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of integer values (microseconds by convention).
+
+    Values below ``2 ** sub_bucket_bits`` are counted exactly. Above that,
+    each power-of-two range is split into ``2 ** (sub_bucket_bits - 1)``
+    equal buckets, so any recorded value is known to within
+    ``1 / 2 ** (sub_bucket_bits - 1)`` of itself (under 1% for the default
+    8 bits, i.e. two significant digits) however large it is. Counts live
+    in an ``array('q')`` that grows with the largest value, a few KB for
+    latencies up to hours. Histograms with the same resolution can be
+    merged, e.g. per-interval or per-device histograms into a total.
+    """
+
+    PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99, 100.0)
+
+    def __init__(self, sub_bucket_bits=8):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            sub_bucket_bits (int): Resolution; relative error is 2 ** -(bits - 1)
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.counts = array("q", bytes(8 * self.sub_bucket_count))
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.sum = 0
+
+    def __len__(self):
+        return self.total
+
+    # ---------------- RECORDING ---------------- #
+
+    def record(self, value, count=1):
+        """
+        Count a value.
+
+        Args:
+            value (int): Non-negative value; floats are rounded
+            count (int): Number of occurrences
+        """
+        value = int(round(value))
+        if value < 0:
+            raise ValueError(f"Histogram values must be non-negative, got {value}")
+        index = self._index(value)
+        if index >= len(self.counts):
+            self.counts.extend(bytes(8 * (index + 1 - len(self.counts))))
+        self.counts[index] += count
+        self.total += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_seconds(self, seconds):
+        """Record a duration given in seconds as microseconds."""
+        self.record(seconds * 1_000_000)
+
+    def merge(self, other):
+        """
+        Add another histogram's counts to this one.
+
+        Args:
+            other (LatencyHistogram): Histogram with the same resolution
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms of different resolution")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend(bytes(8 * (len(other.counts) - len(self.counts))))
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    # ---------------- QUERIES ---------------- #
+
+    def mean(self):
+        """Mean of the recorded values (exact), or None if empty."""
+        return self.sum / self.total if self.total else None
+
+    def percentile(self, percentile):
+        """
+        Value at or below which ``percentile`` percent of values fall.
+
+        Returns the highest value equivalent to the bucket holding that
+        rank, capped by the exact maximum.
+
+        Args:
+            percentile (float): 0-100
+
+        Returns:
+            int: Value, or None if empty
+        """
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(percentile / 100.0 * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """
+        Several percentiles at once.
+
+        Returns:
+            dict: Percentile to value
+        """
+        return {p: self.percentile(p) for p in percentiles}
+
+    def to_dict(self):
+        """Summary of the distribution, suitable for JSON reports."""
+        return {
+            "count": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean(),
+            "percentiles": {str(p): value for p, value in self.percentiles().items()},
+        }
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _index(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def _highest_equivalent(self, index):
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return ((offset + self.half_count + 1) << shift) - 1
@@ -0,0 +1,278 @@
+"""Cold and warm app launch-time measurement on an existing session."""
+
+import json
+import math
+import os
+import statistics
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from config.config import Config
+from utilities.logger import Logger
+
+LaunchStats = namedtuple(
+    "LaunchStats",
+    "mode samples rejected mean median stdev ci_low ci_high minimum maximum",
+)
+
+# Two-sided 95% Student t critical values by degrees of freedom
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 25: 2.060, 30: 2.042,
+    40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def t_critical(df):
+    """95% two-sided t critical value, rounding df down to the nearest tabulated one."""
+    if df < 1:
+        return float("nan")
+    eligible = [key for key in _T95 if key <= df]
+    return _T95[max(eligible)] if df <= 120 else 1.960
+
+
+def reject_outliers(samples, method="iqr"):
+    """
+    Split samples into kept values and rejected outliers.
+
+    Args:
+        samples (list): Launch times in seconds
+        method (str): "iqr" (Tukey fences at 1.5 IQR), "mad" (more than
+            3.5 scaled median absolute deviations from the median) or "none"
+
+    Returns:
+        tuple: (kept, rejected) lists
+    """
+    if method == "none" or len(samples) < 4:
+        return list(samples), []
+    if method == "iqr":
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        keep = [low <= value <= high for value in samples]
+    elif method == "mad":
+        median = statistics.median(samples)
+        mad = statistics.median(abs(value - median) for value in samples)
+        if mad == 0:
+            return list(samples), []
+        keep = [0.6745 * abs(value - median) / mad <= 3.5 for value in samples]
+    else:
+        raise ValueError(f"Unknown outlier rejection method: {method}")
+    kept = [value for value, ok in zip(samples, keep) if ok]
+    rejected = [value for value, ok in zip(samples, keep) if not ok]
+    return kept, rejected
+
+
+def launch_stats(mode, samples, outliers="iqr"):
+    """
+    Summarize launch times with a 95% confidence interval of the mean.
+
+    Args:
+        mode (str): "cold" or "warm"
+        samples (list): Launch times in seconds
+        outliers (str): Outlier rejection method (see ``reject_outliers``)
+
+    Returns:
+        LaunchStats: Statistics over the kept samples
+    """
+    kept, rejected = reject_outliers(samples, outliers)
+    if not kept:
+        nan = float("nan")
+        return LaunchStats(mode, [], rejected, nan, nan, nan, nan, nan, nan, nan)
+    mean = statistics.fmean(kept)
+    stdev = statistics.stdev(kept) if len(kept) > 1 else 0.0
+    margin = t_critical(len(kept) - 1) * stdev / math.sqrt(len(kept)) if len(kept) > 1 else float("nan")
+    return LaunchStats(
+        mode, kept, rejected, mean, statistics.median(kept), stdev,
+        mean - margin, mean + margin, min(kept), max(kept),
+    )
+
+
+class LaunchBenchmark:
+    """
+    Repeatedly launch the app in the current session and time how long
+    its first screen takes to show a signature element.
+
+    A cold launch terminates the app process first; a warm launch only
+    sends it to the background. Each launch is timed from the launch
+    command until ``locator`` is displayed, so Appium round trips are
+    included; the polling itself uses no implicit wait. The first
+    ``warmup`` launches of each mode are discarded.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    MODES = ("cold", "warm")
+
+    def __init__(self, driver, locator, app_id=None, runs=None, warmup=None, outliers=None,
+                 timeout=None, clock=time.perf_counter):
+        """
+        Initialize the benchmark.
+
+        Args:
+            driver (webdriver.Remote): Session to launch the app in
+            locator (tuple): (By, value) of the first screen's signature element
+            app_id (str, optional): Package or bundle id; defaults to the configured app
+            runs (int, optional): Measured launches per mode
+            warmup (int, optional): Discarded launches per mode
+            outliers (str, optional): Outlier rejection method
+            timeout (float, optional): Seconds to wait for one launch
+            clock (callable): Monotonic time source
+        """
+        self.driver = driver
+        self.locator = locator
+        self.app_id = app_id or (Config.ANDROID_APP_PACKAGE if Config.is_android() else Config.IOS_BUNDLE_ID)
+        self.runs = runs if runs is not None else Config.LAUNCH_BENCH_RUNS
+        self.warmup = warmup if warmup is not None else Config.LAUNCH_BENCH_WARMUP
+        self.outliers = outliers or Config.LAUNCH_BENCH_OUTLIERS
+        self.timeout = timeout if timeout is not None else Config.LAUNCH_BENCH_TIMEOUT
+        self.clock = clock
+
+    def run(self, modes=MODES):
+        """
+        Measure every mode.
+
+        Args:
+            modes (tuple): Launch modes to measure
+
+        Returns:
+            dict: Mode to ``LaunchStats``
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            return {mode: launch_stats(mode, self.measure(mode), self.outliers) for mode in modes}
+        finally:
+            self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+    def measure(self, mode):
+        """
+        Launch ``warmup + runs`` times and return the measured times.
+
+        Args:
+            mode (str): "cold" or "warm"
+
+        Returns:
+            list: Launch times in seconds, warm-up runs excluded
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown launch mode: {mode}")
+        samples = []
+        for index in range(self.warmup + self.runs):
+            seconds = self.launch(mode)
+            if index >= self.warmup:
+                samples.append(seconds)
+            self.logger.debug("%s launch %d: %.3fs%s", mode, index + 1, seconds,
+                              " (warm-up)" if index < self.warmup else "")
+        return samples
+
+    def launch(self, mode):
+        """
+        Perform and time one launch.
+
+        Args:
+            mode (str): "cold" or "warm"
+
+        Returns:
+            float: Seconds until the signature element was displayed
+        """
+        if mode == "cold":
+            self.driver.terminate_app(self.app_id)
+        else:
+            self.driver.background_app(-1)
+        start = self.clock()
+        self.driver.activate_app(self.app_id)
+        deadline = start + self.timeout
+        while True:
+            elements = self.driver.find_elements(*self.locator)
+            if elements and elements[0].is_displayed():
+                return self.clock() - start
+            if self.clock() > deadline:
+                raise TimeoutError(f"{mode} launch: {self.locator} not visible after {self.timeout}s")
+
+
+class LaunchHistory:
+    """
+    Launch results appended as JSON Lines for trend comparison.
+
+    A run is compared with the latest earlier entry for the same platform
+    and device. A mode regresses when its confidence intervals no longer
+    overlap and the mean grew by more than ``threshold``.
+    """
+
+    def __init__(self, path=None, threshold=None):
+        """
+        Initialize the history.
+
+        Args:
+            path (str, optional): History file
+            threshold (float, optional): Relative mean increase treated as a regression
+        """
+        self.path = path or Config.LAUNCH_HISTORY_PATH
+        self.threshold = threshold if threshold is not None else Config.LAUNCH_BENCH_REGRESSION
+
+    def entries(self):
+        """All stored runs, oldest first."""
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return [json.loads(line) for line in handle if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def previous(self, platform, device):
+        """
+        Latest stored run on the same platform and device.
+
+        Returns:
+            dict: History entry, or None
+        """
+        matches = [entry for entry in self.entries()
+                   if entry.get("platform") == platform and entry.get("device") == device]
+        return matches[-1] if matches else None
+
+    def append(self, results, platform, device, build=""):
+        """
+        Store a run.
+
+        Args:
+            results (dict): Mode to ``LaunchStats``
+            platform (str): Platform name
+            device (str): Device name
+            build (str): App build under test
+
+        Returns:
+            dict: The stored entry
+        """
+        entry = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform,
+            "device": device,
+            "build": build,
+            "modes": {mode: stats._asdict() for mode, stats in results.items()},
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+        return entry
+
+    def compare(self, results, previous):
+        """
+        Compare a run with an earlier entry.
+
+        Args:
+            results (dict): Mode to ``LaunchStats``
+            previous (dict): Earlier history entry
+
+        Returns:
+            list: (mode, change, regressed) tuples; change is the relative
+            difference of the means
+        """
+        comparison = []
+        for mode, stats in results.items():
+            before = previous.get("modes", {}).get(mode)
+            if not before or not before.get("mean"):
+                continue
+            change = stats.mean / before["mean"] - 1
+            separated = stats.ci_low > before["ci_high"]
+            comparison.append((mode, change, bool(separated and change > self.threshold)))
+        return comparison
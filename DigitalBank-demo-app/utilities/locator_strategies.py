@@ -0,0 +1,24 @@
+"""Locator strategy names used by page objects."""
+
+
+class AppiumBy:
+    """
+    Lightweight mirror of ``appium.webdriver.common.appiumby.AppiumBy``.
+
+    Locator tuples only need the strategy strings, but importing Appium's
+    class pulls in the whole ``appium.webdriver`` and Selenium stack
+    (~200 ms). Page objects use this class so importing them - e.g. during
+    test collection - stays cheap; the values are identical, so the
+    tuples work unchanged with ``driver.find_element``.
+    """
+
+    ID = "id"
+    XPATH = "xpath"
+    NAME = "name"
+    CLASS_NAME = "class name"
+    ACCESSIBILITY_ID = "accessibility id"
+    ANDROID_UIAUTOMATOR = "-android uiautomator"
+    ANDROID_VIEWTAG = "-android viewtag"
+    IOS_PREDICATE = "-ios predicate string"
+    IOS_CLASS_CHAIN = "-ios class chain"
+    IMAGE = "-image"
@@ -0,0 +1,251 @@
+"""Offline validation of page-object locators against captured page sources.
+
+Capture the current screen of a live session as a fixture (the app must be
+on that screen; with several names you are prompted to navigate between
+captures):
+    python -m utilities.locator_validation capture login [registration ...]
+
+Validate every catalogued page object for both platforms, without a device:
+    python -m utilities.locator_validation validate [--platform android|ios]
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+import time
+from collections import namedtuple
+
+from config.config import Config
+from utilities.logger import Logger
+from utilities.page_source import PageSource
+
+LocatorCheck = namedtuple(
+    "LocatorCheck", "platform screen name role locator status matches fixtures slow"
+)
+
+# Screen name (fixture file prefix) -> page object class
+PAGE_CATALOG = {
+    "login": "pages.login_page.LoginPage",
+    "registration": "pages.registration_page.RegistrationPage",
+    "welcome": "pages.welcome_page.WelcomePage",
+}
+
+# Strategies that are slow on a device, with the reason
+SLOW_STRATEGIES = {
+    "xpath": "XPath serializes and walks the whole hierarchy on every lookup",
+    "-image": "image matching screenshots the device on every lookup",
+}
+
+PLATFORMS = ("android", "ios")
+
+
+def page_locators(class_path, platform):
+    """
+    Read a page object's locators for a platform without a device.
+
+    The page is built with no driver while ``Config.PLATFORM`` is switched
+    to ``platform``. Pages that keep both platforms in one dict (keyed
+    "android"/"ios") are handled too.
+
+    Args:
+        class_path (str): Dotted path of the page class
+        platform (str): "android" or "ios"
+
+    Returns:
+        dict: Locator name to locator tuple
+    """
+    module_name, class_name = class_path.rsplit(".", 1)
+    page_class = getattr(importlib.import_module(module_name), class_name)
+    original = Config.PLATFORM
+    Config.PLATFORM = platform
+    try:
+        locators = page_class(None).locators
+    finally:
+        Config.PLATFORM = original
+    return locators.get(platform, {}) if set(locators) <= set(PLATFORMS) else locators
+
+
+class LocatorValidator:
+    """
+    Evaluate page-object locators against page-source fixtures.
+
+    Fixtures are ``<fixtures_dir>/<platform>/<screen>.xml``. Variants of a
+    screen such as ``login-error.xml`` (the login screen showing its error
+    message) are merged with it. A locator is checked against every
+    variant of its screen:
+
+    - ``ok``: it matches exactly one element in the variant(s) where it
+      appears
+    - ``miss``: it matches nothing in any variant
+    - ``ambiguous``: it matches several elements in some variant
+    - ``unsupported``: it cannot be evaluated offline
+
+    Every status also flags ``slow`` strategies. Healing alternates are
+    checked as well, and reported with role "alternate N".
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, fixtures_dir=None, catalog=None):
+        """
+        Initialize the validator.
+
+        Args:
+            fixtures_dir (str, optional): Fixture root directory
+            catalog (dict, optional): Screen name to page class path
+        """
+        self.fixtures_dir = fixtures_dir or Config.PAGE_SOURCE_FIXTURES_DIR
+        self.catalog = catalog or PAGE_CATALOG
+
+    def fixtures(self, platform, screen):
+        """
+        Fixture files of a screen, base screen first.
+
+        Returns:
+            list: Paths
+        """
+        directory = os.path.join(self.fixtures_dir, platform)
+        base = os.path.join(directory, f"{screen}.xml")
+        variants = sorted(glob.glob(os.path.join(directory, f"{screen}-*.xml")))
+        return ([base] if os.path.exists(base) else []) + variants
+
+    def validate(self, platforms=PLATFORMS):
+        """
+        Check every locator of every catalogued screen that has fixtures.
+
+        Args:
+            platforms (tuple): Platforms to check
+
+        Returns:
+            list: ``LocatorCheck`` results
+        """
+        results = []
+        for platform in platforms:
+            for screen, class_path in sorted(self.catalog.items()):
+                paths = self.fixtures(platform, screen)
+                if not paths:
+                    self.logger.debug("No %s fixtures for screen '%s'", platform, screen)
+                    continue
+                snapshots = [PageSource(self._read(path)) for path in paths]
+                names = [os.path.basename(path) for path in paths]
+                for name, locator in page_locators(class_path, platform).items():
+                    candidates = [("primary", tuple(locator))] + [
+                        (f"alternate {rank}", tuple(alternate))
+                        for rank, alternate in enumerate(getattr(locator, "alternates", ()), 1)
+                    ]
+                    for role, candidate in candidates:
+                        results.append(self.check(platform, screen, name, role, candidate,
+                                                  snapshots, names))
+        return results
+
+    @staticmethod
+    def check(platform, screen, name, role, locator, snapshots, fixture_names):
+        """
+        Evaluate one locator against a screen's snapshots.
+
+        Returns:
+            LocatorCheck: Result
+        """
+        counts = [snapshot.find_all(locator, visible_only=False) for snapshot in snapshots]
+        if any(nodes is None for nodes in counts):
+            status, matches, found = "unsupported", 0, []
+        else:
+            found = [fixture for fixture, nodes in zip(fixture_names, counts) if nodes]
+            matches = max(len(nodes) for nodes in counts)
+            status = "miss" if matches == 0 else "ambiguous" if matches > 1 else "ok"
+        return LocatorCheck(platform, screen, name, role, locator, status, matches, found,
+                            locator[0] in SLOW_STRATEGIES)
+
+    @staticmethod
+    def report_lines(results, verbose=False):
+        """
+        Human-readable report; passing fast primaries only with ``verbose``.
+
+        Returns:
+            list: Lines
+        """
+        lines = []
+        for result in results:
+            if result.status == "ok" and not result.slow and not verbose:
+                continue
+            label = result.status.upper() + (" SLOW" if result.slow else "")
+            detail = f"{result.matches} matches" if result.status == "ambiguous" else ""
+            if result.slow:
+                detail = (detail + "; " if detail else "") + SLOW_STRATEGIES[result.locator[0]]
+            lines.append(
+                f"{label:<16} {result.platform}/{result.screen}.{result.name} ({result.role}) "
+                f"{result.locator[0]}={result.locator[1]!r}" + (f"  [{detail}]" if detail else "")
+            )
+        return lines
+
+    @staticmethod
+    def _read(path):
+        with open(path, encoding="utf-8") as handle:
+            return handle.read()
+
+
+def capture(driver, screens, fixtures_dir=None, platform=None, prompt=input):
+    """
+    Save the live page source of each screen as a fixture.
+
+    Args:
+        driver (webdriver.Remote): Live session
+        screens (list): Screen names; the first is captured as shown
+        fixtures_dir (str, optional): Fixture root directory
+        platform (str, optional): Platform directory; defaults to the current one
+        prompt (callable): Called before each later capture
+
+    Returns:
+        list: Written paths
+    """
+    directory = os.path.join(fixtures_dir or Config.PAGE_SOURCE_FIXTURES_DIR, platform or Config.PLATFORM)
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for index, screen in enumerate(screens):
+        if index:
+            prompt(f"Navigate to the '{screen}' screen and press Enter ")
+        path = os.path.join(directory, f"{screen}.xml")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(driver.page_source)
+        written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    capture_parser = commands.add_parser("capture", help="Save live page sources as fixtures")
+    capture_parser.add_argument("screens", nargs="+",
+                                help="Screen names, e.g. login or login-error for a variant")
+    validate_parser = commands.add_parser("validate", help="Check locators against fixtures")
+    validate_parser.add_argument("--platform", choices=PLATFORMS)
+    validate_parser.add_argument("--verbose", action="store_true", help="Also list passing locators")
+    args = parser.parse_args()
+
+    if args.command == "capture":
+        from utilities.driver_factory import DriverFactory
+
+        driver = DriverFactory.create_driver()
+        try:
+            for path in capture(driver, args.screens):
+                print(f"captured {path}")
+        finally:
+            DriverFactory.quit_driver(driver)
+        return
+
+    start = time.perf_counter()
+    results = LocatorValidator().validate((args.platform,) if args.platform else PLATFORMS)
+    for line in LocatorValidator.report_lines(results, args.verbose):
+        print(line)
+    broken = [r for r in results if r.role == "primary" and r.status in ("miss", "ambiguous")]
+    screens = {(r.platform, r.screen) for r in results}
+    print(f"{len(results)} locators on {len(screens)} screens checked in "
+          f"{time.perf_counter() - start:.3f}s; {len(broken)} broken primaries")
+    if broken:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
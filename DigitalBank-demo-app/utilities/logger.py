@@ -6,13 +6,30 @@ from datetime import datetime
 from config.config import Config
 
 
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and file on the first record."""
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 class Logger:
     """
     Custom logger for test automation framework.
 
     Provides logging functionality with file and console handlers.
+    All loggers share one file and console handler per run, so a session
+    writes a single log file instead of one per module. The log directory
+    and file are only created when the first record is written.
     """
 
+    _file_handler = None
+    _console_handler = None
+
     @staticmethod
     def get_logger(name):
         """
@@ -28,17 +45,23 @@ class Logger:
 
         if not logger.handlers:
             logger.setLevel(logging.DEBUG)
+            file_handler, console_handler = Logger._shared_handlers()
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
 
-            # Create logs directory if it doesn't exist
-            os.makedirs(Config.LOGS_DIR, exist_ok=True)
+        return logger
 
-            # File handler
+    @staticmethod
+    def _shared_handlers():
+        """Create the run-wide file and console handlers on first use."""
+        if Logger._file_handler is None:
+            # File handler (directory and file created on first record)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file = os.path.join(
                 Config.LOGS_DIR,
                 f"test_execution_{timestamp}.log"
             )
-            file_handler = logging.FileHandler(log_file)
+            file_handler = _LazyFileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)
 
             # Console handler
@@ -53,7 +76,7 @@ class Logger:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            Logger._file_handler = file_handler
+            Logger._console_handler = console_handler
 
-        return logger
+        return Logger._file_handler, Logger._console_handler
@@ -1,34 +1,67 @@
 """Mobile actions utility for cross-platform element interactions."""
 
-import os
+import time
 from datetime import datetime
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 from config.config import Config
+from utilities.artifact_store import ArtifactStore
+from utilities.events import EventBus
 from utilities.logger import Logger
+from utilities.page_source import PageSource
+from utilities.text_entry import TextEntry, TextNotEntered
+from utilities.tracing import traced_class
 
 
+@traced_class()
 class MobileActions:
     """
     Cross-platform mobile actions utility class.
 
     Provides unified API for common element interactions like click,
     send keys, wait for element, etc., with proper error handling
-    and logging.
+    and logging. Every action also emits a structured event (see
+    ``utilities.events``); log messages use lazy %-formatting so filtered
+    levels cost nothing.
     """
 
     logger = Logger.get_logger(__name__)
 
-    def __init__(self, driver):
+    def __init__(self, driver, page=None):
         """
         Initialize MobileActions with driver instance.
 
         Args:
             driver (webdriver.Remote): Appium driver instance
+            page (str, optional): Owning page name recorded on events
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self.page = page or type(self).__name__
+        self.text_entry = TextEntry(driver, page=self.page)
+        self._wait = None
+
+    @property
+    def wait(self):
+        """Default explicit wait, created on first use."""
+        if self._wait is None:
+            self._wait = self._waiter(None)
+        return self._wait
+
+    def _waiter(self, timeout):
+        """Return a WebDriverWait; Selenium is imported on first use."""
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
+        return WebDriverWait(self.driver, wait_time)
+
+    def _emit(self, action, locator, start, outcome="ok", **fields):
+        """Emit an action event timed from ``start`` (a perf_counter value)."""
+        EventBus.emit(
+            action,
+            page=self.page,
+            locator=locator,
+            duration=time.perf_counter() - start,
+            outcome=outcome,
+            **fields,
+        )
 
     def click(self, locator, timeout=None):
         """
@@ -41,22 +74,29 @@ class MobileActions:
         Returns:
             bool: True if click succeeded, False otherwise
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
                 element.click()
-                self.logger.info(f"Clicked on element: {locator}")
+                self.logger.info("Clicked on element: %s", locator)
+                self._emit("click", locator, start)
                 return True
+            self._emit("click", locator, start, "not_found")
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to click element {locator}: {str(e)}")
+            self.logger.error("Failed to click element %s: %s", locator, e)
+            self._emit("click", locator, start, "error", error=str(e))
             return False
 
     def send_keys(self, locator, text, clear_first=True, timeout=None):
         """
         Send keys to element.
 
+        The value is set without the soft keyboard where the platform
+        allows and read back afterwards (see ``TextEntry``).
+
         Args:
             locator (tuple): Locator tuple (By.ID, 'element_id')
             text (str): Text to send
@@ -65,23 +105,29 @@ class MobileActions:
 
         Returns:
             bool: True if send keys succeeded, False otherwise
+
+        Raises:
+            TextNotEntered: If the field does not hold the text afterwards
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
-                if clear_first:
-                    element.clear()
-                element.send_keys(text)
-                self.logger.info(
-                    f"Sent keys '{text}' to element: {locator}"
-                )
+                method = self.text_entry.enter(element, text, clear=clear_first, locator=locator)
+                self.logger.info("Sent keys '%s' to element: %s", text, locator)
+                self._emit("send_keys", locator, start, method=method)
                 return True
+            self._emit("send_keys", locator, start, "not_found")
             return False
 
+        except TextNotEntered as e:
+            # A wrong value is a test failure, not a missing element
+            self._emit("send_keys", locator, start, "mismatch", error=str(e))
+            raise
+
         except Exception as e:
-            self.logger.error(
-                f"Failed to send keys to {locator}: {str(e)}"
-            )
+            self.logger.error("Failed to send keys to %s: %s", locator, e)
+            self._emit("send_keys", locator, start, "error", error=str(e))
             return False
 
     def get_text(self, locator, timeout=None):
@@ -95,20 +141,20 @@ class MobileActions:
         Returns:
             str: Element text or empty string if failed
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
                 text = element.text
-                self.logger.info(
-                    f"Retrieved text '{text}' from element: {locator}"
-                )
+                self.logger.info("Retrieved text '%s' from element: %s", text, locator)
+                self._emit("get_text", locator, start)
                 return text
+            self._emit("get_text", locator, start, "not_found")
             return ""
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to get text from {locator}: {str(e)}"
-            )
+            self.logger.error("Failed to get text from %s: %s", locator, e)
+            self._emit("get_text", locator, start, "error", error=str(e))
             return ""
 
     def get_attribute(self, locator, attribute, timeout=None):
@@ -123,21 +169,23 @@ class MobileActions:
         Returns:
             str: Attribute value or empty string if failed
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
                 value = element.get_attribute(attribute)
                 self.logger.info(
-                    f"Retrieved attribute '{attribute}' = '{value}' "
-                    f"from element: {locator}"
+                    "Retrieved attribute '%s' = '%s' from element: %s",
+                    attribute, value, locator
                 )
+                self._emit("get_attribute", locator, start, attribute=attribute)
                 return value
+            self._emit("get_attribute", locator, start, "not_found")
             return ""
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to get attribute from {locator}: {str(e)}"
-            )
+            self.logger.error("Failed to get attribute from %s: %s", locator, e)
+            self._emit("get_attribute", locator, start, "error", error=str(e))
             return ""
 
     def is_displayed(self, locator, timeout=None):
@@ -151,20 +199,20 @@ class MobileActions:
         Returns:
             bool: True if element is displayed, False otherwise
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
                 displayed = element.is_displayed()
-                self.logger.info(
-                    f"Element {locator} displayed: {displayed}"
-                )
+                self.logger.info("Element %s displayed: %s", locator, displayed)
+                self._emit("is_displayed", locator, start, result=displayed)
                 return displayed
+            self._emit("is_displayed", locator, start, "not_found")
             return False
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to check if element displayed {locator}: {str(e)}"
-            )
+            self.logger.error("Failed to check if element displayed %s: %s", locator, e)
+            self._emit("is_displayed", locator, start, "error", error=str(e))
             return False
 
     def is_enabled(self, locator, timeout=None):
@@ -178,20 +226,20 @@ class MobileActions:
         Returns:
             bool: True if element is enabled, False otherwise
         """
+        start = time.perf_counter()
         try:
             element = self.wait_for_element(locator, timeout)
             if element:
                 enabled = element.is_enabled()
-                self.logger.info(
-                    f"Element {locator} enabled: {enabled}"
-                )
+                self.logger.info("Element %s enabled: %s", locator, enabled)
+                self._emit("is_enabled", locator, start, result=enabled)
                 return enabled
+            self._emit("is_enabled", locator, start, "not_found")
             return False
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to check if element enabled {locator}: {str(e)}"
-            )
+            self.logger.error("Failed to check if element enabled %s: %s", locator, e)
+            self._emit("is_enabled", locator, start, "error", error=str(e))
             return False
 
     def wait_for_element(self, locator, timeout=None):
@@ -205,19 +253,22 @@ class MobileActions:
         Returns:
             WebElement: Element if found, None otherwise
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+
+        start = time.perf_counter()
         try:
-            wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self._waiter(timeout)
             element = wait.until(
                 EC.visibility_of_element_located(locator)
             )
-            self.logger.info(f"Element found: {locator}")
+            self.logger.info("Element found: %s", locator)
+            self._emit("wait_for_element", locator, start)
             return element
 
         except TimeoutException:
-            self.logger.error(
-                f"Timeout waiting for element: {locator}"
-            )
+            self.logger.error("Timeout waiting for element: %s", locator)
+            self._emit("wait_for_element", locator, start, "timeout")
             return None
 
     def wait_for_element_clickable(self, locator, timeout=None):
@@ -231,19 +282,22 @@ class MobileActions:
         Returns:
             WebElement: Element if found and clickable, None otherwise
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+
+        start = time.perf_counter()
         try:
-            wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self._waiter(timeout)
             element = wait.until(
                 EC.element_to_be_clickable(locator)
             )
-            self.logger.info(f"Element clickable: {locator}")
+            self.logger.info("Element clickable: %s", locator)
+            self._emit("wait_for_element_clickable", locator, start)
             return element
 
         except TimeoutException:
-            self.logger.error(
-                f"Timeout waiting for clickable element: {locator}"
-            )
+            self.logger.error("Timeout waiting for clickable element: %s", locator)
+            self._emit("wait_for_element_clickable", locator, start, "timeout")
             return None
 
     def wait_for_elements(self, locator, timeout=None):
@@ -257,23 +311,89 @@ class MobileActions:
         Returns:
             list: List of WebElements or empty list if not found
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+
+        start = time.perf_counter()
         try:
-            wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self._waiter(timeout)
             elements = wait.until(
                 EC.visibility_of_all_elements_located(locator)
             )
-            self.logger.info(
-                f"Found {len(elements)} elements: {locator}"
-            )
+            self.logger.info("Found %d elements: %s", len(elements), locator)
+            self._emit("wait_for_elements", locator, start, count=len(elements))
             return elements
 
         except TimeoutException:
-            self.logger.error(
-                f"Timeout waiting for elements: {locator}"
-            )
+            self.logger.error("Timeout waiting for elements: %s", locator)
+            self._emit("wait_for_elements", locator, start, "timeout")
             return []
 
+    def wait_for_any_element(self, outcomes, timeout=None, poll_interval=0.5):
+        """
+        Wait until the first of several candidate elements becomes visible.
+
+        All candidates are checked in the same polling loop against one
+        page-source snapshot per poll, so a test waiting for "success or
+        error" returns as soon as either one shows up instead of burning a
+        full timeout on the one that never appears. Locators that cannot be
+        evaluated against the snapshot fall back to a live lookup with the
+        implicit wait disabled.
+
+        Args:
+            outcomes (dict): Mapping of outcome name to locator tuple,
+                checked in insertion order
+            timeout (int, optional): Custom timeout in seconds
+            poll_interval (float): Delay between polls in seconds
+
+        Returns:
+            tuple: (outcome name, WebElement) for the first visible outcome,
+            or (None, None) on timeout
+        """
+        start = time.perf_counter()
+        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
+        deadline = time.monotonic() + wait_time
+
+        self.driver.implicitly_wait(0)
+        try:
+            while True:
+                name, element = self._poll_outcomes(outcomes)
+                if name is not None:
+                    self.logger.info("Outcome '%s' appeared: %s", name, outcomes[name])
+                    self._emit("wait_for_any_element", outcomes[name], start, matched=name)
+                    return name, element
+                if time.monotonic() + poll_interval > deadline:
+                    break
+                time.sleep(poll_interval)
+
+            self.logger.error("Timeout waiting for any of: %s", list(outcomes))
+            self._emit("wait_for_any_element", None, start, "timeout")
+            return None, None
+
+        finally:
+            self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+    def _poll_outcomes(self, outcomes):
+        """Run one poll over all outcomes; see ``wait_for_any_element``."""
+        try:
+            snapshot = PageSource.from_driver(self.driver)
+        except Exception as e:
+            self.logger.debug("Page source unavailable, polling live: %s", e)
+            snapshot = None
+
+        for name, locator in outcomes.items():
+            present = snapshot.is_present(locator) if snapshot else None
+            if present is False:
+                continue
+            try:
+                for element in self.driver.find_elements(*locator):
+                    if element.is_displayed():
+                        return name, element
+            except Exception as e:
+                self.logger.debug("Lookup failed for %s: %s", locator, e)
+
+        return None, None
+
     def hide_keyboard(self):
         """
         Hide mobile keyboard if visible.
@@ -281,24 +401,29 @@ class MobileActions:
         Returns:
             bool: True if successful, False otherwise
         """
+        start = time.perf_counter()
         try:
             if Config.is_android():
                 self.driver.hide_keyboard()
             else:
-                # For iOS, tap on a coordinate outside keyboard
-                size = self.driver.get_window_size()
-                self.driver.tap([(size['width'] / 2, 50)])
+                # Press the keyboard's own dismiss keys; a coordinate tap can hit the app
+                self.driver.execute_script("mobile: hideKeyboard", {"keys": ["done", "return"]})
 
             self.logger.info("Keyboard hidden")
+            self._emit("hide_keyboard", None, start)
             return True
 
         except Exception as e:
-            self.logger.warning(f"Failed to hide keyboard: {str(e)}")
+            self.logger.warning("Failed to hide keyboard: %s", e)
+            self._emit("hide_keyboard", None, start, "error", error=str(e))
             return False
 
     def take_screenshot(self, name="screenshot"):
         """
-        Take screenshot and save to reports directory.
+        Take screenshot and save it to the artifact store.
+
+        Identical screenshots are stored once; every capture is still
+        recorded under its own name in the store index.
 
         Args:
             name (str): Screenshot name prefix
@@ -306,20 +431,42 @@ class MobileActions:
         Returns:
             str: Screenshot file path or empty string if failed
         """
+        start = time.perf_counter()
         try:
-            os.makedirs(Config.SCREENSHOTS_DIR, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(Config.SCREENSHOTS_DIR, filename)
-
-            self.driver.save_screenshot(filepath)
-            self.logger.info(f"Screenshot saved: {filepath}")
+            png = self.driver.get_screenshot_as_png()
+            filepath = ArtifactStore.shared().put_bytes(
+                png, f"{name}_{timestamp}", kind="screenshot", extension=".png",
+                test_id=EventBus.test_id,
+            )
+            self.logger.info("Screenshot saved: %s", filepath)
+            self._emit("take_screenshot", None, start, path=filepath)
             return filepath
 
         except Exception as e:
-            self.logger.error(f"Failed to take screenshot: {str(e)}")
+            self.logger.error("Failed to take screenshot: %s", e)
+            self._emit("take_screenshot", None, start, "error", error=str(e))
             return ""
 
+    def matches_golden(self, golden_name, masks=None):
+        """
+        Take a screenshot and compare it with its golden image.
+
+        Args:
+            golden_name (str): Golden image name without extension
+            masks (list, optional): Extra (left, top, right, bottom)
+                fractions to ignore, e.g. a timestamp label
+
+        Returns:
+            bool: True if the screen matches the golden, False otherwise
+        """
+        from utilities.visual_compare import VisualComparator
+
+        filepath = self.take_screenshot(golden_name)
+        if not filepath:
+            return False
+        return VisualComparator().compare(filepath, golden_name, masks).matched
+
     def switch_to_context(self, context_name):
         """
         Switch to specific context (NATIVE_APP or WEBVIEW).
@@ -334,14 +481,12 @@ class MobileActions:
             contexts = self.driver.contexts
             if context_name in contexts:
                 self.driver.switch_to.context(context_name)
-                self.logger.info(f"Switched to context: {context_name}")
+                self.logger.info("Switched to context: %s", context_name)
                 return True
             else:
-                self.logger.error(
-                    f"Context {context_name} not found in {contexts}"
-                )
+                self.logger.error("Context %s not found in %s", context_name, contexts)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to switch context: {str(e)}")
+            self.logger.error("Failed to switch context: %s", e)
             return False
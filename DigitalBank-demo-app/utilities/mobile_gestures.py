@@ -1,13 +1,11 @@
 """Mobile gesture utilities for cross-platform automation."""
 
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.actions.action_builder import ActionBuilder
-from selenium.webdriver.common.actions.pointer_input import PointerInput
-from selenium.webdriver.common.actions import interaction
 from config.config import Config
 from utilities.logger import Logger
+from utilities.tracing import traced_class
 
 
+@traced_class()
 class MobileGestures:
     """
     Cross-platform mobile gesture utility class.
@@ -27,7 +25,26 @@ class MobileGestures:
             driver (webdriver.Remote): Appium driver instance
         """
         self.driver = driver
-        self.actions = ActionChains(driver)
+        self._actions = None
+
+    @property
+    def actions(self):
+        """ActionChains for the driver, created on first use."""
+        if self._actions is None:
+            from selenium.webdriver.common.action_chains import ActionChains
+            self._actions = ActionChains(self.driver)
+        return self._actions
+
+    def _touch_actions(self):
+        """Return an ActionBuilder with a touch pointer; Selenium is imported on first use."""
+        from selenium.webdriver.common.actions import interaction
+        from selenium.webdriver.common.actions.action_builder import ActionBuilder
+        from selenium.webdriver.common.actions.pointer_input import PointerInput
+
+        return ActionBuilder(
+            self.driver,
+            mouse=PointerInput(interaction.POINTER_TOUCH, "touch")
+        )
 
     def swipe(self, start_x, start_y, end_x, end_y, duration=800):
         """
@@ -49,10 +66,7 @@ class MobileGestures:
                 f"({end_x}, {end_y})"
             )
 
-            actions = ActionBuilder(
-                self.driver,
-                mouse=PointerInput(interaction.POINTER_TOUCH, "touch")
-            )
+            actions = self._touch_actions()
             actions.pointer_action.move_to_location(start_x, start_y)
             actions.pointer_action.pointer_down()
             actions.pointer_action.pause(duration / 1000)
@@ -185,10 +199,7 @@ class MobileGestures:
             x = location['x'] + size['width'] / 2
             y = location['y'] + size['height'] / 2
 
-            actions = ActionBuilder(
-                self.driver,
-                mouse=PointerInput(interaction.POINTER_TOUCH, "touch")
-            )
+            actions = self._touch_actions()
             actions.pointer_action.move_to_location(int(x), int(y))
             actions.pointer_action.pointer_down()
             actions.pointer_action.pause(duration / 1000)
@@ -216,10 +227,7 @@ class MobileGestures:
         try:
             self.logger.info(f"Tapping at coordinates ({x}, {y})")
 
-            actions = ActionBuilder(
-                self.driver,
-                mouse=PointerInput(interaction.POINTER_TOUCH, "touch")
-            )
+            actions = self._touch_actions()
             actions.pointer_action.move_to_location(x, y)
             actions.pointer_action.pointer_down()
             actions.pointer_action.pointer_up()
@@ -0,0 +1,223 @@
+"""Offline evaluation of Appium locators against a page-source snapshot."""
+
+import re
+import xml.etree.ElementTree as ET
+
+
+class PageSource:
+    """
+    Parsed page-source snapshot that can evaluate locators without the driver.
+
+    One ``driver.page_source`` round-trip can answer "is it there?" for any
+    number of locators. Only the common, statically decidable forms of each
+    strategy are supported; ``find_all`` returns None for anything else so
+    callers can fall back to a live ``find_elements`` lookup.
+    """
+
+    ACCESSIBILITY_ID = "accessibility id"
+    ID = "id"
+    NAME = "name"
+    XPATH = "xpath"
+    CLASS_NAME = "class name"
+    ANDROID_UIAUTOMATOR = "-android uiautomator"
+    IOS_PREDICATE = "-ios predicate string"
+    IOS_CLASS_CHAIN = "-ios class chain"
+
+    _UISELECTOR_ATTRS = {
+        "text": "text",
+        "description": "content-desc",
+        "resourceId": "resource-id",
+        "className": "class",
+    }
+    _UISELECTOR_CALL = re.compile(r'\.(\w+)\("((?:[^"\\]|\\.)*)"\)')
+    _PREDICATE_CLAUSE = re.compile(
+        r"""^\s*(\w+)\s*==\s*(?:"([^"]*)"|'([^']*)')\s*$"""
+    )
+    _CLASS_CHAIN_STEP = re.compile(r"^(\*\*/)?(\w+|\*)((?:\[`[^`]*`\])*)$")
+
+    def __init__(self, xml):
+        """
+        Parse page-source XML.
+
+        Args:
+            xml (str): Raw page source as returned by ``driver.page_source``
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the source is not valid XML
+        """
+        self.xml = xml
+        self.root = ET.fromstring(xml.encode("utf-8") if isinstance(xml, str) else xml)
+        self.is_android = (
+            self.root.tag == "hierarchy"
+            or self.root.find(".//*[@resource-id]") is not None
+        )
+
+    @classmethod
+    def from_driver(cls, driver):
+        """
+        Fetch and parse the current page source from the driver.
+
+        Args:
+            driver (webdriver.Remote): Appium driver instance
+
+        Returns:
+            PageSource: Parsed snapshot
+        """
+        return cls(driver.page_source)
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def find_all(self, locator, visible_only=True):
+        """
+        Return all nodes matching the locator.
+
+        Args:
+            locator (tuple): Locator tuple (AppiumBy.ID, 'element_id')
+            visible_only (bool): Skip nodes flagged as not displayed/visible
+
+        Returns:
+            list: Matching XML nodes, or None if the locator cannot be
+            evaluated offline
+        """
+        strategy, value = locator
+        nodes = self._evaluate(strategy, value)
+        if nodes is None:
+            return None
+        if visible_only:
+            nodes = [node for node in nodes if self.is_visible(node)]
+        return nodes
+
+    def is_present(self, locator, visible_only=True):
+        """
+        Check whether the locator matches at least one node.
+
+        Args:
+            locator (tuple): Locator tuple (AppiumBy.ID, 'element_id')
+            visible_only (bool): Skip nodes flagged as not displayed/visible
+
+        Returns:
+            bool: Match result, or None if the locator cannot be evaluated
+            offline
+        """
+        nodes = self.find_all(locator, visible_only)
+        if nodes is None:
+            return None
+        return len(nodes) > 0
+
+    def is_supported(self, locator):
+        """Check whether the locator can be evaluated against a snapshot."""
+        return self._evaluate(*locator) is not None
+
+    @staticmethod
+    def is_visible(node):
+        """Check the displayed (Android) or visible (iOS) flag of a node."""
+        flag = node.get("displayed", node.get("visible"))
+        return flag is None or flag == "true"
+
+    # ---------------- STRATEGIES ---------------- #
+
+    def _evaluate(self, strategy, value):
+        if strategy == self.ACCESSIBILITY_ID:
+            attr = "content-desc" if self.is_android else "name"
+            return self._match_attrs({attr: value})
+        if strategy == self.ID:
+            if self.is_android:
+                return [
+                    node for node in self.root.iter()
+                    if self._resource_id_matches(node.get("resource-id"), value)
+                ]
+            return self._match_attrs({"name": value})
+        if strategy == self.NAME:
+            attr = "text" if self.is_android else "name"
+            return self._match_attrs({attr: value})
+        if strategy == self.CLASS_NAME:
+            return [node for node in self.root.iter() if self._node_class(node) == value]
+        if strategy == self.XPATH:
+            return self._xpath(value)
+        if strategy == self.ANDROID_UIAUTOMATOR:
+            return self._uiautomator(value)
+        if strategy == self.IOS_PREDICATE:
+            return self._predicate(value)
+        if strategy == self.IOS_CLASS_CHAIN:
+            return self._class_chain(value)
+        return None
+
+    def _match_attrs(self, attrs):
+        return [
+            node for node in self.root.iter()
+            if all(self._attr(node, key) == expected for key, expected in attrs.items())
+        ]
+
+    def _attr(self, node, key):
+        if key in ("class", "type"):
+            return self._node_class(node)
+        return node.get(key)
+
+    @staticmethod
+    def _node_class(node):
+        return node.get("class") or node.get("type") or node.tag
+
+    @staticmethod
+    def _resource_id_matches(resource_id, value):
+        if not resource_id:
+            return False
+        if resource_id == value:
+            return True
+        # Appium accepts bare ids and prefixes them with "<package>:id/"
+        return ":id/" not in value and resource_id.endswith(f":id/{value}")
+
+    def _xpath(self, expression):
+        expression = expression.strip()
+        if expression.startswith("//"):
+            expression = "." + expression
+        elif expression.startswith("/"):
+            return None
+        try:
+            return self.root.findall(expression)
+        except (SyntaxError, KeyError):
+            return None
+
+    def _uiautomator(self, expression):
+        expression = expression.strip()
+        if not expression.startswith("new UiSelector()"):
+            return None
+        chain = expression[len("new UiSelector()"):].rstrip(";")
+        attrs = {}
+        consumed = 0
+        for match in self._UISELECTOR_CALL.finditer(chain):
+            if match.start() != consumed or match.group(1) not in self._UISELECTOR_ATTRS:
+                return None
+            attrs[self._UISELECTOR_ATTRS[match.group(1)]] = match.group(2)
+            consumed = match.end()
+        if consumed != len(chain) or not attrs:
+            return None
+        return self._match_attrs(attrs)
+
+    def _predicate_attrs(self, expression):
+        attrs = {}
+        for clause in re.split(r"\s+AND\s+", expression.strip()):
+            match = self._PREDICATE_CLAUSE.match(clause)
+            if not match:
+                return None
+            value = match.group(2) if match.group(2) is not None else match.group(3)
+            attrs[match.group(1)] = value
+        return attrs
+
+    def _predicate(self, expression):
+        attrs = self._predicate_attrs(expression)
+        if attrs is None:
+            return None
+        return self._match_attrs(attrs)
+
+    def _class_chain(self, expression):
+        match = self._CLASS_CHAIN_STEP.match(expression.strip())
+        if not match or not match.group(1):
+            return None
+        element_type, filters = match.group(2), match.group(3)
+        attrs = {} if element_type == "*" else {"type": element_type}
+        for predicate in re.findall(r"\[`([^`]*)`\]", filters):
+            clause_attrs = self._predicate_attrs(predicate)
+            if clause_attrs is None:
+                return None
+            attrs.update(clause_attrs)
+        return self._match_attrs(attrs)
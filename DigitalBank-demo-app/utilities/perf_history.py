@@ -0,0 +1,361 @@
+"""SQLite history of run, test, command, session and artifact timings.
+
+Runs are ingested from their event files at the end of every pytest run.
+Files can also be ingested by hand; files already ingested are skipped:
+    python -m utilities.perf_history ingest reports/events/*.jsonl
+
+Show trends and flag significant slowdowns of the latest runs against a
+rolling baseline:
+    python -m utilities.perf_history report [--kind command] [--recent 3]
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict, namedtuple
+from statistics import median
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.logger import Logger
+
+Slowdown = namedtuple(
+    "Slowdown", "kind name baseline_median current_median change p_value baseline_n current_n"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL,
+    finished REAL,
+    platform TEXT,
+    provider TEXT,
+    build TEXT,
+    exit_status INTEGER,
+    source TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS timings_by_name ON timings (kind, name, run_id);
+"""
+
+# Event actions stored under their own kind instead of "command"
+EVENT_KINDS = {
+    "create_session": "session",
+    "session_queue": "session",
+    "capture_evidence": "artifact",
+}
+
+SPARKS = "▁▂▃▄▅▆▇█"
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided Mann-Whitney U test that ``current`` tends to be larger.
+
+    Uses the normal approximation with tie and continuity corrections,
+    which is adequate from about five values per side.
+
+    Args:
+        current (list): Recent durations
+        baseline (list): Baseline durations
+
+    Returns:
+        float: p-value (1.0 if either side is empty or all values tie)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    values = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    rank_sum, ties, index = 0.0, 0.0, 0
+    while index < len(values):
+        end = index
+        while end + 1 < len(values) and values[end + 1][0] == values[index][0]:
+            end += 1
+        rank = (index + end) / 2 + 1
+        rank_sum += rank * sum(1 for _, side in values[index:end + 1] if side == 0)
+        count = end - index + 1
+        ties += count ** 3 - count
+        index = end + 1
+    n = n1 + n2
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class PerfHistory:
+    """
+    Local SQLite store of timings from every run.
+
+    Each ingested event file becomes one run. Its events are stored as
+    ``timings`` rows of a ``kind``:
+
+    - ``test_setup``/``test_call``/``test_teardown``: pytest phases, named
+      by test id
+    - ``session``: session creation and cloud queue waits
+    - ``artifact``: failure-evidence capture
+    - ``command``: page actions and driver commands, named "Page.action"
+
+    Rows are written with ``executemany`` in batches of ``batch_size``
+    inside one transaction per run, so ingesting a large suite costs a
+    few statements. Runs beyond ``max_runs`` are pruned oldest first.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, path=None, batch_size=None, max_runs=None):
+        """
+        Initialize the store.
+
+        Args:
+            path (str, optional): Database file
+            batch_size (int, optional): Rows per ``executemany`` batch
+            max_runs (int, optional): Runs kept
+        """
+        self.path = path or Config.PERF_HISTORY_PATH
+        self.batch_size = batch_size or Config.PERF_HISTORY_BATCH
+        self.max_runs = max_runs or Config.PERF_HISTORY_MAX_RUNS
+        self._db = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("PRAGMA foreign_keys=ON")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ---------------- INGESTION ---------------- #
+
+    def ingest(self, path, exit_status=None):
+        """
+        Store one event file as a run, unless it was ingested before.
+
+        Args:
+            path (str): Event file written by ``JsonlSink``
+            exit_status (int, optional): Pytest exit status of the run
+
+        Returns:
+            int: New run id, or None if the file was already ingested
+        """
+        source = os.path.abspath(path)
+        if self.db.execute("SELECT 1 FROM runs WHERE source = ?", (source,)).fetchone():
+            return None
+        started = None
+        finished = None
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (platform, provider, build, exit_status, source) VALUES (?, ?, ?, ?, ?)",
+                (Config.PLATFORM, Config.CLOUD_PROVIDER, Config.APP_BUILD, exit_status, source),
+            ).lastrowid
+            batch = []
+            count = 0
+            for event in EventBus.read(path):
+                started = event["ts"] if started is None else min(started, event["ts"])
+                finished = event["ts"] if finished is None else max(finished, event["ts"])
+                row = self._row(run_id, event)
+                if row is None:
+                    continue
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    count += self._write(batch)
+                    batch = []
+            count += self._write(batch)
+            self.db.execute("UPDATE runs SET started = ?, finished = ? WHERE id = ?",
+                            (started, finished, run_id))
+            self._prune()
+        self.logger.info("Performance history: run %d with %d timings from %s", run_id, count, path)
+        return run_id
+
+    @staticmethod
+    def _row(run_id, event):
+        duration = event.get("duration")
+        if duration is None:
+            return None
+        page, action = event.get("page"), event.get("action")
+        if page == "pytest":
+            test_id = event.get("test_id")
+            return (run_id, action, test_id, duration, event.get("outcome")) if test_id else None
+        kind = EVENT_KINDS.get(action, "command")
+        name = f"{page}.{action}" if kind == "command" and page else action
+        return (run_id, kind, name, duration, event.get("outcome"))
+
+    def _write(self, batch):
+        if batch:
+            self.db.executemany(
+                "INSERT INTO timings (run_id, kind, name, duration, outcome) VALUES (?, ?, ?, ?, ?)", batch
+            )
+        return len(batch)
+
+    def _prune(self):
+        self.db.execute(
+            "DELETE FROM runs WHERE id NOT IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+            (self.max_runs,),
+        )
+
+    # ---------------- ANALYSIS ---------------- #
+
+    def run_ids(self, platform=None, provider=None):
+        """Run ids, oldest first, optionally for one platform and provider."""
+        query, args = "SELECT id FROM runs WHERE 1=1", []
+        if platform:
+            query, args = query + " AND platform = ?", args + [platform]
+        if provider:
+            query, args = query + " AND provider = ?", args + [provider]
+        return [row[0] for row in self.db.execute(query + " ORDER BY id", args)]
+
+    def samples(self, run_ids, kind=None):
+        """
+        Durations per (kind, name) and run.
+
+        Returns:
+            dict: (kind, name) -> run id -> list of durations
+        """
+        if not run_ids:
+            return {}
+        query = (f"SELECT kind, name, run_id, duration FROM timings "
+                 f"WHERE outcome = 'ok' AND run_id IN ({','.join('?' * len(run_ids))})")
+        args = list(run_ids)
+        if kind:
+            query, args = query + " AND kind = ?", args + [kind]
+        result = defaultdict(lambda: defaultdict(list))
+        for row_kind, name, run_id, duration in self.db.execute(query, args):
+            result[(row_kind, name)][run_id].append(duration)
+        return result
+
+    def compare(self, recent=None, baseline=None, alpha=None, min_change=None, kind=None,
+                platform=None, provider=None):
+        """
+        Compare the latest runs with the runs before them, per timing.
+
+        Args:
+            recent (int, optional): Latest runs forming the current sample
+            baseline (int, optional): Runs before those forming the baseline
+            alpha (float, optional): Significance level
+            min_change (float, optional): Smallest median increase flagged
+            kind (str, optional): Only this kind
+            platform (str, optional): Only runs on this platform
+            provider (str, optional): Only runs on this provider
+
+        Returns:
+            tuple: (slowdowns, all comparisons), both lists of ``Slowdown``
+            sorted by p-value
+        """
+        recent = recent or Config.PERF_HISTORY_RECENT_RUNS
+        baseline = baseline or Config.PERF_HISTORY_BASELINE_RUNS
+        alpha = alpha if alpha is not None else Config.PERF_HISTORY_ALPHA
+        min_change = min_change if min_change is not None else Config.PERF_HISTORY_MIN_CHANGE
+        runs = self.run_ids(platform, provider)
+        current_runs, baseline_runs = runs[-recent:], runs[-recent - baseline:-recent]
+        comparisons = []
+        for (row_kind, name), by_run in self.samples(current_runs + baseline_runs, kind).items():
+            current = [d for run in current_runs for d in by_run.get(run, ())]
+            before = [d for run in baseline_runs for d in by_run.get(run, ())]
+            if not current or not before:
+                continue
+            base_median, current_median = median(before), median(current)
+            change = (current_median - base_median) / base_median if base_median else 0.0
+            comparisons.append(Slowdown(row_kind, name, base_median, current_median, change,
+                                        mann_whitney_greater(current, before), len(before), len(current)))
+        comparisons.sort(key=lambda c: (c.p_value, -c.change))
+        flagged = [c for c in comparisons if c.p_value < alpha and c.change >= min_change]
+        return flagged, comparisons
+
+    def trend(self, kind, name, runs=20):
+        """
+        Median duration per run over the last ``runs`` runs.
+
+        Returns:
+            list: (run id, median) pairs, oldest first
+        """
+        ids = self.run_ids()[-runs:]
+        by_run = self.samples(ids, kind).get((kind, name), {})
+        return [(run, median(by_run[run])) for run in ids if by_run.get(run)]
+
+    @staticmethod
+    def sparkline(values):
+        """Unicode sparkline of a series."""
+        if not values:
+            return ""
+        low, high = min(values), max(values)
+        span = (high - low) or 1.0
+        return "".join(SPARKS[min(len(SPARKS) - 1, int((v - low) / span * len(SPARKS)))] for v in values)
+
+    def report_lines(self, flagged, comparisons, limit=20):
+        """
+        Slowdowns first, then the largest median changes, each with a trend.
+
+        Args:
+            flagged (list): Slowdowns from ``compare``
+            comparisons (list): All comparisons from ``compare``
+            limit (int): Lines shown besides the slowdowns
+
+        Returns:
+            list: Lines
+        """
+        shown = flagged + sorted((c for c in comparisons if c not in flagged),
+                                 key=lambda c: -abs(c.change))[:limit]
+        lines = [f"{len(flagged)} significant slowdowns in {len(comparisons)} timings compared"]
+        for comparison in shown:
+            series = [value for _, value in self.trend(comparison.kind, comparison.name)]
+            lines.append(
+                f"{'SLOWER' if comparison in flagged else '':<6} {comparison.change:+7.1%} "
+                f"{comparison.baseline_median:8.3f}s -> {comparison.current_median:8.3f}s "
+                f"p={comparison.p_value:.4f} n={comparison.baseline_n}/{comparison.current_n} "
+                f"{self.sparkline(series):<20} {comparison.kind} {comparison.name}"
+            )
+        return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = commands.add_parser("ingest", help="Store event files as runs")
+    ingest_parser.add_argument("events", nargs="+")
+    report_parser = commands.add_parser("report", help="Show trends and significant slowdowns")
+    report_parser.add_argument("--kind", help="e.g. command, test_call, session, artifact")
+    report_parser.add_argument("--recent", type=int, help="Latest runs compared")
+    report_parser.add_argument("--baseline", type=int, help="Runs before them used as baseline")
+    report_parser.add_argument("--alpha", type=float)
+    report_parser.add_argument("--min-change", type=float)
+    report_parser.add_argument("--platform")
+    report_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    history = PerfHistory()
+    if args.command == "ingest":
+        start = time.perf_counter()
+        runs = [run for run in (history.ingest(path) for path in sorted(args.events)) if run]
+        print(f"ingested {len(runs)} new runs in {time.perf_counter() - start:.2f}s")
+        return
+    flagged, comparisons = history.compare(
+        recent=args.recent, baseline=args.baseline, alpha=args.alpha,
+        min_change=args.min_change, kind=args.kind, platform=args.platform,
+    )
+    for line in history.report_lines(flagged, comparisons, args.limit):
+        print(line)
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
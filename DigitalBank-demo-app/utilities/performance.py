@@ -0,0 +1,376 @@
+"""App performance telemetry sampled in the background while a flow runs."""
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from array import array
+
+from config.config import Config
+from utilities.logger import Logger
+
+
+class TimeSeries:
+    """
+    Compact time series backed by two ``array('d')`` buffers.
+
+    Eight bytes per timestamp and per value, instead of a Python float
+    object and list slot for each.
+    """
+
+    __slots__ = ("name", "times", "values")
+
+    def __init__(self, name):
+        self.name = name
+        self.times = array("d")
+        self.values = array("d")
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, timestamp, value):
+        """
+        Add one sample.
+
+        Args:
+            timestamp (float): Seconds since the sampler started
+            value (float): Sampled value
+        """
+        self.times.append(timestamp)
+        self.values.append(value)
+
+    def summary(self):
+        """
+        Summary statistics of the series.
+
+        Returns:
+            dict: samples, min, max, mean, p95, first and last values
+            (empty if there are no samples)
+        """
+        if not self.values:
+            return {}
+        ordered = sorted(self.values)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return {
+            "samples": len(self.values),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "mean": sum(self.values) / len(self.values),
+            "p95": p95,
+            "first": self.values[0],
+            "last": self.values[-1],
+        }
+
+
+class AppiumPerformanceSource:
+    """
+    Read CPU, memory and frame statistics of the app under test (Android).
+
+    CPU and memory come from Appium's ``get_performance_data``. Janky
+    frames come from ``dumpsys gfxinfo`` through ``mobile: shell``, which
+    needs the Appium server's relaxed security. If that call is refused once,
+    frames are left out for the rest of the session.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    _JANKY_FRAMES = re.compile(r"Janky frames:\s*(\d+)")
+
+    def __init__(self, driver, package=None, frames=True):
+        """
+        Initialize the source.
+
+        Args:
+            driver (webdriver.Remote): Android session
+            package (str, optional): App package; defaults to ``Config.ANDROID_APP_PACKAGE``
+            frames (bool): Also sample janky frames
+        """
+        self.driver = driver
+        self.package = package or Config.ANDROID_APP_PACKAGE
+        self.frames = frames
+
+    def sample(self):
+        """
+        Take one sample.
+
+        Returns:
+            dict: ``cpu_percent``, ``memory_kb`` and, when available,
+            ``janky_frames`` (cumulative since app start)
+        """
+        metrics = {}
+        cpu = self._read("cpuinfo")
+        if cpu:
+            metrics["cpu_percent"] = sum(self._number(cpu.get(key)) for key in ("user", "kernel"))
+        memory = self._read("memoryinfo")
+        if memory and memory.get("totalPss") is not None:
+            metrics["memory_kb"] = self._number(memory["totalPss"])
+        if self.frames:
+            try:
+                output = self.driver.execute_script(
+                    "mobile: shell", {"command": "dumpsys", "args": ["gfxinfo", self.package]}
+                )
+                match = self._JANKY_FRAMES.search(output or "")
+                if match:
+                    metrics["janky_frames"] = float(match.group(1))
+            except Exception as e:
+                self.logger.info("Frame statistics unavailable, sampling CPU/memory only: %s", e)
+                self.frames = False
+        return metrics
+
+    def _read(self, data_type):
+        """Return the first data row of a performance data type keyed by its header."""
+        rows = self.driver.get_performance_data(self.package, data_type, 5)
+        if not rows or len(rows) < 2:
+            return {}
+        return dict(zip(rows[0], rows[1]))
+
+    @staticmethod
+    def _number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+
+class FakePerformanceSource:
+    """
+    Replay scripted or recorded samples, for unit tests and offline replay.
+
+    After the last sample the source keeps returning it.
+    """
+
+    def __init__(self, samples):
+        """
+        Initialize the source.
+
+        Args:
+            samples (list): Metric dicts, one per sample
+        """
+        self.samples = list(samples)
+        self.index = 0
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load samples recorded as JSON Lines (one metric dict per line).
+
+        Args:
+            path (str): Recording path
+
+        Returns:
+            FakePerformanceSource: Replaying source
+        """
+        with open(path, encoding="utf-8") as handle:
+            return cls(json.loads(line) for line in handle if line.strip())
+
+    def sample(self):
+        """Return the next recorded sample."""
+        if not self.samples:
+            return {}
+        sample = self.samples[min(self.index, len(self.samples) - 1)]
+        self.index += 1
+        return dict(sample)
+
+
+class PerformanceSampler:
+    """
+    Sample a performance source on a background thread at a fixed interval.
+
+    Each metric goes into its own ``TimeSeries``. Sampling errors are
+    counted rather than raised; after ``max_errors`` consecutive failures
+    the sampler stops on its own.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, source, interval=None, max_errors=3):
+        """
+        Initialize the sampler.
+
+        Args:
+            source: Object with a ``sample()`` method returning metric dicts
+            interval (float, optional): Seconds between samples
+            max_errors (int): Consecutive failures before giving up
+        """
+        self.source = source
+        self.interval = interval if interval is not None else Config.PERF_SAMPLE_INTERVAL
+        self.max_errors = max_errors
+        self.series = {}
+        self.errors = 0
+        self._started = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.stop()
+
+    def start(self):
+        """Start the background thread, which samples immediately."""
+        if self._thread is not None:
+            return
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="perf-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop sampling and take a final sample.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an in-flight sample
+
+        Returns:
+            dict: Metric name to summary (see ``summary``)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.interval + 5)
+            self._thread = None
+            self.sample_once()
+        return self.summary()
+
+    def sample_once(self):
+        """
+        Take one sample now.
+
+        Returns:
+            bool: True if the sample was recorded
+        """
+        if self._started is None:
+            self._started = time.monotonic()
+        try:
+            metrics = self.source.sample()
+        except Exception as e:
+            self.errors += 1
+            self.logger.debug("Performance sample failed: %s", e)
+            return False
+        elapsed = time.monotonic() - self._started
+        for name, value in metrics.items():
+            series = self.series.get(name)
+            if series is None:
+                series = self.series[name] = TimeSeries(name)
+            series.append(elapsed, value)
+        return True
+
+    def summary(self):
+        """
+        Summaries of every sampled metric.
+
+        Returns:
+            dict: Metric name to ``TimeSeries.summary()``
+        """
+        return {name: series.summary() for name, series in sorted(self.series.items())}
+
+    def _run(self):
+        consecutive = 0
+        while True:
+            consecutive = 0 if self.sample_once() else consecutive + 1
+            if consecutive >= self.max_errors:
+                self.logger.warning("Performance sampling stopped after %d failed samples", consecutive)
+                return
+            if self._stop.wait(self.interval):
+                return
+
+
+class PerformanceBaselines:
+    """
+    Stored per-flow peaks and regression checks against them.
+
+    A flow regresses when the peak (``max``) of a checked metric exceeds
+    its baseline by more than ``threshold`` (0.2 = 20%). With ``update``
+    the highest peaks seen in this run replace the stored baselines.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    CHECKED_METRICS = ("memory_kb", "cpu_percent")
+
+    def __init__(self, path=None, threshold=None, update=None):
+        """
+        Initialize the baselines.
+
+        Args:
+            path (str, optional): Baseline JSON file
+            threshold (float, optional): Allowed relative increase
+            update (bool, optional): Record this run's peaks as new baselines
+        """
+        self.path = path or Config.PERF_BASELINE_PATH
+        self.threshold = threshold if threshold is not None else Config.PERF_REGRESSION_THRESHOLD
+        self.update = update if update is not None else Config.PERF_UPDATE_BASELINES
+        self.results = []
+        self._baselines = None
+        self._peaks = {}
+
+    def check(self, flow, summary, test_id=None):
+        """
+        Compare a flow's sampled peaks with its baseline.
+
+        Args:
+            flow (str): Flow name, e.g. "login"
+            summary (dict): ``PerformanceSampler.summary()`` output
+            test_id (str, optional): Test that ran the flow
+
+        Returns:
+            list: Regression messages; empty when within thresholds or when
+            the flow has no baseline yet
+        """
+        baseline = self._load().get(flow, {})
+        regressions = []
+        for metric in self.CHECKED_METRICS:
+            peak = summary.get(metric, {}).get("max")
+            if peak is None:
+                continue
+            flow_peaks = self._peaks.setdefault(flow, {})
+            flow_peaks[metric] = max(peak, flow_peaks.get(metric, peak))
+            limit = baseline.get(metric)
+            if limit and peak > limit * (1 + self.threshold):
+                regressions.append(
+                    f"{flow} {metric} peak {peak:.1f} exceeds baseline {limit:.1f} "
+                    f"by {peak / limit - 1:.0%} (threshold {self.threshold:.0%})"
+                )
+        self.results.append((flow, test_id, summary, regressions))
+        return regressions
+
+    def save(self):
+        """Write this run's peaks as the new baselines when updating."""
+        if not self.update or not self._peaks:
+            return
+        baselines = dict(self._load())
+        for flow, peaks in self._peaks.items():
+            baselines[flow] = {**baselines.get(flow, {}), **peaks}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(baselines, handle, indent=2, sort_keys=True)
+        self.logger.info("Performance baselines updated: %s", self.path)
+
+    def summary_lines(self):
+        """
+        Per-test peak lines followed by any regressions.
+
+        Returns:
+            list: Human-readable lines
+        """
+        lines = []
+        for flow, test_id, summary, regressions in self.results:
+            peaks = ", ".join(
+                f"{metric} max {stats['max']:.1f}"
+                for metric, stats in summary.items() if stats
+            )
+            lines.append(f"{flow:<14} {test_id}: {peaks or 'no samples'}")
+            lines.extend(f"  REGRESSION {message}" for message in regressions)
+        return lines
+
+    def _load(self):
+        if self._baselines is None:
+            try:
+                with open(self.path, encoding="utf-8") as handle:
+                    self._baselines = json.load(handle)
+            except FileNotFoundError:
+                self._baselines = {}
+        return self._baselines
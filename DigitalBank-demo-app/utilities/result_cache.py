@@ -0,0 +1,211 @@
+"""Incremental test-result cache keyed on app build and test fingerprint."""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+
+from config.config import Config
+from utilities.logger import Logger
+
+
+class ResultCache:
+    """
+    Skip tests that already passed against identical inputs.
+
+    A test's fingerprint hashes the app build (``Config.APP_BUILD``), the
+    platform, the test function source and the source of fixtures defined
+    next to it, its parameters (dataset records are hashed by content), and
+    the source of every page-object module its test module uses. Locators
+    live in the page modules, so a changed locator changes the fingerprint
+    of every test that uses that page.
+
+    A passing result is reused only when the stored fingerprint is identical
+    and younger than ``max_age_hours``; any failure or error drops the
+    entry. Without an app build the cache cannot tell whether the app
+    changed, so it stays disabled. ``force`` (``RESULT_CACHE_FORCE``) runs
+    everything while still recording fresh results.
+    """
+
+    def __init__(self, path=None, build=None, max_age_hours=None, force=None):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str, optional): Cache file
+            build (str, optional): App build identifier (package/bundle version)
+            max_age_hours (float, optional): Maximum age of a reusable result
+            force (bool, optional): Ignore cached results for this run
+        """
+        self.logger = Logger.get_logger(__name__)
+        self.path = path or Config.RESULT_CACHE_PATH
+        self.build = build if build is not None else Config.APP_BUILD
+        self.max_age_hours = (
+            max_age_hours if max_age_hours is not None else Config.RESULT_CACHE_MAX_AGE_HOURS
+        )
+        self.force = force if force is not None else Config.RESULT_CACHE_FORCE
+        self._entries = None
+        self._updated = {}
+        self._sources = {}
+
+    @property
+    def enabled(self):
+        """Whether results can be reused or recorded in this run."""
+        return bool(self.build)
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def lookup(self, item):
+        """
+        Return the cached passing result for a test, if still valid.
+
+        The fingerprint is computed here and kept on the item so ``record``
+        stores the result under the key the test actually ran with.
+
+        Args:
+            item: Pytest item
+
+        Returns:
+            dict: Cached entry with ``key``, ``outcome``, ``duration`` and
+            ``timestamp``, or None if the test has to run
+        """
+        if not self.enabled:
+            return None
+        item.result_cache_key = self.fingerprint(item)
+        if self.force:
+            return None
+        entry = self._load().get(item.nodeid)
+        if entry is None or entry["key"] != item.result_cache_key:
+            return None
+        if time.time() - entry["timestamp"] > self.max_age_hours * 3600:
+            return None
+        return entry
+
+    def record(self, item, report):
+        """
+        Store a passing call result, or forget the test after any failure.
+
+        Args:
+            item: Pytest item
+            report: Pytest test report of any phase
+        """
+        key = getattr(item, "result_cache_key", None)
+        if key is None or report.skipped:
+            return
+        if report.failed:
+            self._updated[item.nodeid] = None
+        elif report.when == "call":
+            self._updated[item.nodeid] = {
+                "key": key,
+                "outcome": report.outcome,
+                "duration": round(report.duration, 3),
+                "timestamp": time.time(),
+            }
+
+    def save(self):
+        """
+        Merge this run's results into the cache file and drop expired entries.
+
+        The file is re-read before writing so parallel workers only
+        overwrite the tests they ran.
+        """
+        if not self.enabled or not self._updated:
+            return
+        self._entries = None
+        entries = self._load()
+        for nodeid, entry in self._updated.items():
+            if entry is None:
+                entries.pop(nodeid, None)
+            else:
+                entries[nodeid] = entry
+        cutoff = time.time() - self.max_age_hours * 3600
+        entries = {nodeid: e for nodeid, e in entries.items() if e["timestamp"] >= cutoff}
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"build": self.build, "entries": entries}, handle, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+        self._updated = {}
+        self.logger.info("Result cache saved: %d entries", len(entries))
+
+    def fingerprint(self, item):
+        """
+        Hash everything a test's outcome depends on.
+
+        Args:
+            item: Pytest item
+
+        Returns:
+            str: Hex digest
+        """
+        digest = hashlib.sha256()
+        for part in self._fingerprint_parts(item):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _fingerprint_parts(self, item):
+        yield f"build={self.build}"
+        yield f"platform={Config.PLATFORM}"
+        yield self._source(item.function)
+
+        module_name = item.module.__name__
+        fixture_defs = getattr(item, "_fixtureinfo", None)
+        for name in sorted(item.fixturenames):
+            definitions = fixture_defs.name2fixturedefs.get(name, ()) if fixture_defs else ()
+            for definition in definitions:
+                if getattr(definition.func, "__module__", None) == module_name:
+                    yield self._source(definition.func)
+
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None:
+            for name, value in sorted(callspec.params.items()):
+                # DataCase references are hashed by the digest of their line
+                # taken at collection, not by offset, and are never loaded here
+                digest = getattr(value, "digest", None)
+                if digest is not None:
+                    yield f"{name}=record:{digest}"
+                else:
+                    yield f"{name}={json.dumps(value, sort_keys=True, default=repr)}"
+
+        for page_module in self._page_modules(item.module):
+            yield self._source(page_module)
+
+    @staticmethod
+    def _page_modules(module):
+        # Page classes imported by name, or page modules imported whole
+        names = set()
+        for value in vars(module).values():
+            name = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+            if isinstance(name, str):
+                names.add(name)
+        return [
+            sys.modules[name] for name in sorted(names)
+            if name.startswith("pages.") and name in sys.modules
+        ]
+
+    def _source(self, obj):
+        key = id(obj)
+        if key not in self._sources:
+            try:
+                self._sources[key] = inspect.getsource(obj)
+            except (OSError, TypeError):
+                self._sources[key] = repr(obj)
+        return self._sources[key]
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as handle:
+                    self._entries = json.load(handle).get("entries", {})
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                self.logger.warning("Ignoring unreadable result cache %s: %s", self.path, e)
+                self._entries = {}
+        return self._entries
@@ -0,0 +1,197 @@
+"""Shared device sessions and page-source snapshots for read-only screen checks."""
+
+from utilities.logger import Logger
+from utilities.page_source import PageSource
+
+
+class ScreenSnapshot:
+    """
+    One screen's page source, captured once and queried by many checks.
+
+    Locators that ``PageSource`` cannot evaluate offline fall back to a
+    live ``find_elements`` on the shared session, which runs with implicit
+    wait disabled so a missing element fails immediately.
+    """
+
+    def __init__(self, name, driver, source):
+        """
+        Initialize the snapshot.
+
+        Args:
+            name (str): Screen group name
+            driver (webdriver.Remote): Session the snapshot was taken from
+            source (PageSource): Parsed page source
+        """
+        self.name = name
+        self.driver = driver
+        self.source = source
+
+    def is_present(self, locator):
+        """
+        Check that the locator matches a visible element on the screen.
+
+        Args:
+            locator (tuple): Locator tuple (AppiumBy.ID, 'element_id')
+
+        Returns:
+            bool: True if a visible match exists
+        """
+        present = self.source.is_present(locator)
+        if present is None:
+            present = any(element.is_displayed() for element in self.driver.find_elements(*locator))
+        return present
+
+
+class ScreenCheckGroups:
+    """
+    Run read-only screen checks in one device session per screen.
+
+    Tests marked ``@pytest.mark.screen_check("login")`` are moved next to
+    each other at collection. The first one to run opens a session and
+    captures the page source once, the others evaluate their locators
+    against that snapshot, and the last one quits the session. Each test
+    still passes or fails on its own, so one missing element does not hide
+    the others (soft-assertion semantics) and results stay per test id.
+    """
+
+    MARKER = "screen_check"
+
+    def __init__(self, create_driver=None, quit_driver=None):
+        """
+        Initialize the registry.
+
+        Args:
+            create_driver (callable, optional): Session factory; defaults to
+                ``DriverFactory.create_driver``
+            quit_driver (callable, optional): Session teardown; defaults to
+                ``DriverFactory.quit_driver``
+        """
+        self.logger = Logger.get_logger(__name__)
+        self._create_driver = create_driver
+        self._quit_driver = quit_driver
+        self._remaining = {}
+        self._snapshots = {}
+        self._errors = {}
+
+    @classmethod
+    def group_of(cls, item):
+        """
+        Screen group of a collected test.
+
+        Args:
+            item: Pytest item
+
+        Returns:
+            str: Group name, or None for ordinary tests
+        """
+        marker = item.get_closest_marker(cls.MARKER)
+        return marker.args[0] if marker else None
+
+    def schedule(self, items):
+        """
+        Order items so each screen group runs back to back.
+
+        A group is placed where its first member was collected; other tests
+        keep their relative order.
+
+        Args:
+            items (list): Collected pytest items
+
+        Returns:
+            list: Reordered items
+        """
+        groups = {}
+        slots = []
+        for item in items:
+            name = self.group_of(item)
+            if name is None:
+                slots.append([item])
+            elif name in groups:
+                groups[name].append(item)
+            else:
+                groups[name] = [item]
+                slots.append(groups[name])
+        # Tests skipped up front never request the snapshot, so they are not counted
+        self._remaining = {
+            name: sum(1 for item in members if item.get_closest_marker("skip") is None)
+            for name, members in groups.items()
+        }
+        return [item for slot in slots for item in slot]
+
+    def acquire(self, name, ready=None, navigate=None):
+        """
+        Return the group's snapshot, opening the session on first use.
+
+        Args:
+            name (str): Screen group name
+            ready (tuple, optional): Locator to wait for before capturing
+            navigate (callable, optional): ``navigate(driver)`` brings a new
+                session from the launch screen to the screen under check
+
+        Returns:
+            ScreenSnapshot: Shared snapshot of the screen
+
+        Raises:
+            RuntimeError: If the session or snapshot could not be created;
+                raised again for every later test of the group
+        """
+        if name in self._errors:
+            raise RuntimeError(f"Screen '{name}' is unavailable: {self._errors[name]}")
+        if name not in self._snapshots:
+            try:
+                self._snapshots[name] = self._capture(name, ready, navigate)
+            except Exception as e:
+                self._errors[name] = e
+                self.logger.error("Could not capture screen '%s': %s", name, e)
+                raise RuntimeError(f"Screen '{name}' is unavailable: {e}") from e
+        return self._snapshots[name]
+
+    def release(self, name):
+        """
+        Mark one test of the group finished; quit the session after the last.
+
+        Args:
+            name (str): Screen group name
+        """
+        self._remaining[name] = self._remaining.get(name, 1) - 1
+        if self._remaining[name] <= 0:
+            self._close(name)
+
+    def close(self):
+        """Quit every session still open (e.g. after ``-x`` stopped a group early)."""
+        for name in list(self._snapshots):
+            self._close(name)
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _capture(self, name, ready, navigate):
+        create_driver = self._create_driver
+        if create_driver is None:
+            from utilities.driver_factory import DriverFactory
+            create_driver = DriverFactory.create_driver
+        driver = create_driver()
+        try:
+            if navigate is not None:
+                navigate(driver)
+            if ready is not None:
+                from utilities.mobile_actions import MobileActions
+                MobileActions(driver).wait_for_element(ready)
+            source = PageSource.from_driver(driver)
+            driver.implicitly_wait(0)
+        except Exception:
+            self._quit(driver)
+            raise
+        self.logger.info("Captured screen '%s' for %d checks", name, self._remaining.get(name, 0))
+        return ScreenSnapshot(name, driver, source)
+
+    def _close(self, name):
+        snapshot = self._snapshots.pop(name, None)
+        if snapshot is not None:
+            self._quit(snapshot.driver)
+
+    def _quit(self, driver):
+        quit_driver = self._quit_driver
+        if quit_driver is None:
+            from utilities.driver_factory import DriverFactory
+            quit_driver = DriverFactory.quit_driver
+        quit_driver(driver)
@@ -0,0 +1,269 @@
+"""Scroll until a locator is found, remembering where each one was."""
+
+import threading
+import time
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.locator_strategies import AppiumBy
+from utilities.logger import Logger
+from utilities.page_source import PageSource
+from utilities.tracing import traced_class
+
+
+@traced_class()
+class ScrollSearch:
+    """
+    Find an element by locator, scrolling the screen until it shows up.
+
+    A search tries, cheapest first:
+
+    1. the current screen, checked against one page-source snapshot
+    2. the remembered offset: where this locator was found on this screen
+       before, reached from the top in as few large scrolls as possible
+    3. the platform's native scroll-into-view (``UiScrollable`` on
+       Android, ``mobile: scroll`` to a name or predicate on iOS), for
+       locators that translate to it
+    4. stepped scrolling down from the top: each step scrolls a fraction
+       of the scroll area and checks a new snapshot. Steps grow while
+       consecutive snapshots overlap heavily and shrink when they share
+       nothing, so content is not skipped. The search stops when the
+       snapshot no longer changes (or Android reports it cannot scroll
+       further).
+
+    Offsets are kept per platform, screen and locator for the whole
+    process, in units of scroll-area heights from the top of the screen,
+    so they hold wherever the screen was scrolled to when a search starts.
+    Scrolling uses ``mobile:`` gestures, so no action chains are built.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    _offsets = {}
+    _offsets_lock = threading.Lock()
+
+    def __init__(self, driver, screen=None, max_swipes=None, step=None, native=None):
+        """
+        Initialize the search.
+
+        Args:
+            driver (webdriver.Remote): Appium driver instance
+            screen (str, optional): Screen name keying remembered offsets
+            max_swipes (int, optional): Stepped scrolls before giving up
+            step (float, optional): First step as a fraction of the scroll area
+            native (bool, optional): Try native scroll-into-view
+        """
+        self.driver = driver
+        self.screen = screen or "screen"
+        self.max_swipes = max_swipes if max_swipes is not None else Config.SCROLL_MAX_SWIPES
+        self.step = step if step is not None else Config.SCROLL_STEP
+        self.native = native if native is not None else Config.SCROLL_NATIVE
+        self._area = None
+
+    @classmethod
+    def forget(cls, screen=None):
+        """Drop remembered offsets, of one screen or all."""
+        with cls._offsets_lock:
+            for key in [k for k in cls._offsets if screen is None or k.split("|")[1] == screen]:
+                del cls._offsets[key]
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def find(self, locator, name=None):
+        """
+        Scroll until the locator matches a visible element.
+
+        Args:
+            locator (tuple): Locator tuple (AppiumBy.ID, 'element_id')
+            name (str, optional): Locator name used in logs
+
+        Returns:
+            WebElement: The element, or None if it was not found
+        """
+        start = time.perf_counter()
+        key = f"{Config.PLATFORM}|{self.screen}|{locator[0]}={locator[1]}"
+        snapshot = PageSource.from_driver(self.driver)
+        element = self._visible(locator, snapshot)
+        if element is not None:
+            return self._found(element, locator, name, "snapshot", 0, start)
+
+        travelled = None  # scroll-area heights from the top, once known
+        with self._offsets_lock:
+            remembered = self._offsets.get(key)
+        if remembered:
+            self._scroll_to_top()
+            travelled = self._scroll_by(remembered)
+            snapshot = PageSource.from_driver(self.driver)
+            element = self._visible(locator, snapshot)
+            if element is not None:
+                return self._found(element, locator, name, "offset", 0, start)
+
+        if self.native:
+            element = self._native(locator)
+            if element is not None:
+                return self._found(element, locator, name, "native", 0, start)
+            travelled = None  # a failed native scroll may have moved the screen
+
+        if travelled is None:
+            self._scroll_to_top()
+            travelled = 0.0
+            top = PageSource.from_driver(self.driver)
+            if top.xml != snapshot.xml:
+                # The search began further down; the locator may be above
+                element = self._visible(locator, top)
+                if element is not None:
+                    return self._found(element, locator, name, "top", 0, start)
+            snapshot = top
+        step = self.step
+        for swipe in range(1, self.max_swipes + 1):
+            can_scroll = self._scroll(step)
+            travelled += step
+            current = PageSource.from_driver(self.driver)
+            element = self._visible(locator, current)
+            if element is not None:
+                with self._offsets_lock:
+                    self._offsets[key] = travelled
+                return self._found(element, locator, name, "scroll", swipe, start)
+            if current.xml == snapshot.xml or can_scroll is False:
+                self.logger.info("Reached the end of %s without finding %s", self.screen, name or locator)
+                break
+            step = self._adapt(step, snapshot, current)
+            snapshot = current
+        EventBus.emit("scroll_search", page=self.screen, locator=locator,
+                      duration=time.perf_counter() - start, outcome="not_found")
+        return None
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _found(self, element, locator, name, method, swipes, start):
+        self.logger.info("Found %s on %s via %s after %d scrolls", name or locator, self.screen, method, swipes)
+        EventBus.emit("scroll_search", page=self.screen, locator=locator,
+                      duration=time.perf_counter() - start, method=method, swipes=swipes)
+        return element
+
+    def _visible(self, locator, snapshot):
+        nodes = snapshot.find_all(locator)
+        if nodes is None:
+            # Not decidable offline: ask the driver
+            elements = self.driver.find_elements(*locator)
+            return next((e for e in elements if e.is_displayed()), None)
+        if not nodes:
+            return None
+        return self.driver.find_element(*locator)
+
+    def _adapt(self, step, previous, current):
+        before, after = _content(previous), _content(current)
+        overlap = len(before & after) / len(after) if after else 0.0
+        if overlap > 0.6:
+            return min(Config.SCROLL_MAX_STEP, step * 1.5)
+        if overlap == 0.0:
+            return max(Config.SCROLL_MIN_STEP, step / 2)
+        return step
+
+    def _scroll_area(self):
+        if self._area is None:
+            size = self.driver.get_window_size()
+            self._area = {
+                "left": 0, "top": int(size["height"] * 0.2),
+                "width": size["width"], "height": int(size["height"] * 0.6),
+            }
+        return self._area
+
+    def _scroll(self, fraction):
+        """
+        Scroll content up by ``fraction`` of the scroll area (down if negative).
+
+        Android says whether more remains in that direction; iOS returns None.
+        """
+        area = self._scroll_area()
+        if Config.is_android():
+            return self.driver.execute_script(
+                "mobile: scrollGesture",
+                {**area, "direction": "down" if fraction > 0 else "up", "percent": abs(fraction)},
+            )
+        x = area["left"] + area["width"] // 2
+        bottom = area["top"] + area["height"]
+        start = bottom if fraction > 0 else area["top"]
+        self.driver.execute_script("mobile: dragFromToForDuration", {
+            "duration": 0.1, "fromX": x, "fromY": start,
+            "toX": x, "toY": start - int(area["height"] * fraction),
+        })
+        return None
+
+    def _scroll_to_top(self):
+        """Scroll content down to the top; at most ``max_swipes`` full-area scrolls."""
+        previous = None
+        for _ in range(self.max_swipes):
+            if self._scroll(-1.0) is False:
+                return  # Android: nothing above
+            if not Config.is_android():
+                current = PageSource.from_driver(self.driver).xml
+                if current == previous:
+                    return
+                previous = current
+
+    def _scroll_by(self, offset):
+        remaining = offset
+        while remaining > 1e-6:
+            chunk = min(Config.SCROLL_MAX_STEP, remaining)
+            if self._scroll(chunk) is False:
+                break
+            remaining -= chunk
+        return offset - remaining
+
+    def _native(self, locator):
+        try:
+            if Config.is_android():
+                selector = _ui_selector(locator)
+                if selector is None:
+                    return None
+                return self.driver.find_element(
+                    AppiumBy.ANDROID_UIAUTOMATOR,
+                    f"new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView({selector})",
+                )
+            strategy, value = locator
+            if strategy == AppiumBy.ACCESSIBILITY_ID:
+                target = {"name": value}
+            elif strategy == AppiumBy.IOS_PREDICATE:
+                target = {"predicateString": value}
+            else:
+                return None
+            containers = self.driver.find_elements(
+                AppiumBy.IOS_CLASS_CHAIN,
+                "**/*[`type IN {'XCUIElementTypeScrollView', 'XCUIElementTypeTable', "
+                "'XCUIElementTypeCollectionView'}`]",
+            )
+            if not containers:
+                return None
+            self.driver.execute_script("mobile: scroll", {"elementId": containers[0].id, **target})
+            element = self.driver.find_element(*locator)
+            return element if element.is_displayed() else None
+        except Exception as e:
+            self.logger.debug("Native scroll to %s failed: %s", locator, e)
+            return None
+
+
+def _ui_selector(locator):
+    """UiSelector expression equivalent to a locator, or None."""
+    strategy, value = locator
+    if strategy == AppiumBy.ANDROID_UIAUTOMATOR:
+        return value if value.strip().startswith("new UiSelector()") else None
+    quoted = value.replace("\\", "\\\\").replace('"', '\\"')
+    if strategy == AppiumBy.ACCESSIBILITY_ID:
+        return f'new UiSelector().description("{quoted}")'
+    if strategy == AppiumBy.ID:
+        if ":id/" in value:
+            return f'new UiSelector().resourceId("{quoted}")'
+        return f'new UiSelector().resourceIdMatches(".*:id/{quoted}")'
+    if strategy == AppiumBy.NAME:
+        return f'new UiSelector().text("{quoted}")'
+    return None
+
+
+def _content(snapshot):
+    """Identity of the visible nodes, ignoring their position."""
+    return {
+        (node.tag, node.get("text") or node.get("name") or node.get("label"),
+         node.get("content-desc"), node.get("resource-id"))
+        for node in snapshot.root.iter() if PageSource.is_visible(node)
+    }
@@ -0,0 +1,345 @@
+"""Self-healing locators: ranked alternates and a persisted cache of winners."""
+
+import json
+import os
+import threading
+import time
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.logger import Logger
+from utilities.page_source import PageSource
+
+
+class HealingLocator(tuple):
+    """
+    Locator tuple ``(strategy, value)`` that also carries ranked alternates.
+
+    It is still a plain 2-tuple, so ``driver.find_element(*locator)``,
+    ``PageSource`` and screen checks keep using the primary locator
+    unchanged. Only ``LocatorHealer`` looks at ``alternates``.
+    """
+
+    def __new__(cls, primary, alternates=()):
+        locator = super().__new__(cls, primary)
+        locator.alternates = tuple(tuple(alternate) for alternate in alternates)
+        return locator
+
+    def __getnewargs__(self):
+        return tuple(self), self.alternates
+
+
+def healing(primary, *alternates):
+    """
+    Build a locator with fallbacks, best first.
+
+    Rank alternates from most to least stable, e.g. accessibility id,
+    resource id, text, then XPath. Only add an alternate once
+    ``LocatorValidator`` has matched it against a captured page source.
+
+    Args:
+        primary (tuple): Locator used normally
+        *alternates (tuple): Fallback locators
+
+    Returns:
+        HealingLocator: Locator tuple with alternates
+    """
+    return HealingLocator(primary, alternates)
+
+
+class HealingCache:
+    """
+    Winning alternates of broken locators, persisted between runs.
+
+    Entries are keyed by platform, locator name and primary locator, so
+    fixing the primary in the source makes the old entry unused. Entries
+    not used for ``ttl_hours`` expire, and an entry whose winner stops
+    matching is dropped as soon as that happens.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path=None, ttl_hours=None):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str, optional): Cache file
+            ttl_hours (float, optional): Hours an unused entry is kept
+        """
+        self.path = path or Config.HEALING_CACHE_PATH
+        self.ttl_hours = ttl_hours if ttl_hours is not None else Config.HEALING_CACHE_TTL_HOURS
+        self._entries = None
+        self._updated = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide cache configured from ``Config``."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def key(name, primary):
+        """Cache key of a locator on the current platform."""
+        return f"{Config.PLATFORM}|{name}|{primary[0]}={primary[1]}"
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def get(self, name, primary):
+        """
+        Return the cached winning locator.
+
+        Args:
+            name (str): Locator name, e.g. "LoginPage.email"
+            primary (tuple): Primary locator
+
+        Returns:
+            tuple: Winning (strategy, value), or None
+        """
+        with self._lock:
+            entry = self._load().get(self.key(name, primary))
+        return (entry["strategy"], entry["value"]) if entry else None
+
+    def put(self, name, primary, winner):
+        """
+        Record a healed locator.
+
+        Args:
+            name (str): Locator name
+            primary (tuple): Broken primary locator
+            winner (tuple): Alternate that matched
+        """
+        now = time.time()
+        entry = {
+            "name": name,
+            "primary": list(primary),
+            "strategy": winner[0],
+            "value": winner[1],
+            "healed": now,
+            "last_used": now,
+            "uses": 1,
+        }
+        with self._lock:
+            key = self.key(name, primary)
+            self._load()[key] = self._updated[key] = entry
+
+    def touch(self, name, primary):
+        """Mark a cached winner as used now, keeping it from expiring."""
+        with self._lock:
+            key = self.key(name, primary)
+            entry = self._load().get(key)
+            if entry is not None:
+                entry["last_used"] = time.time()
+                entry["uses"] = entry.get("uses", 0) + 1
+                self._updated[key] = entry
+
+    def invalidate(self, name, primary):
+        """Drop a cached winner that no longer matches."""
+        with self._lock:
+            key = self.key(name, primary)
+            self._load().pop(key, None)
+            self._updated[key] = None
+
+    def entries(self):
+        """
+        All live entries.
+
+        Returns:
+            list: Entry dicts, sorted by locator name
+        """
+        with self._lock:
+            return sorted(self._load().values(), key=lambda entry: entry["name"])
+
+    def save(self):
+        """
+        Merge this run's changes into the cache file and drop expired entries.
+
+        The file is re-read before writing so parallel workers only
+        overwrite the locators they healed.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self._entries = None
+            entries = self._load()
+            for key, entry in self._updated.items():
+                if entry is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = entry
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self._updated = {}
+        self.logger.info("Healing cache saved: %d entries", len(entries))
+
+    def report_lines(self):
+        """
+        One line per healed locator, to fix in the page objects.
+
+        Returns:
+            list: Human-readable lines
+        """
+        lines = []
+        for entry in self.entries():
+            strategy, value = entry["primary"]
+            lines.append(
+                f"{entry['name']}: {strategy} {value!r} -> {entry['strategy']} {entry['value']!r} "
+                f"(used {entry.get('uses', 0)}x since "
+                f"{time.strftime('%Y-%m-%d', time.localtime(entry['healed']))})"
+            )
+        return lines
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as handle:
+                    entries = json.load(handle)
+            except FileNotFoundError:
+                entries = {}
+            except ValueError as e:
+                self.logger.warning("Ignoring unreadable healing cache %s: %s", self.path, e)
+                entries = {}
+            cutoff = time.time() - self.ttl_hours * 3600
+            self._entries = {key: entry for key, entry in entries.items() if entry["last_used"] >= cutoff}
+        return self._entries
+
+
+class LocatorHealer:
+    """
+    Find elements through ``HealingLocator`` alternates when the primary breaks.
+
+    1. A cached winner is tried first, without implicit wait, so a broken
+       locator costs only one lookup once it has been healed. It is used
+       only while it still matches exactly one displayed element.
+    2. Otherwise the primary is used with the normal implicit wait.
+    3. On a miss, one page-source snapshot is taken and the alternates are
+       evaluated against it offline, in rank order. The first one that
+       matches exactly one visible element wins and is cached.
+
+    Alternates that cannot be evaluated offline, or that match several
+    elements, are skipped. Plain tuples are passed straight to the driver.
+    Presence and negative checks pass ``heal=False``: an element that is
+    legitimately absent must neither drop a cached winner nor pin an
+    alternate that happens to match something else on the current screen.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, driver, page=None, cache=None, enabled=None):
+        """
+        Initialize the healer.
+
+        Args:
+            driver (webdriver.Remote): Appium driver instance
+            page (str, optional): Page name used in locator names
+            cache (HealingCache, optional): Cache; defaults to the shared one
+            enabled (bool, optional): Heal on misses; defaults to Config
+        """
+        self.driver = driver
+        self.page = page
+        self.cache = cache or HealingCache.shared()
+        self.enabled = enabled if enabled is not None else Config.SELF_HEALING_ENABLED
+
+    def find_element(self, locator, name=None, heal=True):
+        """
+        Find an element, healing the locator if needed.
+
+        Args:
+            locator (tuple): Plain or healing locator
+            name (str, optional): Locator key within the page, e.g. "email"
+            heal (bool): Heal and invalidate cache entries on misses; False
+                for checks where the element may rightly be absent
+
+        Returns:
+            WebElement: Found element
+
+        Raises:
+            Exception: The primary lookup's error if nothing could be healed
+        """
+        alternates = getattr(locator, "alternates", ())
+        if not self.enabled or not alternates:
+            return self.driver.find_element(*locator)
+
+        name = f"{self.page}.{name}" if self.page and name else name or f"{locator[0]}={locator[1]}"
+        primary = tuple(locator)
+        cached = self.cache.get(name, primary)
+        if cached is not None:
+            element = self._unique_displayed(self._find_now(cached))
+            if element is not None:
+                self.cache.touch(name, primary)
+                return element
+            if heal:
+                self.logger.info("Cached healing for %s no longer matches one element, dropping it", name)
+                self.cache.invalidate(name, primary)
+
+        try:
+            return self.driver.find_element(*primary)
+        except Exception as error:
+            if not heal:
+                raise
+            winner = self.heal(name, primary, alternates)
+            if winner is None:
+                raise error
+            return self.driver.find_element(*winner)
+
+    def _find_now(self, locator):
+        """Elements matching right now, without waiting for them to appear."""
+        self.driver.implicitly_wait(0)
+        try:
+            return self.driver.find_elements(*locator)
+        finally:
+            self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+    @staticmethod
+    def _unique_displayed(elements):
+        """The only matching element if it is displayed, else None."""
+        if len(elements) != 1:
+            return None
+        try:
+            return elements[0] if elements[0].is_displayed() else None
+        except Exception:
+            return None  # went stale between the lookup and the check
+
+    def heal(self, name, primary, alternates):
+        """
+        Pick the first alternate that matches one element in a fresh snapshot.
+
+        Args:
+            name (str): Locator name
+            primary (tuple): Broken primary locator
+            alternates (tuple): Ranked fallbacks
+
+        Returns:
+            tuple: Winning locator, or None
+        """
+        start = time.perf_counter()
+        try:
+            snapshot = PageSource.from_driver(self.driver)
+        except Exception as e:
+            self.logger.warning("Cannot heal %s, page source unavailable: %s", name, e)
+            return None
+        for alternate in alternates:
+            nodes = snapshot.find_all(alternate)
+            if nodes is None or len(nodes) != 1:
+                self.logger.debug("Alternate %s for %s: %s", alternate, name,
+                                  "not evaluable offline" if nodes is None else f"{len(nodes)} matches")
+                continue
+            self.cache.put(name, primary, alternate)
+            self.logger.warning("Healed locator %s: %s -> %s", name, primary, alternate)
+            EventBus.emit("heal_locator", page=self.page, locator=primary,
+                          duration=time.perf_counter() - start, healed_to=list(alternate))
+            return alternate
+        EventBus.emit("heal_locator", page=self.page, locator=primary,
+                      duration=time.perf_counter() - start, outcome="error")
+        return None
@@ -0,0 +1,488 @@
+"""Change-based test selection from a test -> page method -> locator map.
+
+Record which page-object methods each test calls, from a run with events
+enabled:
+    python -m utilities.test_selection record reports/events/*.jsonl
+
+Print the tests affected by the changes since a git ref:
+    python -m utilities.test_selection select origin/main
+
+Or run only those tests:
+    pytest --changed-since origin/main
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import subprocess
+from collections import defaultdict, namedtuple
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.logger import Logger
+
+Selection = namedtuple("Selection", "full reason tests changed")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files every test depends on; changing one selects the full suite
+SHARED_FILES = ("tests/conftest.py", "pytest.ini", "../requirements.txt")
+
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def changed_lines(base, root=PROJECT_ROOT):
+    """
+    Lines changed in the working tree since a git ref, per file.
+
+    The diff covers the whole repository, so shared files outside the
+    project (``../requirements.txt``) are seen too; untracked files that
+    are not ignored count as added.
+
+    Args:
+        base (str): Git ref to diff against
+        root (str): Project root; paths are relative to it
+
+    Returns:
+        dict: Path to a set of changed line numbers (new-file numbering), or
+        None when the whole file changed (added or deleted)
+    """
+    toplevel = _git(root, "rev-parse", "--show-toplevel").strip()
+
+    def relative(path):
+        return os.path.relpath(os.path.join(toplevel, path), root).replace(os.sep, "/")
+
+    output = _git(toplevel, "diff", "--no-prefix", "-U0", base, "--")
+    changes, path, old_path = {}, None, None
+    for line in output.splitlines():
+        if line.startswith("--- "):
+            old_path = line[4:]
+        elif line.startswith("+++ "):
+            path = line[4:]
+            if path == "/dev/null":
+                path = relative(old_path)
+                changes[path] = None
+            elif old_path == "/dev/null":
+                path = relative(path)
+                changes[path] = None
+            else:
+                path = relative(path)
+                changes.setdefault(path, set())
+        elif line.startswith("@@") and path is not None and changes.get(path) is not None:
+            match = _HUNK.match(line)
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # A pure deletion (count 0) is attributed to the line it happened at
+            changes[path].update(range(start, start + max(count, 1)))
+    for path in _git(toplevel, "ls-files", "--others", "--exclude-standard").splitlines():
+        changes[relative(path)] = None
+    return changes
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout
+
+
+class PageModuleIndex:
+    """
+    Static structure of one page module: classes, methods and locator keys.
+
+    A method "references" the locator keys it subscripts from
+    ``self.locators`` (or names in ``@page_action``) and the other members
+    it reads through ``self``. A change to a locator entry therefore
+    affects every method that uses that locator, directly or through a
+    property or helper.
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.tree = ast.parse(source)
+        self.classes = {}
+        for node in self.tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes[node.name] = self._index_class(node)
+
+    def affected(self, lines):
+        """
+        Methods affected by changed lines.
+
+        Args:
+            lines (set): Changed line numbers, or None for the whole file
+
+        Returns:
+            dict: Class name to a set of method names, or to None when the
+            whole class is affected
+        """
+        if lines is None:
+            return {name: None for name in self.classes}
+        class_lines = set()
+        result = {}
+        for name, info in self.classes.items():
+            span = set(range(info["start"], info["end"] + 1))
+            class_lines |= span
+            if lines & span:
+                result[name] = self._affected_members(info, lines)
+        if lines - class_lines:
+            # Imports or module-level code changed
+            return {name: None for name in self.classes}
+        return {name: members for name, members in result.items() if members != set()}
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _index_class(self, node):
+        members, locators = {}, defaultdict(list)
+        for item in node.body:
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            start = min([item.lineno] + [d.lineno for d in item.decorator_list])
+            members[item.name] = {"start": start, "end": item.end_lineno, "refs": self._refs(item)}
+            if item.name == "__init__":
+                for key, span in self._locator_entries(item):
+                    locators[key].append(span)
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        return {"start": start, "end": node.end_lineno, "members": members, "locators": dict(locators)}
+
+    @staticmethod
+    def _refs(func):
+        refs = set()
+        for decorator in func.decorator_list:
+            if isinstance(decorator, ast.Call) and getattr(decorator.func, "id", None) == "page_action":
+                refs.update(("locator", arg.value) for arg in decorator.args
+                            if isinstance(arg, ast.Constant) and isinstance(arg.value, str))
+        for node in ast.walk(func):
+            if isinstance(node, ast.Subscript) and _is_self_attr(node.value, "locators"):
+                key = node.slice
+                refs.add(("locator", key.value if isinstance(key, ast.Constant) else "*"))
+            elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+                refs.add(("member", node.attr))
+        return refs
+
+    @staticmethod
+    def _locator_entries(init):
+        entries = []
+
+        def walk(dict_node):
+            for key, value in zip(dict_node.keys, dict_node.values):
+                if isinstance(value, ast.Dict):
+                    walk(value)  # per-platform nesting
+                elif isinstance(key, ast.Constant) and isinstance(key.value, str):
+                    entries.append((key.value, (key.lineno, value.end_lineno)))
+
+        for node in ast.walk(init):
+            if isinstance(node, ast.Assign) and any(_is_self_attr(t, "locators") for t in node.targets):
+                if isinstance(node.value, ast.Dict):
+                    walk(node.value)
+        return entries
+
+    def _affected_members(self, info, lines):
+        members = info["members"]
+        changed_locators = {
+            key for key, spans in info["locators"].items()
+            if any(lines & set(range(start, end + 1)) for start, end in spans)
+        }
+        locator_lines = {
+            line for spans in info["locators"].values() for start, end in spans
+            for line in range(start, end + 1)
+        }
+        member_lines = set()
+        affected = set()
+        for name, member in members.items():
+            span = set(range(member["start"], member["end"] + 1))
+            member_lines |= span
+            if name == "__init__":
+                if (lines & span) - locator_lines:
+                    return None  # construction changed: every use is affected
+            elif lines & span:
+                affected.add(name)
+        class_body = set(range(info["start"], info["end"] + 1)) - member_lines
+        if lines & class_body:
+            return None  # class attributes or bases changed
+
+        # Methods using a changed locator, then everything using those, to a fixpoint
+        while True:
+            before = len(affected)
+            for name, member in members.items():
+                refs = member["refs"]
+                if name in affected or name == "__init__":
+                    continue
+                if any(("locator", key) in refs for key in changed_locators) or (
+                    changed_locators and ("locator", "*") in refs
+                ) or any(("member", other) in refs for other in affected):
+                    affected.add(name)
+            if len(affected) == before:
+                return affected
+
+
+def _is_self_attr(node, attr):
+    return (isinstance(node, ast.Attribute) and node.attr == attr
+            and isinstance(node.value, ast.Name) and node.value.id == "self")
+
+
+class ImpactSelector:
+    """
+    Select the tests affected by a set of changed files.
+
+    - ``pages/``: methods touched by the changed lines (including methods
+      that use a changed locator) are matched against the page methods each
+      test calls. Calls are found statically in the test source and, when a
+      recorded map exists, from the events of a real run.
+    - ``utilities/``: a module reachable from ``tests/conftest.py`` is
+      shared infrastructure and selects the full suite. Other modules
+      select the tests that import them, directly or through a page.
+    - ``config/`` and the shared files in ``SHARED_FILES`` select the full
+      suite.
+    - Changed test modules are selected whole, and changed data files
+      select the tests that mention them.
+    - Anything else (docs, benchmarks) selects nothing.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, root=PROJECT_ROOT, map_path=None):
+        """
+        Initialize the selector.
+
+        Args:
+            root (str): Project root
+            map_path (str, optional): Recorded runtime map
+        """
+        self.root = root
+        self.map_path = map_path or Config.TEST_MAP_PATH
+        self._tests = None
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def select(self, changes):
+        """
+        Select tests for changed files.
+
+        Args:
+            changes (dict): Path to changed lines (see ``changed_lines``)
+
+        Returns:
+            Selection: ``full`` with the reason, or the selected test ids
+            (function-level node ids, without parameters)
+        """
+        changed = sorted(changes)
+        shared = self._shared_modules()
+        page_methods = defaultdict(set)  # "Page.method" names, or "Page.*"
+        modules = set()
+        data_files = set()
+        selected = set()
+        for path in changed:
+            module = _module_name(path)
+            if path in SHARED_FILES or path.startswith("config/"):
+                return Selection(True, f"{path} is shared by every test", None, changed)
+            if path.startswith("utilities/") and path.endswith(".py"):
+                if module in shared:
+                    return Selection(True, f"{path} is shared infrastructure (used by conftest)", None, changed)
+                modules.add(module)
+            elif path.startswith("pages/") and path.endswith(".py"):
+                affected = self._page_changes(path, changes[path])
+                for page, methods in affected.items():
+                    if methods is None:
+                        modules.add(module)
+                    page_methods[page].update(methods or ())
+            elif path.startswith("tests/test_") and path.endswith(".py"):
+                selected.update(test for test in self.tests() if test.startswith(f"{path}::"))
+            elif path.startswith(f"{Config.DATA_DIR}/"):
+                data_files.add(os.path.basename(path))
+
+        importers = self._importers(modules)
+        runtime = self._runtime_map()
+        for test, info in self.tests().items():
+            if info["imports"] & importers or info["strings"] & data_files:
+                selected.add(test)
+                continue
+            called = info["calls"] | set(runtime.get(test, ()))
+            for page, methods in page_methods.items():
+                if page in info["pages"] or any(call.startswith(f"{page}.") for call in called):
+                    if methods & info["attributes"] or any(f"{page}.{m}" in called for m in methods):
+                        selected.add(test)
+        return Selection(False, None, sorted(selected), changed)
+
+    def select_since(self, base):
+        """Select tests for the changes since a git ref."""
+        return self.select(changed_lines(base, self.root))
+
+    def tests(self):
+        """
+        Static facts about every test function.
+
+        Returns:
+            dict: Test id to ``pages`` (page classes imported), ``imports``
+            (project modules imported), ``attributes`` (attribute names used
+            by the test and its module/class fixtures), ``calls`` (empty;
+            filled from the runtime map) and ``strings`` (string literals)
+        """
+        if self._tests is None:
+            self._tests = {}
+            for path in sorted(glob.glob(os.path.join(self.root, "tests", "test_*.py"))):
+                self._tests.update(self._index_tests(os.path.relpath(path, self.root).replace(os.sep, "/")))
+        return self._tests
+
+    @staticmethod
+    def record(event_paths, map_path=None):
+        """
+        Build the runtime map from recorded event files.
+
+        Args:
+            event_paths (list): JSONL event files of a real run
+            map_path (str, optional): Output path
+
+        Returns:
+            dict: Test id to the sorted "Page.method" names it called
+        """
+        calls = defaultdict(set)
+        for path in event_paths:
+            for event in EventBus.read(path):
+                test_id, page = event.get("test_id"), event.get("page")
+                if test_id and page and page != "pytest":
+                    calls[test_id.split("[")[0]].add(f"{page}.{event['action']}")
+        mapping = {test: sorted(names) for test, names in sorted(calls.items())}
+        map_path = map_path or Config.TEST_MAP_PATH
+        os.makedirs(os.path.dirname(map_path) or ".", exist_ok=True)
+        with open(map_path, "w", encoding="utf-8") as handle:
+            json.dump(mapping, handle, indent=1)
+        return mapping
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _page_changes(self, path, lines):
+        full_path = os.path.join(self.root, path)
+        if not os.path.exists(full_path):
+            # Deleted page module: every importer is affected
+            return {os.path.splitext(os.path.basename(path))[0]: None}
+        with open(full_path, encoding="utf-8") as handle:
+            return PageModuleIndex(path, handle.read()).affected(lines)
+
+    def _runtime_map(self):
+        try:
+            with open(self.map_path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {}
+
+    def _index_tests(self, path):
+        with open(os.path.join(self.root, path), encoding="utf-8") as handle:
+            tree = ast.parse(handle.read())
+        pages, imports = set(), set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                imports.add(node.module)
+                if node.module.startswith("pages."):
+                    pages.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+
+        tests = {}
+
+        def collect(body, prefix, inherited):
+            # Fixtures, helpers and module/class-level marks apply to every test in scope
+            attributes, strings = set(inherited[0]), set(inherited[1])
+            for node in body:
+                if isinstance(node, ast.ClassDef) or (
+                    isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test")
+                ):
+                    continue
+                attributes |= _attributes(node)
+                strings |= _strings(node)
+            for node in body:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+                    tests[f"{prefix}::{node.name}"] = {
+                        "pages": pages,
+                        "imports": imports,
+                        "attributes": _attributes(node) | attributes,
+                        "calls": set(),
+                        "strings": _strings(node) | strings,
+                    }
+                elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                    collect(node.body, f"{prefix}::{node.name}", (attributes, strings | _strings_of(node)))
+
+        collect(tree.body, path, (set(), set()))
+        return tests
+
+    def _project_modules(self):
+        modules = {}
+        for pattern in ("pages/*.py", "utilities/*.py", "config/*.py", "tests/conftest.py"):
+            for path in glob.glob(os.path.join(self.root, pattern)):
+                relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+                with open(path, encoding="utf-8") as handle:
+                    tree = ast.parse(handle.read())
+                deps = set()
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.ImportFrom) and node.module:
+                        deps.add(node.module)
+                    elif isinstance(node, ast.Import):
+                        deps.update(alias.name for alias in node.names)
+                modules[_module_name(relative)] = deps
+        return modules
+
+    def _shared_modules(self):
+        """Project modules loaded by conftest, i.e. by every test."""
+        graph = self._project_modules()
+        shared, pending = set(), ["tests.conftest"]
+        while pending:
+            module = pending.pop()
+            for dep in graph.get(module, ()):
+                if dep in graph and dep not in shared:
+                    shared.add(dep)
+                    pending.append(dep)
+        return shared
+
+    def _importers(self, modules):
+        """Modules plus every project module that imports them, transitively."""
+        graph = self._project_modules()
+        result, pending = set(modules), list(modules)
+        while pending:
+            module = pending.pop()
+            for importer, deps in graph.items():
+                if module in deps and importer not in result:
+                    result.add(importer)
+                    pending.append(importer)
+        return result
+
+
+def _module_name(path):
+    return os.path.splitext(path)[0].replace("/", ".")
+
+
+def _attributes(node):
+    return {child.attr for child in ast.walk(node) if isinstance(child, ast.Attribute)}
+
+
+def _strings(node):
+    return {child.value for child in ast.walk(node)
+            if isinstance(child, ast.Constant) and isinstance(child.value, str)}
+
+
+def _strings_of(class_node):
+    """String literals in a test class's decorators (class-level marks)."""
+    return set().union(*(_strings(decorator) for decorator in class_node.decorator_list))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="Build the runtime map from event files")
+    record_parser.add_argument("events", nargs="+")
+    select_parser = commands.add_parser("select", help="Print tests affected since a git ref")
+    select_parser.add_argument("base", nargs="?", default="HEAD")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        mapping = ImpactSelector.record(args.events)
+        print(f"recorded page calls of {len(mapping)} tests to {Config.TEST_MAP_PATH}")
+        return
+    selection = ImpactSelector().select_since(args.base)
+    if selection.full:
+        print(f"full suite: {selection.reason}")
+    else:
+        for test in selection.tests:
+            print(test)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Text entry that sets field values without the soft keyboard where it can."""
+
+import threading
+import time
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.histogram import LatencyHistogram
+from utilities.logger import Logger
+from utilities.tracing import traced_class
+
+
+class TextNotEntered(AssertionError):
+    """Raised when a field does not hold the entered text afterwards."""
+
+
+@traced_class()
+class TextEntry:
+    """
+    Put text into input fields the fastest safe way per platform.
+
+    On Android the value is set in one ``mobile: replaceElementValue``
+    call, so the soft keyboard never opens and nothing needs hiding
+    afterwards. On iOS XCUITest has no keyboard-free setter, so the field
+    is cleared and typed into; the keyboard is then dismissed with
+    ``mobile: hideKeyboard`` rather than a coordinate tap (see
+    ``MobileActions.hide_keyboard``).
+
+    Real typing is used instead when a test asks for keystroke fidelity
+    (the ``keystrokes`` marker sets ``TextEntry.typed`` for that test), when
+    ``Config.TEXT_ENTRY_MODE`` is "typed", when appending, and whenever the
+    fast path fails. Every entry reads the value back and falls back to
+    typing once if it does not match. Latency per method is kept for the
+    whole run, so the two paths can be compared in the terminal summary.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    METHODS = ("replace", "typed")
+
+    # Set per test from the ``keystrokes`` marker
+    typed = False
+
+    latency = {method: LatencyHistogram() for method in METHODS}
+    _latency_lock = threading.Lock()
+
+    def __init__(self, driver, page=None, mode=None, verify=None):
+        """
+        Initialize text entry.
+
+        Args:
+            driver (webdriver.Remote): Appium driver instance
+            page (str, optional): Owning page name recorded on events
+            mode (str, optional): "fast" or "typed"
+            verify (bool, optional): Read the value back after entry
+        """
+        self.driver = driver
+        self.page = page or type(self).__name__
+        self.mode = mode or Config.TEXT_ENTRY_MODE
+        self.verify = verify if verify is not None else Config.TEXT_ENTRY_VERIFY
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def enter(self, element, text, clear=True, secret=False, locator=None, strict=True):
+        """
+        Set an input field to ``text`` (or append it when ``clear`` is False).
+
+        Args:
+            element (WebElement): Input field
+            text (str): Text to enter
+            clear (bool): Replace the current value instead of appending
+            secret (bool): Field masks its value; only the length is verified
+            locator (tuple, optional): Locator recorded on the event
+            strict (bool): Raise on a mismatch; when False it is only logged,
+                for fields that may filter or reject the text on purpose
+
+        Returns:
+            str: Method that entered the text, "replace" or "typed"
+
+        Raises:
+            TextNotEntered: If strict and the field does not hold the text afterwards
+        """
+        text = str(text)
+        start = time.perf_counter()
+        method = "typed"
+        if self._fast(clear):
+            method = "replace"
+            try:
+                self._replace(element, text)
+            except Exception as e:
+                self.logger.debug("Keyboard-free entry failed, typing instead: %s", e)
+                method = "typed"
+        if method == "typed":
+            self._type(element, text, clear)
+        value = self._verify(element, text, clear, secret)
+        if value is not True and method == "replace":
+            self.logger.warning("Field held %r after keyboard-free entry; typing instead", value)
+            method = "typed"
+            self._type(element, text, clear)
+            value = self._verify(element, text, clear, secret)
+        duration = time.perf_counter() - start
+        with self._latency_lock:
+            self.latency[method].record_seconds(duration)
+        if value is not True:
+            EventBus.emit("text_entry", page=self.page, locator=locator, duration=duration,
+                          outcome="mismatch", method=method)
+            shown = "****" if secret else value
+            message = f"Field holds {shown!r} after entering {'****' if secret else repr(text)}"
+            if strict:
+                raise TextNotEntered(message)
+            self.logger.warning("%s; leaving it to the app to validate", message)
+            return method
+        EventBus.emit("text_entry", page=self.page, locator=locator, duration=duration, method=method)
+        return method
+
+    def benchmark(self, element, text, runs=5):
+        """
+        Time both methods on the same field, alternating between them.
+
+        Args:
+            element (WebElement): Input field
+            text (str): Text to enter
+            runs (int): Entries per method
+
+        Returns:
+            dict: Method to LatencyHistogram of entry times (microseconds)
+        """
+        results = {method: LatencyHistogram() for method in self.METHODS}
+        for _ in range(runs):
+            for method in self.METHODS:
+                start = time.perf_counter()
+                if method == "replace":
+                    self._replace(element, text)
+                else:
+                    self._type(element, text, clear=True)
+                results[method].record_seconds(time.perf_counter() - start)
+        return results
+
+    @classmethod
+    def summary_lines(cls):
+        """
+        Per-method latency of the entries made this run.
+
+        Returns:
+            list: Lines; empty if no text was entered
+        """
+        lines = []
+        for method in cls.METHODS:
+            histogram = cls.latency[method]
+            if len(histogram):
+                p50, p95 = (histogram.percentile(p) / 1e3 for p in (50, 95))
+                lines.append(f"{method:<8} {len(histogram):>5} entries  p50 {p50:.0f}ms  p95 {p95:.0f}ms")
+        return lines
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _fast(self, clear):
+        return clear and not self.typed and self.mode != "typed" and Config.is_android()
+
+    def _replace(self, element, text):
+        self.driver.execute_script("mobile: replaceElementValue", {"elementId": element.id, "text": text})
+
+    def _type(self, element, text, clear):
+        if clear:
+            element.clear()
+        element.send_keys(text)
+
+    def _verify(self, element, text, clear, secret):
+        """True if the field holds the text, else the value it holds."""
+        if not self.verify:
+            return True
+        value = element.text if Config.is_android() else element.get_attribute("value")
+        value = value or ""
+        if secret:
+            # Masked fields read back as bullets, or not at all on some Android versions
+            return True if not value or len(value) == len(text) or not clear else value
+        # An emptied Android field reads back as its hint
+        if value == text or not text or (not clear and value.endswith(text)):
+            return True
+        return value
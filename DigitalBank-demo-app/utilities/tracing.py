@@ -0,0 +1,240 @@
+"""Span tracing for page objects and utilities with Chrome trace export."""
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+from config.config import Config
+
+
+class Tracer:
+    """
+    Process-wide span recorder.
+
+    Spans nest per thread and are exported as Chrome trace "complete"
+    events, viewable as a flame chart in chrome://tracing or Perfetto.
+    Sampling is decided once per test so a sampled test is traced end to
+    end. While nothing is being recorded, traced callables cost a single
+    attribute check.
+    """
+
+    enabled = Config.TRACE_ENABLED
+    sample_rate = Config.TRACE_SAMPLE_RATE
+    recording = False
+
+    _events = []
+    _local = threading.local()
+    _pid = os.getpid()
+    _origin_ns = time.perf_counter_ns()
+    _lock = threading.Lock()
+
+    @classmethod
+    def start_test(cls, test_id):
+        """
+        Decide whether to trace a test and open its root span.
+
+        Args:
+            test_id (str): Pytest node id
+        """
+        cls.recording = cls.enabled and random.random() < cls.sample_rate
+        if cls.recording:
+            cls._begin(test_id, "test", {})
+
+    @classmethod
+    def finish_test(cls, outcome=None):
+        """Close the root span of the current test and stop recording."""
+        if cls.recording:
+            cls._end({"outcome": outcome} if outcome else None)
+        cls.recording = False
+
+    @classmethod
+    def span(cls, name, category="function", **args):
+        """
+        Context manager recording one span.
+
+        Args:
+            name (str): Span name
+            category (str): Chrome trace category
+            **args: Extra values shown in the span details
+
+        Returns:
+            _Span: Context manager
+        """
+        return _Span(name, category, args)
+
+    @classmethod
+    def export(cls, path=None):
+        """
+        Write recorded spans as a Chrome trace file and reset the buffer.
+
+        Args:
+            path (str, optional): Output file; defaults to a timestamped
+                file under ``Config.TRACES_DIR``
+
+        Returns:
+            str: Trace file path, or empty string if nothing was recorded
+        """
+        with cls._lock:
+            events, cls._events = cls._events, []
+        if not events:
+            return ""
+        if path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(Config.TRACES_DIR, f"trace_{timestamp}.json")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        thread_names = {
+            event["tid"]: event.pop("thread") for event in events
+        }
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": cls._pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"traceEvents": metadata + events, "displayTimeUnit": "ms"},
+                handle, default=str,
+            )
+        return path
+
+    @classmethod
+    def reset(cls):
+        """Discard recorded spans and stop recording."""
+        with cls._lock:
+            cls._events = []
+        cls._local.stack = []
+        cls.recording = False
+
+    @classmethod
+    def instrument_driver(cls, driver):
+        """
+        Record every WebDriver command (one HTTP round-trip) as a span.
+
+        Args:
+            driver (webdriver.Remote): Appium driver instance
+
+        Returns:
+            webdriver.Remote: The same driver
+        """
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def traced_execute(driver_command, params=None):
+            if not cls.recording:
+                return execute(driver_command, params)
+            with cls.span(f"HTTP {driver_command}", "http"):
+                return execute(driver_command, params)
+
+        driver.execute = traced_execute
+        return driver
+
+    # ---------------- INTERNALS ---------------- #
+
+    @classmethod
+    def _stack(cls):
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = []
+        return stack
+
+    @classmethod
+    def _begin(cls, name, category, args):
+        cls._stack().append((name, category, args, time.perf_counter_ns()))
+
+    @classmethod
+    def _end(cls, extra_args=None):
+        end_ns = time.perf_counter_ns()
+        stack = cls._stack()
+        if not stack:
+            return
+        name, category, args, start_ns = stack.pop()
+        if extra_args:
+            args = {**args, **extra_args}
+        if stack:
+            args = {**args, "parent": stack[-1][0]}
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - cls._origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": cls._pid,
+            "tid": thread.ident,
+            "thread": thread.name,
+            "args": args,
+        }
+        with cls._lock:
+            cls._events.append(event)
+
+
+class _Span:
+    """Context manager returned by ``Tracer.span``."""
+
+    __slots__ = ("name", "category", "args", "active")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.active = False
+
+    def __enter__(self):
+        self.active = Tracer.recording
+        if self.active:
+            Tracer._begin(self.name, self.category, self.args)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.active:
+            Tracer._end({"error": exc_type.__name__} if exc_type else None)
+        return False
+
+
+def traced(name=None, category="function"):
+    """
+    Decorator recording each call as a span.
+
+    Args:
+        name (str, optional): Span name; defaults to ``Class.method``
+        category (str): Chrome trace category
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Tracer.recording:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_class(category="utility"):
+    """
+    Class decorator tracing every public method.
+
+    Args:
+        category (str): Chrome trace category
+
+    Returns:
+        callable: Class decorator
+    """
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) \
+                    or isinstance(value, (staticmethod, classmethod)):
+                continue
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}", category)(value))
+        return cls
+    return decorator
@@ -0,0 +1,228 @@
+"""Sustained transfer-flow load with latency histograms and interval reports."""
+
+import itertools
+import threading
+import time
+from collections import namedtuple
+
+from config.config import Config
+from utilities.events import EventBus
+from utilities.histogram import LatencyHistogram
+from utilities.logger import Logger
+
+LoadInterval = namedtuple(
+    "LoadInterval", "start end transactions errors throughput p50 p90 p99 max"
+)
+
+LoadReport = namedtuple(
+    "LoadReport",
+    "mode sessions seconds transactions errors error_rate throughput histogram intervals",
+)
+
+
+def transfer_transaction(page, case):
+    """
+    Run one transfer through the TransferPage flow.
+
+    Args:
+        page (TransferPage): Page object bound to a session
+        case (dict): ``account``, ``amount`` and ``description`` values
+
+    Returns:
+        bool: True if the app confirmed the transfer
+    """
+    page.select_account(case.get("account"))
+    page.enter_amount(case["amount"])
+    page.enter_description(case["description"])
+    page.select_credit()
+    page.submit_transaction()
+    return page.wait_for_submit_outcome() == "success"
+
+
+class TransferLoad:
+    """
+    Drive a transaction in a loop on one or more sessions at once.
+
+    One worker thread runs per page object (one per device session).
+
+    - ``closed`` mode: each worker starts its next transaction as soon as
+      the previous one ends, so throughput follows latency.
+    - ``fixed`` mode: transactions are scheduled at ``rate`` per second
+      across all workers. Latency is measured from the scheduled start, so
+      time spent queued behind a slow transaction counts; this avoids the
+      coordinated-omission bias of closed-loop timing.
+
+    Transactions that start during the first ``warmup`` seconds run but are
+    not measured. Measured latencies go into an HDR-style histogram. Each
+    ``interval`` seconds of counts is emitted as a ``load_interval`` event
+    once the interval has passed.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    MODES = ("closed", "fixed")
+
+    def __init__(self, pages, cases, transaction=transfer_transaction, mode="closed", rate=None,
+                 duration=None, warmup=None, interval=None, reset=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the load run.
+
+        Args:
+            pages (list): Page objects, one per session
+            cases (list): Case dicts, used round-robin
+            transaction (callable): ``transaction(page, case) -> bool`` success
+            mode (str): "closed" or "fixed"
+            rate (float, optional): Transactions per second in fixed mode
+            duration (float, optional): Measured seconds, after warm-up
+            warmup (float, optional): Unmeasured seconds at the start
+            interval (float, optional): Seconds per interval report
+            reset (callable, optional): ``reset(page)`` after every
+                transaction, to bring the session back to the transfer form
+                (e.g. ``TransferPage.return_to_form``); not timed
+            clock (callable): Monotonic time source
+            sleep (callable): Sleep function
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown load mode: {mode}")
+        if mode == "fixed" and not rate:
+            raise ValueError("Fixed-rate mode needs a rate")
+        if not cases:
+            raise ValueError("TransferLoad needs at least one case")
+        self.pages = list(pages)
+        self.cases = list(cases)
+        self.transaction = transaction
+        self.mode = mode
+        self.rate = rate
+        self.duration = duration if duration is not None else Config.LOAD_DURATION
+        self.warmup = warmup if warmup is not None else Config.LOAD_WARMUP
+        self.interval = interval if interval is not None else Config.LOAD_INTERVAL
+        self.reset = reset
+        self.clock = clock
+        self.sleep = sleep
+        self.histogram = LatencyHistogram()
+        self.transactions = 0
+        self.errors = 0
+        self._intervals = {}
+        self._emitted = -1
+        self._started = self._measure_from = self._end = None
+        self._lock = threading.Lock()
+        self._case_index = itertools.count()
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def run(self):
+        """
+        Run the load until the warm-up and measured duration have elapsed.
+
+        Returns:
+            LoadReport: Totals, overall histogram and per-interval results
+        """
+        self._started = self.clock()
+        self._measure_from = self._started + self.warmup
+        self._end = self._measure_from + self.duration
+        workers = [
+            threading.Thread(target=self._work, args=(page, number), name=f"load-{number}", daemon=True)
+            for number, page in enumerate(self.pages)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        with self._lock:
+            self._emit_until(max(self._intervals, default=-1) + 1)
+        return self.report()
+
+    def report(self):
+        """
+        Build the report of everything measured so far.
+
+        Returns:
+            LoadReport: Totals, overall histogram and per-interval results
+        """
+        with self._lock:
+            intervals = [self._interval(index) for index in sorted(self._intervals)]
+            return LoadReport(
+                mode=self.mode,
+                sessions=len(self.pages),
+                seconds=self.duration,
+                transactions=self.transactions,
+                errors=self.errors,
+                error_rate=self.errors / self.transactions if self.transactions else 0.0,
+                throughput=self.transactions / self.duration if self.duration else 0.0,
+                histogram=self.histogram,
+                intervals=intervals,
+            )
+
+    def record(self, scheduled, finished, ok):
+        """
+        Count one measured transaction.
+
+        Args:
+            scheduled (float): Clock time the transaction was due to start
+            finished (float): Clock time it ended
+            ok (bool): Whether it succeeded
+        """
+        index = int((scheduled - self._measure_from) // self.interval)
+        with self._lock:
+            self.histogram.record_seconds(finished - scheduled)
+            self.transactions += 1
+            self.errors += 0 if ok else 1
+            histogram, counts = self._intervals.setdefault(index, (LatencyHistogram(), [0, 0]))
+            histogram.record_seconds(finished - scheduled)
+            counts[0] += 1
+            counts[1] += 0 if ok else 1
+            # Earlier intervals are streamed once a later one gets results;
+            # stragglers from a lagging session still count in the final report
+            self._emit_until(index)
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _work(self, page, number):
+        period = len(self.pages) / self.rate if self.mode == "fixed" else 0.0
+        scheduled = self._started + number * period / max(len(self.pages), 1)
+        while True:
+            now = self.clock()
+            if self.mode == "closed":
+                scheduled = now
+            if scheduled >= self._end:
+                return
+            if scheduled > now:
+                self.sleep(scheduled - now)
+            case = self.cases[next(self._case_index) % len(self.cases)]
+            try:
+                ok = bool(self.transaction(page, case))
+            except Exception as e:
+                self.logger.warning("Transaction failed on session %d: %s", number, e)
+                ok = False
+            finished = self.clock()
+            if self.reset is not None:
+                # A confirmed transfer leaves the form too, not only a failed one
+                try:
+                    self.reset(page)
+                except Exception as e:
+                    self.logger.error("Reset after transaction failed on session %d: %s", number, e)
+            if scheduled >= self._measure_from:
+                self.record(scheduled, finished, ok)
+            scheduled += period
+
+    def _interval(self, index):
+        histogram, (transactions, errors) = self._intervals[index]
+        return LoadInterval(
+            start=index * self.interval,
+            end=(index + 1) * self.interval,
+            transactions=transactions,
+            errors=errors,
+            throughput=transactions / self.interval,
+            p50=histogram.percentile(50),
+            p90=histogram.percentile(90),
+            p99=histogram.percentile(99),
+            max=histogram.max,
+        )
+
+    def _emit_until(self, index):
+        for done in range(self._emitted + 1, index):
+            if done in self._intervals:
+                EventBus.emit("load_interval", page=type(self).__name__,
+                              duration=self.interval, **self._interval(done)._asdict())
+            self._emitted = done
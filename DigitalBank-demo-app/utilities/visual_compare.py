@@ -0,0 +1,208 @@
+"""Screenshot comparison against golden images using vectorized NumPy diffs."""
+
+import io
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from config.config import Config
+from utilities.artifact_store import ArtifactStore
+from utilities.logger import Logger
+
+
+ComparisonResult = namedtuple(
+    "ComparisonResult",
+    ["matched", "diff_ratio", "changed_pixels", "compared_pixels", "diff_path"],
+)
+
+
+class VisualComparator:
+    """
+    Compare screenshots against stored golden images.
+
+    Frames are reduced to grayscale luminance, downscaled by an integer
+    factor and diffed in a single vectorized pass. Pixels whose luminance
+    moved by more than ``pixel_threshold`` count as changed; the comparison
+    fails when the changed share of unmasked pixels exceeds ``tolerance``.
+    Masks are ``(left, top, right, bottom)`` fractions of the frame so the
+    same mask works on every resolution.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    # Status bar with clock, battery and notification icons
+    STATUS_BAR_MASK = (0.0, 0.0, 1.0, 0.04)
+
+    def __init__(self, golden_dir=None, downscale=None, pixel_threshold=None,
+                 tolerance=None, masks=None):
+        """
+        Initialize the comparator.
+
+        Args:
+            golden_dir (str, optional): Directory holding golden PNG files
+            downscale (int, optional): Integer reduction factor (1 = full size)
+            pixel_threshold (int, optional): Luminance delta (0-255) a pixel
+                must exceed to count as changed
+            tolerance (float, optional): Allowed share of changed pixels
+            masks (list, optional): Regions to ignore; defaults to the
+                status bar
+        """
+        self.golden_dir = golden_dir or Config.GOLDEN_IMAGES_DIR
+        self.downscale = downscale or Config.VISUAL_DOWNSCALE
+        self.pixel_threshold = (
+            pixel_threshold if pixel_threshold is not None
+            else Config.VISUAL_PIXEL_THRESHOLD
+        )
+        self.tolerance = tolerance if tolerance is not None else Config.VISUAL_TOLERANCE
+        self.masks = self._regions(masks) if masks is not None else (self.STATUS_BAR_MASK,)
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def compare(self, screenshot, golden_name, masks=None):
+        """
+        Compare a screenshot with its golden image.
+
+        When the golden does not exist yet, or ``Config.UPDATE_GOLDENS`` is
+        set, the screenshot is stored as the new golden and reported as a
+        match.
+
+        Args:
+            screenshot: PNG file path (as returned by
+                ``MobileActions.take_screenshot``), PNG bytes, or an
+                already decoded luminance array
+            golden_name (str): Golden image name without extension
+            masks (list, optional): Extra regions to ignore for this call
+
+        Returns:
+            ComparisonResult: Outcome with diff statistics
+        """
+        golden_path = self.golden_path(golden_name)
+        if Config.UPDATE_GOLDENS or not os.path.exists(golden_path):
+            self._store_golden(screenshot, golden_path)
+            self.logger.info(f"Golden image stored: {golden_path}")
+            return ComparisonResult(True, 0.0, 0, 0, "")
+
+        golden = self._load_golden(
+            golden_path, os.path.getmtime(golden_path), self.downscale
+        )
+        actual = self._to_luminance(screenshot)
+        if actual.shape != golden.shape:
+            self.logger.error(
+                f"Size mismatch for '{golden_name}': "
+                f"{actual.shape} vs golden {golden.shape}"
+            )
+            return ComparisonResult(False, 1.0, actual.size, actual.size, "")
+
+        keep = self._mask(golden.shape, self.masks + self._regions(masks or ()))
+        changed = (np.abs(actual - golden) > self.pixel_threshold) & keep
+        changed_pixels = int(np.count_nonzero(changed))
+        compared_pixels = int(np.count_nonzero(keep))
+        diff_ratio = changed_pixels / compared_pixels if compared_pixels else 0.0
+        matched = diff_ratio <= self.tolerance
+
+        diff_path = "" if matched else self._save_diff(golden_name, changed)
+        log = self.logger.info if matched else self.logger.error
+        log(
+            f"Visual comparison '{golden_name}': {diff_ratio:.4%} changed "
+            f"(tolerance {self.tolerance:.4%})"
+        )
+        return ComparisonResult(
+            matched, diff_ratio, changed_pixels, compared_pixels, diff_path
+        )
+
+    def compare_many(self, pairs):
+        """
+        Compare a batch of screenshots.
+
+        Args:
+            pairs (iterable): (screenshot, golden_name) tuples
+
+        Returns:
+            list: ComparisonResult per pair, in input order
+        """
+        return [self.compare(screenshot, name) for screenshot, name in pairs]
+
+    def golden_path(self, golden_name):
+        """Return the file path of a golden image."""
+        return os.path.join(self.golden_dir, f"{golden_name}.png")
+
+    @staticmethod
+    def clear_cache():
+        """Drop all decoded goldens and masks held in memory."""
+        VisualComparator._load_golden.cache_clear()
+        VisualComparator._mask.cache_clear()
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _to_luminance(self, screenshot):
+        if isinstance(screenshot, np.ndarray):
+            return screenshot.astype(np.int16, copy=False)
+        if isinstance(screenshot, (bytes, bytearray)):
+            screenshot = io.BytesIO(screenshot)
+        return self._decode(screenshot, self.downscale)
+
+    @staticmethod
+    def _decode(source, downscale):
+        with Image.open(source) as image:
+            # "L" applies the ITU-R 601 luma transform in C
+            gray = image.convert("L")
+            if downscale > 1:
+                gray = gray.reduce(downscale)
+            return np.asarray(gray, dtype=np.int16)
+
+    @staticmethod
+    @lru_cache(maxsize=Config.VISUAL_GOLDEN_CACHE_SIZE)
+    def _load_golden(path, mtime, downscale):
+        # mtime is part of the key so a re-recorded golden is never served stale
+        golden = VisualComparator._decode(path, downscale)
+        golden.setflags(write=False)
+        return golden
+
+    @staticmethod
+    def _regions(masks):
+        # Masks may come as lists (e.g. from JSON); the cached _mask needs them hashable
+        return tuple(tuple(region) for region in masks)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _mask(shape, masks):
+        height, width = shape
+        keep = np.ones(shape, dtype=bool)
+        for left, top, right, bottom in masks:
+            keep[
+                int(top * height):int(np.ceil(bottom * height)),
+                int(left * width):int(np.ceil(right * width)),
+            ] = False
+        keep.setflags(write=False)
+        return keep
+
+    def _store_golden(self, screenshot, golden_path):
+        os.makedirs(self.golden_dir, exist_ok=True)
+        if isinstance(screenshot, np.ndarray):
+            # Arrays are already reduced; scale back up so loading reduces them to the same pixels
+            image = Image.fromarray(screenshot.astype(np.uint8))
+            if self.downscale > 1:
+                width, height = image.size
+                image = image.resize((width * self.downscale, height * self.downscale), Image.NEAREST)
+            image.save(golden_path)
+        elif isinstance(screenshot, (bytes, bytearray)):
+            with open(golden_path, "wb") as handle:
+                handle.write(screenshot)
+        else:
+            with open(screenshot, "rb") as source, open(golden_path, "wb") as target:
+                target.write(source.read())
+
+    def _save_diff(self, golden_name, changed):
+        try:
+            buffer = io.BytesIO()
+            Image.fromarray(changed.astype(np.uint8) * 255).save(buffer, format="PNG")
+            return ArtifactStore.shared().put_bytes(
+                buffer.getvalue(), f"diff_{golden_name}", kind="visual_diff",
+                extension=".png",
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save diff image: {str(e)}")
+            return ""
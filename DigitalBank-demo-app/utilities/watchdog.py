@@ -0,0 +1,154 @@
+"""Per-test time budgets that reclaim hung sessions."""
+
+import ctypes
+import threading
+import time
+import urllib.request
+
+from config.config import Config
+from utilities.cloud_governor import CloudGovernor
+from utilities.device_log import DeviceLogCollector
+from utilities.events import EventBus
+from utilities.failure_evidence import FailureEvidence
+from utilities.logger import Logger
+
+
+class WatchdogTimeout(BaseException):
+    """
+    Raised in a test that ran out of its time budget.
+
+    Derives from ``BaseException``, like pytest's own outcomes, so a broad
+    ``except Exception`` in page code cannot swallow it.
+    """
+
+    reason = "test exceeded its time budget"
+
+    def __str__(self):
+        return str(self.args[0]) if self.args else self.reason
+
+
+class Watchdog:
+    """
+    Enforce one time budget at a time on a thread.
+
+    A single daemon thread sleeps until the armed deadline. When it passes,
+    ``on_expire`` runs on the watchdog thread (evidence capture and session
+    reclaim for tests) and returns the failure reason. A
+    ``WatchdogTimeout`` carrying that reason is then raised
+    asynchronously in the watched thread, unless it was disarmed
+    meanwhile. An async exception is only delivered while the thread runs
+    Python code, so a thread blocked in a socket read gets it once the
+    read returns; deleting the session makes the server answer the
+    pending command promptly.
+    """
+
+    logger = Logger.get_logger(__name__)
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Initialize the watchdog.
+
+        Args:
+            clock (callable): Monotonic clock
+        """
+        self.clock = clock
+        self.expired = []
+        self._cond = threading.Condition()
+        self._armed = None  # (deadline, thread id, on_expire, budget)
+        self._thread = None
+
+    # ---------------- PUBLIC API ---------------- #
+
+    def arm(self, budget, on_expire, thread_id=None):
+        """
+        Start a budget for the current (or given) thread.
+
+        Args:
+            budget (float): Seconds
+            on_expire (callable): Called with no arguments on expiry;
+                returns the failure reason
+            thread_id (int, optional): Thread to interrupt
+        """
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, name="test-watchdog", daemon=True)
+                self._thread.start()
+            self._armed = (self.clock() + budget, thread_id or threading.get_ident(), on_expire, budget)
+            self._cond.notify()
+
+    def disarm(self):
+        """Cancel the running budget; a pending expiry no longer interrupts."""
+        with self._cond:
+            self._armed = None
+            self._cond.notify()
+
+    @staticmethod
+    def reclaim(driver, name, test_id=None, timeout=None):
+        """
+        Capture evidence from a hung session, force-delete it and free its slot.
+
+        The session is deleted with a direct HTTP request instead of the
+        driver, whose connection may be the one that hangs.
+
+        Args:
+            driver (webdriver.Remote): Hung session
+            name (str): Evidence bundle name
+            test_id (str, optional): Test owning the session
+            timeout (float, optional): Seconds for the delete request
+
+        Returns:
+            list: Reason fragments (evidence path, delete outcome)
+        """
+        notes = []
+        bundle = FailureEvidence(driver).capture(name, test_id=test_id)
+        if bundle:
+            notes.append(f"evidence: {bundle}")
+        timeout = timeout if timeout is not None else Config.WATCHDOG_DELETE_TIMEOUT
+        url = f"{_server_url(driver)}/session/{driver.session_id}"
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method="DELETE"), timeout=timeout):
+                pass
+            notes.append(f"session {driver.session_id} deleted")
+        except OSError as e:
+            notes.append(f"session delete failed: {e}")
+        DeviceLogCollector.stop_for(driver)
+        CloudGovernor.shared().release(driver)
+        return notes
+
+    # ---------------- INTERNALS ---------------- #
+
+    def _watch(self):
+        while True:
+            with self._cond:
+                while self._armed is None:
+                    self._cond.wait()
+                armed = self._armed
+                remaining = armed[0] - self.clock()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            self._expire(armed)
+
+    def _expire(self, armed):
+        _, thread_id, on_expire, budget = armed
+        try:
+            reason = on_expire()
+        except Exception as e:
+            self.logger.error("Watchdog reclaim failed: %s", e)
+            reason = f"exceeded its {budget:g}s budget (reclaim failed: {e})"
+        with self._cond:
+            if self._armed is not armed:
+                return  # finished while we reclaimed
+            self._armed = None
+            self.expired.append(reason)
+            timeout = type("WatchdogTimeout", (WatchdogTimeout,), {"reason": reason})
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), ctypes.py_object(timeout))
+        self.logger.error("Watchdog: %s", reason)
+        EventBus.emit("watchdog_timeout", page=type(self).__name__, duration=budget, outcome="timeout")
+
+
+def _server_url(driver):
+    executor = driver.command_executor
+    config = getattr(executor, "_client_config", None)
+    url = config.remote_server_addr if config is not None else getattr(executor, "_url", "")
+    return url.rstrip("/")